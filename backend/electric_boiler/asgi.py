@@ -3,6 +3,10 @@ ASGI config for electric_boiler project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Run it with an ASGI server (e.g. ``uvicorn electric_boiler.asgi:application``)
+to serve the long-lived catalog event stream at /boilers/events/; under WSGI
+that endpoint answers 503 and the frontend falls back to polling.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
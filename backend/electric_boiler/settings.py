@@ -43,6 +43,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",  # Управление сессиями
     "django.contrib.messages",  # Система сообщений
     "django.contrib.staticfiles",  # Управление статическими файлами
+    "django.contrib.postgres",  # Полнотекстовый поиск и pg_trgm (products.search)
     # Сторонние приложения
     "rest_framework",  # Django REST Framework для API
     "rest_framework_simplejwt",  # JWT токены для аутентификации
@@ -56,7 +57,9 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",  # Обработка CORS заголовков (должен быть первым)
+    "products.metrics.RequestMetricsMiddleware",  # Метрики запросов (время, запросы к БД, Server-Timing); выше сжатия - размер сжатого ответа
     "django.middleware.security.SecurityMiddleware",  # Безопасность (HTTPS, заголовки безопасности)
+    "products.compression.CompressionMiddleware",  # Сжатие ответов API (brotli, gzip)
     "django.contrib.sessions.middleware.SessionMiddleware",  # Управление сессиями
     "django.middleware.common.CommonMiddleware",  # Общие операции (нормализация URL)
     "django.middleware.csrf.CsrfViewMiddleware",  # Защита от CSRF атак
@@ -129,6 +132,104 @@ DATABASES = {
     }
 }
 
+# ==================== КЭШ ====================
+# Общий для всех процессов (сервер, парсер, management команды) кэш.
+# По умолчанию - на диске; для Redis: CACHE_BACKEND=django.core.cache.backends.redis.RedisCache,
+# CACHE_LOCATION=redis://127.0.0.1:6379/1.
+# Хранит версию каталога для ETag / Last-Modified (products.catalog_version)
+# и готовые JSON-ответы API каталога (products.response_cache)
+
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.filebased.FileBasedCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", str(BASE_DIR / "cache" / "django")),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("CACHE_MAX_ENTRIES", "2000"))},
+    }
+}
+
+# Время (секунды), через которое версия каталога пересчитывается по БД,
+# даже если ее не обновил парсер (например, после ручных изменений в БД)
+CATALOG_VERSION_TIMEOUT = int(os.getenv("CATALOG_VERSION_TIMEOUT", "300"))
+
+# Кэш готовых JSON-ответов API каталога:
+# LOCAL_MAX_ENTRIES - размер LRU в памяти процесса (0 - отключить),
+# SHARED_ALIAS - алиас CACHES для общего уровня (пусто - отключить),
+# TIMEOUT - время жизни записей общего уровня (секунды)
+RESPONSE_CACHE = {
+    "LOCAL_MAX_ENTRIES": int(os.getenv("RESPONSE_CACHE_LOCAL_MAX_ENTRIES", "512")),
+    "SHARED_ALIAS": os.getenv("RESPONSE_CACHE_SHARED_ALIAS", "default") or None,
+    "TIMEOUT": int(os.getenv("RESPONSE_CACHE_TIMEOUT", "3600")),
+}
+
+# Списки каталога (/boilers/, /boilers/search/, /manufacturers/) строятся
+# из values_list и кодируются orjson (если установлен) без сериализатора DRF
+CATALOG_FAST_JSON = os.getenv("CATALOG_FAST_JSON", "True").lower() in ("true", "1", "yes")
+
+# Метрики запросов к API (products.metrics): заголовок Server-Timing,
+# гистограммы по endpoint на /metrics/ (доступны сотрудникам и по заголовку
+# X-Metrics-Token со значением TOKEN; пустой TOKEN - только сотрудникам),
+# предупреждение в лог при числе запросов к БД больше QUERY_WARNING_THRESHOLD
+REQUEST_METRICS = {
+    "ENABLED": os.getenv("REQUEST_METRICS_ENABLED", "True").lower() in ("true", "1", "yes"),
+    "SERVER_TIMING": os.getenv("REQUEST_METRICS_SERVER_TIMING", "True").lower()
+    in ("true", "1", "yes"),
+    "QUERY_WARNING_THRESHOLD": int(os.getenv("REQUEST_METRICS_QUERY_WARNING_THRESHOLD", "20")),
+    "TOKEN": os.getenv("REQUEST_METRICS_TOKEN", ""),
+}
+
+# Размер порции строк, читаемых из БД при выгрузке /boilers/export/
+CATALOG_EXPORT_CHUNK_SIZE = int(os.getenv("CATALOG_EXPORT_CHUNK_SIZE", "2000"))
+
+# Сжатие ответов (products.compression): MIN_SIZE - минимальный размер
+# сжимаемого ответа (байт), CONTENT_TYPES - сжимаемые типы содержимого
+RESPONSE_COMPRESSION = {
+    "MIN_SIZE": int(os.getenv("RESPONSE_COMPRESSION_MIN_SIZE", "512")),
+    "GZIP_LEVEL": int(os.getenv("RESPONSE_COMPRESSION_GZIP_LEVEL", "6")),
+    "BROTLI_QUALITY": int(os.getenv("RESPONSE_COMPRESSION_BROTLI_QUALITY", "5")),
+    "CONTENT_TYPES": [
+        "application/json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/plain",
+    ],
+}
+
+# Сколько дней хранятся отметки об удалении котлов (/boilers/changes/);
+# клиенту с более старой меткой since возвращается полный список (reset)
+CHANGES_TOMBSTONE_RETENTION_DAYS = int(
+    os.getenv("CHANGES_TOMBSTONE_RETENTION_DAYS", "30")
+)
+
+# Отступ метки since назад от момента запроса (секунды): изменения, которые
+# зафиксированы позже своей метки updated_at не более чем на это время,
+# не теряются; клиенты получают их повторно и применяют по id
+CHANGES_SAFETY_OVERLAP_SECONDS = int(os.getenv("CHANGES_SAFETY_OVERLAP_SECONDS", "60"))
+
+# События изменения каталога (GET /boilers/events/, server-sent events):
+# CACHE_ALIAS - алиас CACHES, через который парсер передает события серверу
+# (нужен кэш с атомарным incr: Redis или Memcached, с FileBasedCache по
+# умолчанию события отключены, /boilers/events/ отвечает 503),
+# TTL - время хранения события (секунды), MAX_BACKLOG - сколько последних
+# событий получает переподключившийся клиент, POLL_INTERVAL - период проверки
+# новых событий (секунды), KEEPALIVE - период комментариев-пингов (секунды)
+CATALOG_EVENTS = {
+    "CACHE_ALIAS": os.getenv("CATALOG_EVENTS_CACHE_ALIAS", "default"),
+    "TTL": int(os.getenv("CATALOG_EVENTS_TTL", "300")),
+    "MAX_BACKLOG": int(os.getenv("CATALOG_EVENTS_MAX_BACKLOG", "50")),
+    "POLL_INTERVAL": float(os.getenv("CATALOG_EVENTS_POLL_INTERVAL", "0.5")),
+    "KEEPALIVE": int(os.getenv("CATALOG_EVENTS_KEEPALIVE", "15")),
+}
+
+# Статические JSON-снимки каталога (products.snapshots), записываются после
+# запуска парсера и изменений в админке: ROOT - каталог файлов (отдается
+# по /snapshots/ или веб-сервером), KEEP_VERSIONS - сколько версий хранить
+CATALOG_SNAPSHOTS = {
+    "ROOT": os.getenv("CATALOG_SNAPSHOTS_ROOT", str(BASE_DIR / "snapshots")),
+    "KEEP_VERSIONS": int(os.getenv("CATALOG_SNAPSHOTS_KEEP_VERSIONS", "2")),
+}
+
 
 # ==================== ВАЛИДАЦИЯ ПАРОЛЕЙ ====================
 # Правила для проверки надежности паролей пользователей
@@ -1,9 +1,10 @@
 # Стандартная библиотека
+import hashlib
 import logging
 import os
-import re
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.parse import urljoin, urlparse
@@ -12,6 +13,7 @@ from urllib.request import Request, urlopen
 # Django
 import django
 from django.db.utils import IntegrityError
+from django.utils import timezone
 
 # Сторонние библиотеки
 from bs4 import BeautifulSoup
@@ -23,17 +25,20 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
 
 # Получаем абсолютный путь к корню проекта
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 # Локальные импорты (после добавления project_root в sys.path)
+from parsers.checkpoint import CrawlCheckpoint
 from parsers.config import PARSER_CONFIG
+from parsers.fetchers import PageFetcher, create_fetcher
+from parsers.http_cache import PageCache
+from parsers.listing import DEFAULT_PRICE, extract_card_price, normalize_price
+from parsers.spec_parser import extract_spec_fields
 from parsers.utils import (
+    RateLimiter,
     measure_time,
     retry_on_failure,
     setup_logging,
@@ -46,7 +51,12 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "electric_boiler.settings")
 django.setup()
 
 # Импорт Django модели после django.setup() необходим для корректной работы ORM
-from products.models import ElectricBoiler  # noqa: E402  # ruff: noqa: E402
+from products.models import ElectricBoiler, Manufacturer  # noqa: E402  # ruff: noqa: E402
+from products.normalizers import NUMERIC_FIELDS, manufacturer_from_name  # noqa: E402
+from products.catalog_version import bump_catalog_version  # noqa: E402
+from products.events import publish_catalog_change  # noqa: E402
+from products.snapshots import publish_snapshots_on_commit  # noqa: E402
+from products.search import update_search_vectors  # noqa: E402
 
 
 # Настройка логирования
@@ -76,78 +86,8 @@ url = f"{base_url}{target_page}{filter_params}"
 # Марки котлов для парсинга используются напрямую из конфигурации
 # PARSER_CONFIG["TARGET_BRANDS"] - единственный источник истины
 
-# ============================================================================
-# Константы для регулярных выражений
-# ============================================================================
-
-# Паттерн для извлечения числовых значений (мощность, диапазоны)
-# Извлекает: целые числа, десятичные числа (с точкой или запятой),
-# диапазоны чисел (например: "6-12", "3.5-7.5")
-# Примеры совпадений: "6", "12.5", "3,5", "6-12", "3.5-7.5"
-REGEX_POWER_NUMERIC_VALUE = r"(\d+(?:[.,]\d+)?(?:\s*-\s*\d+(?:[.,]\d+)?)?)"
-
-# Паттерн для извлечения простого числового значения (без диапазона)
-# Используется для извлечения мощности из уже найденного значения
-# Примеры совпадений: "6", "12.5", "3,5"
-REGEX_SIMPLE_NUMERIC_VALUE = r"(\d+(?:[.,]\d+)?)"
-
-# Паттерн для удаления единиц измерения "кВт" из значений мощности
-# Удаляет "кВт", "квт", "КВт" и т.д. с любым количеством пробелов вокруг
-REGEX_REMOVE_KW_UNIT = r"\s*квт\s*"
-
-# Паттерн для удаления единиц измерения ГВС с числовым значением
-# Удаляет паттерны типа "12.5 л/мин", "10 л/мин" и т.д.
-# Поддерживает различные варианты написания: л/мин, л\/мин, l/min, l\/min
-REGEX_REMOVE_DHW_UNIT_WITH_NUMBER = (
-    r"\s*\d+(?:[.,]\d+)?\s*(?:л/мин|л\/мин|l/min|l\/min|л/мин\.?)\s*"
-)
-
-# Паттерн для удаления единиц измерения ГВС без числового значения
-# Удаляет просто "л/мин" без предшествующего числа
-REGEX_REMOVE_DHW_UNIT_SIMPLE = r"\s*(?:л/мин|л\/мин|l/min|l\/min|л/мин\.?)\s*"
-
-# Паттерн для поиска напряжения для котлов 6 и 9 кВт
-# Ищет текст типа: "котлы мощностью 6 кВт и 9 кВт ... могут работать ...
-# от сети ... с напряжением ~220 В и ~380 В"
-# Извлекает часть с напряжением (220 В и 380 В)
-REGEX_VOLTAGE_6_9_KW = (
-    r"котлы\s+мощностью\s+6\s+квт\s+и\s+9\s+квт"
-    r".*?(?:могут\s+работать|работать)"
-    r".*?(?:от\s+сети|сети)"
-    r".*?(?:с\s+напряжением|напряжением)\s*"
-    r"(~?\s*220\s*в\s+и\s+~?\s*380\s*в)"
-)
-
-# Паттерн для поиска напряжения для котлов 12+ кВт (обычный вариант)
-# Ищет текст типа: "модели ... начиная с 12 кВт ... могут работать ...
-# только от сети ... напряжением ~380 В"
-REGEX_VOLTAGE_12_PLUS_KW = (
-    r"модели.*?начиная\s+с\s+12\s+квт"
-    r".*?(?:могут\s+работать|работать)"
-    r".*?(?:только\s+от\s+сети|от\s+сети)"
-    r".*?(?:мощностью|напряжением)\s*"
-    r"(~?\s*380\s*в)"
-)
-
-# Паттерн для поиска напряжения для котлов 12+ кВт (вариант с "Важно")
-# Ищет текст типа: "важно ... модели ... начиная с 12 кВт ...
-# могут работать ... только от сети ... напряжением ~380 В"
-REGEX_VOLTAGE_12_PLUS_KW_IMPORTANT = (
-    r"важно.*?модели.*?начиная\s+с\s+12\s+квт"
-    r".*?(?:могут\s+работать|работать)"
-    r".*?(?:только\s+от\s+сети|от\s+сети)"
-    r".*?(?:мощностью|напряжением)\s*"
-    r"(~?\s*380\s*в)"
-)
-
-# Паттерн для удаления символа "~" (тильда) из текста напряжения
-REGEX_REMOVE_TILDE = r"~"
-
-# Паттерн для очистки цены от нецифровых символов
-# Оставляет только цифры, запятые, точки и пробелы
-# Используется для нормализации цен перед сохранением
-REGEX_PRICE_CLEANUP = r"[^\d,.\s]"
-
+# Общий ограничитель частоты запросов к сайту (разделяется всеми воркерами)
+request_limiter = RateLimiter(PARSER_CONFIG["MAX_REQUESTS_PER_SECOND"])
 
 @retry_on_failure(
     max_attempts=PARSER_CONFIG["RETRY_COUNT"],
@@ -198,6 +138,39 @@ def get_driver() -> Any:
         raise
 
 
+def build_page_cache() -> Optional[PageCache]:
+    """
+    Создание дискового кэша страниц по настройкам PARSER_CONFIG["HTTP_CACHE_*"].
+
+    Returns:
+        PageCache или None, если кэш отключен
+    """
+    if not PARSER_CONFIG.get("HTTP_CACHE_ENABLED"):
+        return None
+    return PageCache(PARSER_CONFIG["HTTP_CACHE_DIR"], ttl=PARSER_CONFIG["HTTP_CACHE_TTL"])
+
+
+def build_fetcher() -> PageFetcher:
+    """
+    Создание загрузчика страниц по настройке PARSER_CONFIG["FETCH_BACKEND"].
+
+    В режиме "auto" страницы загружаются обычными HTTP-запросами, а WebDriver
+    запускается только для страниц, в HTML которых нет ожидаемых маркеров.
+    HTTP-запросы проходят через дисковый кэш страниц (если он включен).
+
+    Returns:
+        Экземпляр PageFetcher, использующий общий request_limiter
+    """
+    return create_fetcher(
+        PARSER_CONFIG["FETCH_BACKEND"],
+        driver_factory=get_driver,
+        user_agent=PARSER_CONFIG["USER_AGENT"],
+        timeout=PARSER_CONFIG["PAGE_LOAD_TIMEOUT"],
+        limiter=request_limiter,
+        cache=build_page_cache(),
+    )
+
+
 def is_target_brand(name: str) -> bool:
     """
     Проверка, принадлежит ли товар одной из целевых марок.
@@ -353,7 +326,9 @@ def check_image_availability(url: str, timeout: Optional[int] = None) -> bool:
 
 
 def validate_and_filter_image_urls(
-    image_urls: List[str], base_url: Optional[str] = None
+    image_urls: List[str],
+    base_url: Optional[str] = None,
+    check_availability: Optional[bool] = None,
 ) -> List[str]:
     """
     Валидация и фильтрация URL изображений
@@ -361,6 +336,8 @@ def validate_and_filter_image_urls(
     Args:
         image_urls: Список URL изображений
         base_url: Базовый URL для преобразования относительных ссылок
+        check_availability: Проверять доступность изображений HEAD-запросом.
+            Если не указан, используется PARSER_CONFIG["CHECK_IMAGE_AVAILABILITY"]
 
     Returns:
         list: Список валидных URL изображений
@@ -368,6 +345,9 @@ def validate_and_filter_image_urls(
     if not PARSER_CONFIG.get("VALIDATE_IMAGE_URLS", True):
         return image_urls
 
+    if check_availability is None:
+        check_availability = PARSER_CONFIG.get("CHECK_IMAGE_AVAILABILITY", False)
+
     validated_urls = []
     invalid_count = 0
 
@@ -405,7 +385,7 @@ def validate_and_filter_image_urls(
             continue
 
         # Опциональная проверка доступности (может быть медленной)
-        if PARSER_CONFIG.get("CHECK_IMAGE_AVAILABILITY", False):
+        if check_availability:
             if not check_image_availability(url):
                 logger.debug(f"Изображение недоступно: {url}")
                 invalid_count += 1
@@ -995,566 +975,27 @@ def extract_specifications_flexible(
     return specs_text.strip()
 
 
-def normalize_spec_value(value: str) -> str:
-    """
-    Нормализация значения характеристики (удаление лишних пробелов, символов).
-
-    Удаляет лишние пробелы, двоеточия в конце и нормализует строку
-    для последующего использования в парсинге.
-
-    Args:
-        value: Исходное значение характеристики
-
-    Returns:
-        Нормализованное значение без лишних пробелов и символов
-
-    Example:
-        >>> normalize_spec_value("  6 кВт  :")
-        '6 кВт'
-        >>> normalize_spec_value("220  В")
-        '220 В'
-
-    Note:
-        Если value пустая строка или None, возвращается пустая строка.
-    """
-    if not value:
-        return ""
-    # Убираем лишние пробелы
-    value = " ".join(value.split())
-    # Убираем лишние двоеточия в конце
-    value = value.rstrip(":")
-    return value.strip()
-
-
-def extract_power(specs_text: str, product_name: str = "") -> Dict[str, str]:
-    """
-    Извлечение мощности из текста характеристик.
-
-    Извлекает значения мощности с приоритетом:
-    1. "Мощность до , кВт" — сохраняет значение как есть (напр. "от 3 до 18,1 (6 ступеней)")
-    2. "Максимальная тепловая мощность" (для целевых марок)
-    3. "Регулировка мощности" (для power_regulation и как запасной вариант)
-    4. Просто "Мощность" (если предыдущие не найдены)
-
-    Args:
-        specs_text: Текст характеристик в формате "Ключ: Значение"
-        product_name: Название товара для определения целевых марок.
-            Если товар не является целевой маркой, возвращается пустой словарь.
-
-    Returns:
-        Словарь с извлеченными значениями:
-        - power (str): Значение мощности в кВт
-        - power_regulation (str): Значение регулировки мощности (опционально)
-
-    Example:
-        >>> specs = "Максимальная тепловая мощность: 6-12 кВт"
-        >>> extract_power(specs, "Vaillant eloBLOCK")
-        {'power': '6-12'}
-
-    Note:
-        Работает только для целевых марок: vaillant, eloblock, protherm,
-        скат, teknix, espro, tecline. Для других марок возвращает пустой словарь.
-    """
-    result = {}
-
-    if not specs_text:
-        return result
-
-    # Приоритет 1: "Мощность до , кВт" — сохраняем значение как есть
-    # (например: "Мощность до , кВт : от 3 до 18,1 (6 ступеней)" → "от 3 до 18,1 (6 ступеней)")
-    for line in specs_text.split("\n"):
-        if ":" in line:
-            key = line.split(":")[0].strip().lower()
-            value = line.split(":", 1)[1].strip() if ":" in line else ""
-            if "мощность до" in key and "квт" in key and value:
-                result["power"] = value.strip()
-                return result
-
-    # Определяем марки, для которых нужно извлекать мощность из "Регулировка мощности"
-    target_brands_for_power_extraction = [
-        "vaillant",
-        "eloblock",
-        "protherm",
-        "скат",
-        "teknix",
-        "espro",
-        "tecline",
-    ]
-
-    is_target_brand = any(
-        brand in product_name.lower() for brand in target_brands_for_power_extraction
-    )
-
-    if is_target_brand:
-        # Ищем "Максимальная тепловая мощность" (приоритет)
-        # Затем ищем "Регулировка мощности" (если максимальная мощность не найдена)
-        max_power_found = False
-
-        for line in specs_text.split("\n"):
-            if ":" in line:
-                key = line.split(":")[0].strip().lower()
-                value = line.split(":", 1)[1].strip() if ":" in line else ""
-
-                # Проверяем "Максимальная тепловая мощность" (приоритет)
-                if (
-                    "максимальная тепловая мощность" in key
-                    and value
-                    and not max_power_found
-                ):
-                    value_clean = value.strip()
-
-                    # Извлекаем числовое значение (убираем "кВт" и другие единицы измерения)
-                    power_match = re.search(REGEX_POWER_NUMERIC_VALUE, value_clean)
-                    if power_match:
-                        power_value = power_match.group(1).strip()
-                        # Сохраняем только числовое значение без "кВт"
-                        result["power"] = power_value
-                        max_power_found = True
-                    else:
-                        # Если не нашли число, убираем "кВт" если есть
-                        power_value_clean = re.sub(
-                            REGEX_REMOVE_KW_UNIT, "", value_clean, flags=re.IGNORECASE
-                        ).strip()
-                        result["power"] = (
-                            power_value_clean if power_value_clean else value_clean
-                        )
-                        max_power_found = True
-                    # Не прерываем цикл, продолжаем искать
-                    # "Регулировка мощности" для power_regulation
-
-                # Проверяем "Регулировка мощности"
-                # (для power_regulation и как запасной вариант для power)
-                elif "регулировка мощности" in key and value:
-                    value_clean = value.strip()
-
-                    # Извлекаем числовое значение
-                    power_match = re.search(REGEX_POWER_NUMERIC_VALUE, value_clean)
-                    if power_match:
-                        power_value = power_match.group(1).strip()
-                        # Если максимальная мощность не найдена, используем регулировку для power
-                        if not max_power_found:
-                            result["power"] = power_value
-                        # Для power_regulation сохраняем числовое значение без "кВт"
-                        result["power_regulation"] = power_value
-                    else:
-                        # Если не нашли число, убираем "кВт" если есть
-                        power_value_clean = re.sub(
-                            REGEX_REMOVE_KW_UNIT, "", value_clean, flags=re.IGNORECASE
-                        ).strip()
-                        if not max_power_found:
-                            result["power"] = (
-                                power_value_clean if power_value_clean else value_clean
-                            )
-                        # Для power_regulation сохраняем без "кВт"
-                        result["power_regulation"] = (
-                            power_value_clean if power_value_clean else value_clean
-                        )
-
-                    # Если уже нашли максимальную мощность, можно прервать
-                    if max_power_found:
-                        break
-
-        # Если не нашли ни максимальную мощность, ни регулировку, ищем просто "Мощность"
-        if "power" not in result:
-            for line in specs_text.split("\n"):
-                if ":" in line:
-                    key = line.split(":")[0].strip().lower()
-                    value = line.split(":", 1)[1].strip() if ":" in line else ""
-
-                    # Ищем просто "Мощность" (без "максимальная" и "регулировка")
-                    if (
-                        "мощность" in key
-                        and "максимальная" not in key
-                        and "регулировка" not in key
-                        and value
-                    ):
-                        value_clean = value.strip()
-                        power_match = re.search(REGEX_POWER_NUMERIC_VALUE, value_clean)
-                        if power_match:
-                            power_value = power_match.group(1).strip()
-                            result["power"] = power_value
-                        else:
-                            power_value_clean = re.sub(
-                                REGEX_REMOVE_KW_UNIT,
-                                "",
-                                value_clean,
-                                flags=re.IGNORECASE,
-                            ).strip()
-                            result["power"] = (
-                                power_value_clean if power_value_clean else value_clean
-                            )
-                        break
-
-    return result
-
-
-def extract_voltage(specs_text: str) -> str:
-    """
-    Извлечение напряжения из текста характеристик.
-
-    Ищет строки с ключевыми словами "питание от сети" или "напряжение"
-    и извлекает значение напряжения.
-
-    Args:
-        specs_text: Текст характеристик в формате "Ключ: Значение"
-
-    Returns:
-        Извлеченное значение напряжения или пустая строка, если не найдено
-
-    Example:
-        >>> specs = "Питание от сети: 220 В"
-        >>> extract_voltage(specs)
-        '220 В'
-
-    Note:
-        Ищет ключевые слова: "питание от сети", "напряжение"
-    """
-    if not specs_text:
-        return ""
-
-    voltage_keywords = [
-        "питание от сети",
-        "напряжение",
-    ]
-
-    for line in specs_text.split("\n"):
-        if ":" not in line:
-            continue
-
-        key = line.split(":")[0].strip().lower()
-        value = line.split(":", 1)[1].strip() if ":" in line else ""
-
-        # Проверяем наличие ключевых слов напряжения
-        if any(keyword in key for keyword in voltage_keywords):
-            value_clean = normalize_spec_value(value)
-            if value_clean:
-                return value_clean
-
-    return ""
-
-
-def extract_water_heating(value: str, line: str) -> str:
-    """
-    Извлечение и обработка значения ГВС (нагрев воды).
-
-    Обрабатывает значения ГВС, удаляя единицы измерения (л/мин) и проверяя
-    наличие упоминаний о внешнем баке. Фильтрует пустые и невалидные значения.
-
-    Args:
-        value: Исходное значение характеристики ГВС
-        line: Полная строка для проверки контекста (используется для
-            поиска упоминаний о внешнем баке)
-
-    Returns:
-        Обработанное значение ГВС или пустая строка для пропуска невалидных значений
-
-    Example:
-        >>> extract_water_heating("12.5 л/мин", "ГВС: 12.5 л/мин")
-        '12.5'
-        >>> extract_water_heating("в выносном баке", "ГВС: в выносном баке")
-        'в выносном баке'
-        >>> extract_water_heating("Ø", "ГВС: Ø")
-        ''
-
-    Note:
-        Удаляет единицы измерения: л/мин, l/min
-        Проверяет наличие упоминаний о внешнем баке в значении и строке
-    """
-    if not value:
-        return ""
-
-    line_lower = line.lower()
-
-    # Проверяем наличие примечаний о внешнем баке
-    external_tank_indicators = [
-        "в выносном баке",
-        "внешний бак",
-        "выносной бак",
-        "external tank",
-        "внешнем баке",
-    ]
-
-    has_external_tank = any(
-        indicator in line_lower for indicator in external_tank_indicators
-    )
-
-    # Убираем единицы измерения (л/мин, л/мин, л/мин и т.д.)
-    # Паттерны для удаления единиц измерения и числовых значений с единицами
-    # Удаляем паттерны типа "12.5 л/мин", "10 л/мин", "л/мин" и т.д.
-    units_pattern = re.compile(REGEX_REMOVE_DHW_UNIT_WITH_NUMBER, re.IGNORECASE)
-    # Также удаляем просто "л/мин" без числа
-    simple_units_pattern = re.compile(REGEX_REMOVE_DHW_UNIT_SIMPLE, re.IGNORECASE)
-    value_clean = units_pattern.sub("", value)
-    value_clean = simple_units_pattern.sub("", value_clean).strip()
-    value_clean_lower = value_clean.lower()
-
-    # Проверяем наличие упоминания о внешнем баке в очищенном значении
-    has_external_tank_in_value = any(
-        indicator in value_clean_lower for indicator in external_tank_indicators
-    )
-
-    # Если есть упоминание о внешнем баке в очищенном значении или в исходной строке
-    if has_external_tank_in_value or has_external_tank:
-        # Оставляем только текст о внешнем баке, убирая единицы измерения
-        return "в выносном баке"
-    # Если значение "Ø" или пустое после очистки
-    elif value_clean.strip() in ["Ø", "", "-", "—", "нет", "no"]:
-        # Не сохраняем пустые значения
-        return ""
-    # Если значение не пустое и не "Ø" после очистки
-    elif value_clean.strip() not in ["Ø", "", "-", "—", "нет", "no"]:
-        return value_clean
-    # Иначе не сохраняем
-    else:
-        return ""
-
-
-def parse_specifications(specs_text: str, product_name: str = "") -> Dict[str, Any]:
-    """
-    Парсинг текста характеристик в словарь с нормализацией данных.
-
-    Извлекает технические характеристики из текста и преобразует их в словарь
-    с нормализованными ключами. Поддерживает специальную обработку для целевых
-    марок котлов (извлечение мощности из "Регулировка мощности").
-
-    Args:
-        specs_text: Текст характеристик в формате "Ключ: Значение"
-        product_name: Название товара для специальной обработки.
-            Используется для определения целевых марок.
-
-    Returns:
-        Словарь с распарсенными характеристиками. Ключи соответствуют полям
-        модели ElectricBoiler (power, voltage, water_heating и т.д.)
-
-    Example:
-        >>> specs = "Мощность: 6 кВт\\nНапряжение: 220 В"
-        >>> parse_specifications(specs)
-        {'power': '6', 'voltage': '220 В'}
-
-    Raises:
-        ValueError: Если specs_text содержит некорректные данные
-        (обрабатывается внутри функции, возвращается пустой словарь)
-
-    Note:
-        Для целевых марок (vaillant, protherm и др.) выполняется специальная
-        обработка мощности из поля "Регулировка мощности".
-    """
-    specs_dict = {}
-
-    if not specs_text:
-        return specs_dict
-
-    # Извлекаем мощность с помощью специализированной функции
-    power_data = extract_power(specs_text, product_name)
-    specs_dict.update(power_data)
-
-    # Определяем, является ли товар целевой маркой для специальной обработки мощности
-    target_brands_for_power_extraction = [
-        "vaillant",
-        "eloblock",
-        "protherm",
-        "скат",
-        "teknix",
-        "espro",
-        "tecline",
-    ]
-
-    is_target_brand = any(
-        brand in product_name.lower() for brand in target_brands_for_power_extraction
-    )
-
-    # Расширенный маппинг названий характеристик на поля модели
-    # Учитываем различные варианты написания
-    field_mapping = {
-        "Мощность до , кВт": "power",
-        "Максимальная тепловая мощность": "power",
-        "Максимальная мощность": "power",
-        "Мощность": "power",
-        "Мощность, кВт": "power",
-        "Мощность (кВт)": "power",
-        "Регулировка мощности": "power_regulation",
-        "Регулировка": "power_regulation",
-        "Площадь отопления": "heating_area",
-        "Площадь отопления, рекомендуемая до": "heating_area",
-        "Площадь отопления (м²)": "heating_area",
-        "Начальный вариант работы": "work_type",
-        "Режим работы": "work_type",
-        "Возможность для работы самостоятельно": "self_work",
-        "Автономная работа": "self_work",
-        "Возможность для нагрева воды": "water_heating",
-        "Нагрев воды": "water_heating",
-        "ГВС (вода)": "water_heating",
-        "ГВС": "water_heating",
-        "DHW (water)": "water_heating",
-        "DHW": "water_heating",
-        "Возможность нагрева теплого пола": "floor_heating",
-        "Теплый пол": "floor_heating",
-        "Расширительный бак": "expansion_tank",
-        "Объем расширительного бака": "expansion_tank",
-        "Expansion tank volume": "expansion_tank",
-        "Циркуляционный насос": "circulation_pump",
-        "Насос": "circulation_pump",
-        "Питание от сети": "voltage",
-        "Питание от сети, Вольт": "voltage",
-        "Напряжение": "voltage",
-        "Напряжение (В)": "voltage",
-        "Кабель подключения": "cable",
-        "Кабель": "cable",
-        "Предохранитель": "fuse",
-        "Предохранитель, А": "fuse",
-        "Предохранитель (А)": "fuse",
-        "Диапазон выбираемых температур": "temp_range",
-        "Диапазон температур": "temp_range",
-        "Температура радиаторного отопления": "temp_range_radiator",
-        "Температура теплого пола": "temp_range_floor",
-        "Подключение к системе": "connection",
-        "Подключение": "connection",
-        "Габаритные размеры": "dimensions",
-        "Размеры": "dimensions",
-        "Размеры (мм)": "dimensions",
-        "WiFi": "wifi",
-        "Возможность подключения WiFi": "wifi",
-        "Wi-Fi": "wifi",
-        "Возможность подключения комнатного термостата": "thermostat",
-        "Комнатный термостат": "thermostat",
-        "Комнатный термостат в комплекте": "thermostat_included",
-        "Термостат в комплекте": "thermostat_included",
-        "Возможно подключение датчика уличной температуры": "outdoor_sensor",
-        "Датчик уличной температуры": "outdoor_sensor",
-    }
-
-    # Парсим характеристики построчно
-    for line in specs_text.split("\n"):
-        if ":" not in line:
-            continue
-
-        # Разделяем на ключ и значение
-        parts = line.split(":", 1)
-        if len(parts) != 2:
-            continue
-
-        key = parts[0].strip()
-        value = parts[1].strip()
-
-        # Нормализуем значение
-        value = normalize_spec_value(value)
-
-        # Ищем соответствие в маппинге (проверяем точное совпадение и вхождение)
-        matched_field = None
-
-        # Специальная проверка для ГВС (приоритет)
-        key_lower = key.lower()
-        if "гвс" in key_lower or "dhw" in key_lower:
-            # Проверяем наличие упоминания воды или если это просто ГВС/DHW
-            if (
-                "вода" in key_lower
-                or "water" in key_lower
-                or key_lower.strip() in ["гвс", "dhw"]
-            ):
-                matched_field = "water_heating"
-
-        # Специальная проверка для объема расширительного бака (приоритет)
-        if not matched_field:
-            if (
-                "объем расширительного бака" in key_lower
-                or "expansion tank volume" in key_lower
-            ):
-                matched_field = "expansion_tank"
-
-        # Если специальные проверки не сработали, используем обычный маппинг
-        if not matched_field:
-            for spec_key, field_name in field_mapping.items():
-                # Проверяем точное совпадение ключа
-                if spec_key.lower() == key_lower:
-                    matched_field = field_name
-                    break
-                # Проверяем вхождение ключа
-                if spec_key.lower() in key_lower:
-                    matched_field = field_name
-                    break
-
-        if matched_field:
-            # Для целевых марок: если мощность уже извлечена из "Максимальная тепловая мощность"
-            # или "Регулировка мощности", не перезаписываем её обычным парсингом
-            if matched_field == "power" and is_target_brand and "power" in specs_dict:
-                # Пропускаем установку мощности, если она уже была извлечена специальной логикой
-                continue
-
-            # Для мощности убираем "кВт" из значения (кроме формата "от X до Y (Z ступеней)")
-            if matched_field == "power":
-                # Формат "Мощность до , кВт : от 3 до 18,1 (6 ступеней)" — сохраняем как есть
-                if re.match(r"от\s+\d+", value, re.IGNORECASE):
-                    specs_dict[matched_field] = value
-                else:
-                    # Убираем "кВт" и другие единицы измерения, оставляем только числовое значение
-                    power_value_clean = re.sub(
-                        REGEX_REMOVE_KW_UNIT, "", value, flags=re.IGNORECASE
-                    ).strip()
-                    specs_dict[matched_field] = (
-                        power_value_clean if power_value_clean else value
-                    )
-            # Для регулировки мощности также убираем "кВт" из значения
-            elif matched_field == "power_regulation":
-                # Убираем "кВт" и другие единицы измерения, оставляем только числовое значение
-                power_reg_value_clean = re.sub(
-                    REGEX_REMOVE_KW_UNIT, "", value, flags=re.IGNORECASE
-                ).strip()
-                specs_dict[matched_field] = (
-                    power_reg_value_clean if power_reg_value_clean else value
-                )
-            # Для температурных диапазонов нужно проверить контекст
-            elif matched_field == "temp_range":
-                # Если в ключе есть "радиатор", то это temp_range_radiator
-                if "радиатор" in key.lower():
-                    specs_dict["temp_range_radiator"] = value
-                    continue
-                # Если в ключе есть "пол" или "теплый", то это temp_range_floor
-                elif "пол" in key.lower() or "теплый" in key.lower():
-                    specs_dict["temp_range_floor"] = value
-                    continue
-                else:
-                    specs_dict[matched_field] = value
-            # Специальная обработка для ГВС (нагрев воды) с помощью специализированной функции
-            elif matched_field == "water_heating":
-                water_heating_value = extract_water_heating(value, line)
-                # Если функция вернула пустую строку, пропускаем это значение
-                if not water_heating_value:
-                    continue
-                specs_dict[matched_field] = water_heating_value
-            # Специальная обработка для объема расширительного бака
-            elif matched_field == "expansion_tank":
-                # Сохраняем значение с единицей измерения (если есть)
-                # Если единица уже в значении, оставляем как есть
-                if value and value.strip() not in ["Ø", "", "-", "—", "нет", "no"]:
-                    # Нормализуем значение, убирая лишние пробелы
-                    value_clean = " ".join(value.split())
-                    specs_dict[matched_field] = value_clean
-                elif value.strip() in ["Ø", "", "-", "—", "нет", "no"]:
-                    # Если значение пустое или "Ø", не сохраняем
-                    continue
-            else:
-                specs_dict[matched_field] = value
-
-    return specs_dict
-
-
 @retry_on_failure(
     max_attempts=PARSER_CONFIG["RETRY_COUNT"],
     delay=PARSER_CONFIG["RETRY_DELAY"],
     exceptions=(TimeoutException, Exception),
 )
 @measure_time
-def get_product_details(driver: Any, product_url: str) -> Dict[str, Any]:
+def get_product_details(
+    fetcher: PageFetcher, product_url: str, check_images: Optional[bool] = None
+) -> Dict[str, Any]:
     """
-    Получение дополнительной информации со страницы товара с использованием Selenium.
+    Получение дополнительной информации со страницы товара.
 
     Загружает страницу товара, извлекает описание, изображения, технические
     характеристики, страну производства и ссылку на документацию.
     Использует кэширование BeautifulSoup для оптимизации производительности.
 
     Args:
-        driver: Selenium WebDriver объект для навигации по страницам
+        fetcher: Загрузчик страниц (HTTP, Selenium или HTTP с резервным Selenium)
         product_url: URL страницы товара для парсинга
+        check_images: Проверять доступность изображений HEAD-запросом.
+            Если не указан, используется PARSER_CONFIG["CHECK_IMAGE_AVAILABILITY"]
 
     Returns:
         Словарь с данными товара, содержащий следующие ключи:
@@ -1565,8 +1006,8 @@ def get_product_details(driver: Any, product_url: str) -> Dict[str, Any]:
         - documentation (str): URL ссылки на документацию
 
     Example:
-        >>> driver = get_driver()
-        >>> details = get_product_details(driver, "https://example.com/product/123")
+        >>> fetcher = build_fetcher()
+        >>> details = get_product_details(fetcher, "https://example.com/product/123")
         >>> print(details["description"])
         'Описание товара...'
 
@@ -1575,29 +1016,26 @@ def get_product_details(driver: Any, product_url: str) -> Dict[str, Any]:
         NoSuchElementException: Если не найдены необходимые элементы на странице
         StaleElementReferenceException: Если элемент стал устаревшим
         WebDriverException: При ошибках WebDriver
-        Exception: При других неожиданных ошибках
+        Exception: При других неожиданных ошибках (например, FetchError)
 
     Note:
         Функция использует декораторы @retry_on_failure и @measure_time
         для автоматических повторов и измерения времени выполнения.
+        Ошибки загрузки пробрасываются после всех попыток, а не заменяются
+        пустыми данными: иначе в инкрементальном режиме пустые описание,
+        характеристики и изображения записались бы поверх сохраненных вместе
+        с новым отпечатком карточки, и товар больше не загружался бы.
+        Вызывающий код пропускает такой товар и считает его ошибкой.
     """
     try:
-        # Переход на страницу товара
-        driver.get(product_url)
-
-        # Ожидание загрузки страницы (ждем появления основного контента)
-        try:
-            WebDriverWait(driver, PARSER_CONFIG["PAGE_LOAD_TIMEOUT"]).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "product"))
-            )
-        except TimeoutException:
-            logger.warning(f"Таймаут при загрузке страницы товара: {product_url}")
-
-        # Задержка для rate limiting (избежание блокировки IP)
-        time.sleep(PARSER_CONFIG["PAGE_DELAY"])
-
-        # Получаем HTML страницы для парсинга BeautifulSoup
-        page_source = driver.page_source
+        # Загрузка страницы товара (ждем появления основного контента;
+        # при HTTP загрузке без галереи товара используется Selenium)
+        page_source = fetcher.fetch(
+            product_url,
+            wait_class="product",
+            markers=PARSER_CONFIG["PRODUCT_PAGE_MARKERS"],
+            wait_required=False,
+        )
         soup = BeautifulSoup(page_source, "lxml")
 
         # Создаем единый кэш для всех операций поиска на этой странице
@@ -1621,7 +1059,9 @@ def get_product_details(driver: Any, product_url: str) -> Dict[str, Any]:
         # Получаем базовый URL для преобразования относительных ссылок
         parsed_url = urlparse(product_url)
         base_url_str = f"{parsed_url.scheme}://{parsed_url.netloc}"
-        image_urls = validate_and_filter_image_urls(raw_image_urls, base_url_str)
+        image_urls = validate_and_filter_image_urls(
+            raw_image_urls, base_url_str, check_availability=check_images
+        )
 
         if len(image_urls) < len(raw_image_urls):
             logger.debug(
@@ -1668,158 +1108,20 @@ def get_product_details(driver: Any, product_url: str) -> Dict[str, Any]:
         }
     except TimeoutException as e:
         logger.error(f"Таймаут при запросе страницы товара {product_url}: {e}")
-        return {
-            "description": "",
-            "image_urls": [],
-            "specifications": "",
-            "country": "",
-            "documentation": "",
-        }
+        raise
     except (NoSuchElementException, StaleElementReferenceException) as e:
         logger.warning(f"Проблема с элементом на странице товара {product_url}: {e}")
-        return {
-            "description": "",
-            "image_urls": [],
-            "specifications": "",
-            "country": "",
-            "documentation": "",
-        }
+        raise
     except WebDriverException as e:
         logger.error(
             f"Ошибка WebDriver при парсинге страницы товара {product_url}: {e}"
         )
-        return {
-            "description": "",
-            "image_urls": [],
-            "specifications": "",
-            "country": "",
-            "documentation": "",
-        }
+        raise
     except Exception as e:
         logger.error(
             f"Неожиданная ошибка при парсинге страницы товара {product_url}: {e}"
         )
-        return {
-            "description": "",
-            "image_urls": [],
-            "specifications": "",
-            "country": "",
-            "documentation": "",
-        }
-
-
-def extract_voltage_from_description(
-    description: str, product_name: str, power_value: str
-) -> str:
-    """
-    Извлечение напряжения питания из описания товара на основе мощности.
-
-    Специализированная функция для котлов Vaillant eloBLOCK, которая извлекает
-    информацию о напряжении из описания на основе мощности котла.
-
-    Для котлов Vaillant eloBLOCK:
-    - Котлы мощностью 6 кВт и 9 кВт могут работать от сети с напряжением ~220В и ~380В
-    - Модели, начиная с 12 кВт, могут работать только от сети мощностью ~380 В
-
-    Args:
-        description: Описание товара для поиска информации о напряжении
-        product_name: Название товара для проверки марки
-        power_value: Значение мощности котла в кВт
-
-    Returns:
-        Текст с информацией о напряжении или пустая строка, если не найдено
-
-    Example:
-        >>> desc = "Котлы мощностью 6 кВт и 9 кВт могут работать от сети с напряжением ~220В и ~380В"
-        >>> extract_voltage_from_description(desc, "Vaillant eloBLOCK VE 6", "6")
-        '220 В и 380 В'
-
-    Note:
-        Работает только для товаров марки Vaillant eloBLOCK.
-        Использует регулярные выражения для поиска паттернов напряжения.
-    """
-    if not description or not product_name:
-        return ""
-
-    # Проверяем, является ли это котлом Vaillant eloBLOCK
-    name_lower = product_name.lower()
-    if "vaillant" not in name_lower or "eloblock" not in name_lower:
-        return ""
-
-    description_lower = description.lower()
-
-    # Определяем мощность котла
-    power_num = None
-    if power_value:
-        try:
-            # Извлекаем числовое значение мощности
-            power_match = re.search(REGEX_SIMPLE_NUMERIC_VALUE, str(power_value))
-            if power_match:
-                power_num = float(power_match.group(1).replace(",", "."))
-        except (ValueError, AttributeError):
-            pass
-
-    # Паттерны для поиска информации о напряжении в описании
-    # Паттерн 1: "Котлы мощностью 6 кВт и 9 кВт могут работать от сети с напряжением ~220В и ~380В"
-    pattern_6_9 = re.compile(REGEX_VOLTAGE_6_9_KW, re.IGNORECASE | re.DOTALL)
-
-    # Паттерн 2: "Модели, начиная с 12 кВт, могут работать только от сети мощностью ~380 В"
-    pattern_12_plus = re.compile(REGEX_VOLTAGE_12_PLUS_KW, re.IGNORECASE | re.DOTALL)
-
-    # Паттерн 3: "Важно!!! Модели, начиная с 12 кВт,
-    # могут работать только от сети мощностью ~380 В"
-    pattern_important = re.compile(
-        REGEX_VOLTAGE_12_PLUS_KW_IMPORTANT, re.IGNORECASE | re.DOTALL
-    )
-
-    # Ищем информацию о напряжении в описании
-    # Сначала проверяем паттерн для 6 и 9 кВт
-    match_6_9 = pattern_6_9.search(description_lower)
-    if match_6_9:
-        voltage_text = match_6_9.group(1)
-        if voltage_text:
-            # Нормализуем текст напряжения (убираем ~ и лишние пробелы)
-            voltage_text = re.sub(REGEX_REMOVE_TILDE, "", voltage_text)
-            voltage_text = " ".join(voltage_text.split())
-            # Если мощность соответствует, возвращаем найденное значение
-            if power_num is None or power_num == 6 or power_num == 9:
-                return voltage_text
-
-    # Проверяем паттерн для 12 кВт и выше
-    match_12_plus = pattern_12_plus.search(
-        description_lower
-    ) or pattern_important.search(description_lower)
-    if match_12_plus:
-        voltage_text = match_12_plus.group(1)
-        if voltage_text:
-            # Нормализуем текст напряжения
-            voltage_text = re.sub(REGEX_REMOVE_TILDE, "", voltage_text)
-            voltage_text = " ".join(voltage_text.split())
-            # Если мощность соответствует, возвращаем найденное значение
-            if power_num is None or power_num >= 12:
-                return voltage_text
-
-    # Если не нашли точные паттерны, определяем на основе мощности и наличия упоминаний
-    if power_num is not None:
-        # Для мощности 6 кВт или 9 кВт
-        if power_num == 6 or power_num == 9:
-            # Проверяем, есть ли в описании упоминание о 220В и 380В
-            if "220" in description_lower and "380" in description_lower:
-                # Проверяем контекст - должны быть упоминания о мощности 6 или 9 кВт
-                if (
-                    "6" in description_lower or "9" in description_lower
-                ) and "квт" in description_lower:
-                    return "220В и 380В"
-
-        # Для мощности 12 кВт и выше
-        elif power_num >= 12:
-            # Проверяем, есть ли в описании упоминание о 380В и "только"
-            if "380" in description_lower and (
-                "только" in description_lower or "начиная с 12" in description_lower
-            ):
-                return "380В"
-
-    return ""
+        raise
 
 
 def get_default_country_by_brand(name: str) -> str:
@@ -1871,30 +1173,29 @@ def get_default_country_by_brand(name: str) -> str:
     delay=PARSER_CONFIG["RETRY_DELAY"],
     exceptions=(TimeoutException, NoSuchElementException),
 )
-def get_all_pages_urls(driver: Any, base_url: str) -> List[str]:
+def get_all_pages_urls(fetcher: PageFetcher, base_url: str) -> List[str]:
     """
     Получение всех URL страниц пагинации каталога.
 
-    Находит все ссылки на страницы пагинации, переходя по кнопке "Следующая"
+    Находит все ссылки на страницы пагинации, переходя по ссылке "Следующая"
     или извлекая прямые ссылки на страницы. Поддерживает ограничение
     максимального количества проверяемых страниц.
 
     Args:
-        driver: Selenium WebDriver объект для навигации по страницам
+        fetcher: Загрузчик страниц (HTTP, Selenium или HTTP с резервным Selenium)
         base_url: URL первой страницы каталога
 
     Returns:
         Список URL всех страниц каталога. Всегда включает base_url как первый элемент
 
     Example:
-        >>> driver = get_driver()
-        >>> urls = get_all_pages_urls(driver, "https://example.com/catalog")
+        >>> fetcher = build_fetcher()
+        >>> urls = get_all_pages_urls(fetcher, "https://example.com/catalog")
         >>> print(f"Найдено страниц: {len(urls)}")
 
     Raises:
         TimeoutException: Если страница не загрузилась в течение таймаута
         NoSuchElementException: Если не найдены элементы пагинации
-        StaleElementReferenceException: Если элементы стали устаревшими
         WebDriverException: При ошибках WebDriver
         Exception: При других неожиданных ошибках
 
@@ -1907,15 +1208,15 @@ def get_all_pages_urls(driver: Any, base_url: str) -> List[str]:
     logger.info(f"Начинаем сбор URL страниц пагинации с: {base_url}")
 
     try:
-        # Переходим на первую страницу с retry
-        if not navigate_to_page(driver, base_url):
+        # Загружаем первую страницу с retry
+        page_source = navigate_to_page(fetcher, base_url)
+        if page_source is None:
             logger.warning(
                 "Не удалось загрузить первую страницу для определения пагинации"
             )
             return page_urls
 
-        # Получаем HTML для парсинга пагинации
-        page_source = driver.page_source
+        # Парсим HTML для поиска пагинации
         soup = BeautifulSoup(page_source, "lxml")
 
         # Ищем элементы пагинации (различные варианты)
@@ -1965,51 +1266,39 @@ def get_all_pages_urls(driver: Any, base_url: str) -> List[str]:
                         found_urls.add(full_url)
                         page_urls.append(full_url)
 
-        # Альтернативный метод: ищем кнопку "Следующая" и переходим по ней
-        # Это более надежный способ для динамических сайтов
+        # Альтернативный метод: ищем ссылку "Следующая" и переходим по ней
+        # Это позволяет найти страницы, не показанные в блоке пагинации
         try:
             max_pages_to_check = PARSER_CONFIG["MAX_PAGES_TO_CHECK"]
             pages_checked = 1
 
+            # Ищем ссылку "Следующая" или ссылку на следующую страницу
+            next_selectors = [
+                "a.next.page-numbers",
+                "a.next",
+                'a[aria-label="Next"]',
+                "a.page-numbers.next",
+                'a[rel="next"]',
+            ]
+
             while pages_checked < max_pages_to_check:
-                # Ищем кнопку "Следующая" или ссылку на следующую страницу
-                next_selectors = [
-                    "a.next.page-numbers",
-                    "a.next",
-                    'a[aria-label="Next"]',
-                    "a.page-numbers.next",
-                    'a[rel="next"]',
-                ]
-
-                next_button = None
+                next_link = None
                 for selector in next_selectors:
-                    try:
-                        next_button = driver.find_element(By.CSS_SELECTOR, selector)
-                        # Проверяем, что кнопка активна (не disabled)
-                        if next_button and next_button.is_enabled():
-                            # Проверяем классы на наличие disabled
-                            classes = next_button.get_attribute("class") or ""
-                            if "disabled" not in classes.lower():
-                                break
-                            else:
-                                next_button = None
-                    except NoSuchElementException:
+                    candidate = soup.select_one(selector)
+                    if candidate is None or not candidate.get("href"):
                         continue
+                    # Проверяем классы на наличие disabled
+                    classes = " ".join(candidate.get("class", []))
+                    if "disabled" not in classes.lower():
+                        next_link = candidate
+                        break
 
-                if not next_button:
-                    logger.debug("Кнопка 'Следующая' не найдена или неактивна")
-                    break
-
-                # Получаем URL следующей страницы
-                next_url = next_button.get_attribute("href")
-                if not next_url:
+                if not next_link:
+                    logger.debug("Ссылка 'Следующая' не найдена или неактивна")
                     break
 
-                # Преобразуем в абсолютный URL
-                if next_url.startswith("/"):
-                    next_url = urljoin(base_url, next_url)
-                elif not next_url.startswith("http"):
-                    next_url = urljoin(base_url, next_url)
+                # Получаем абсолютный URL следующей страницы
+                next_url = urljoin(base_url, next_link["href"])
 
                 # Проверяем, что это новая страница
                 if next_url in found_urls:
@@ -2021,36 +1310,16 @@ def get_all_pages_urls(driver: Any, base_url: str) -> List[str]:
                 page_urls.append(next_url)
                 logger.debug(f"Найдена страница {pages_checked + 1}: {next_url}")
 
-                # Переходим на следующую страницу
-                try:
-                    next_button.click()
-                    pages_checked += 1
-
-                    # Небольшая задержка для загрузки страницы
-                    time.sleep(PARSER_CONFIG["PAGINATION_DELAY"])
-
-                    # Ожидание загрузки новой страницы с retry
-                    if not navigate_to_page(driver, next_url):
-                        logger.warning(
-                            f"Не удалось загрузить страницу {pages_checked}: {next_url}"
-                        )
-                        break
-                except StaleElementReferenceException as e:
+                # Загружаем следующую страницу с retry
+                page_source = navigate_to_page(fetcher, next_url)
+                pages_checked += 1
+                if page_source is None:
                     logger.warning(
-                        f"Элемент стал устаревшим при переходе на следующую страницу: {e}"
-                    )
-                    break
-                except TimeoutException as e:
-                    logger.warning(f"Таймаут при переходе на следующую страницу: {e}")
-                    break
-                except Exception as e:
-                    logger.warning(
-                        f"Неожиданная ошибка при переходе на следующую страницу: {e}"
+                        f"Не удалось загрузить страницу {pages_checked}: {next_url}"
                     )
                     break
+                soup = BeautifulSoup(page_source, "lxml")
 
-        except (NoSuchElementException, StaleElementReferenceException) as e:
-            logger.debug(f"Элемент пагинации не найден или устарел: {e}")
         except TimeoutException as e:
             logger.warning(f"Таймаут при обработке пагинации: {e}")
         except WebDriverException as e:
@@ -2087,24 +1356,24 @@ def get_all_pages_urls(driver: Any, base_url: str) -> List[str]:
     delay=PARSER_CONFIG["RETRY_DELAY"],
     exceptions=(TimeoutException, Exception),
 )
-def navigate_to_page(driver: Any, page_url: str) -> bool:
+def navigate_to_page(fetcher: PageFetcher, page_url: str) -> Optional[str]:
     """
-    Переход на страницу с обработкой ошибок и retry.
+    Загрузка страницы каталога с обработкой ошибок и retry.
 
-    Выполняет переход на указанную страницу и ожидает загрузки основного
-    контента (элемент с классом "products").
+    Загружает указанную страницу и при загрузке через браузер ожидает
+    появления основного контента (элемент с классом "products").
 
     Args:
-        driver: Selenium WebDriver объект для навигации
+        fetcher: Загрузчик страниц (HTTP, Selenium или HTTP с резервным Selenium)
         page_url: URL страницы для перехода
 
     Returns:
-        True если переход и загрузка страницы успешны, False в противном случае
+        HTML страницы при успешной загрузке, None в противном случае
 
     Example:
-        >>> driver = get_driver()
-        >>> success = navigate_to_page(driver, "https://example.com/page1")
-        >>> if success:
+        >>> fetcher = build_fetcher()
+        >>> page_source = navigate_to_page(fetcher, "https://example.com/page1")
+        >>> if page_source:
         ...     print("Страница загружена")
 
     Raises:
@@ -2117,217 +1386,485 @@ def navigate_to_page(driver: Any, page_url: str) -> bool:
     Note:
         Функция использует декоратор @retry_on_failure для автоматических повторов.
         Таймаут ожидания загрузки определяется PARSER_CONFIG["PAGE_LOAD_TIMEOUT"].
+        Частота запросов ограничивается общим request_limiter внутри загрузчика.
     """
     try:
-        driver.get(page_url)
-        # Ожидание загрузки страницы
-        WebDriverWait(driver, PARSER_CONFIG["PAGE_LOAD_TIMEOUT"]).until(
-            EC.presence_of_element_located((By.CLASS_NAME, "products"))
+        return fetcher.fetch(
+            page_url,
+            wait_class="products",
+            markers=PARSER_CONFIG["CATALOG_PAGE_MARKERS"],
         )
-        # Задержка для rate limiting (избежание блокировки IP)
-        time.sleep(PARSER_CONFIG["PAGE_DELAY"])
-        return True
     except TimeoutException:
         logger.warning(f"Таймаут при загрузке страницы: {page_url}")
-        return False
+        return None
     except (NoSuchElementException, StaleElementReferenceException) as e:
         logger.warning(f"Проблема с элементом при загрузке страницы {page_url}: {e}")
-        return False
+        return None
     except WebDriverException as e:
         logger.error(f"Ошибка WebDriver при переходе на страницу {page_url}: {e}")
-        return False
+        return None
     except Exception as e:
         logger.error(f"Неожиданная ошибка при переходе на страницу {page_url}: {e}")
-        return False
+        return None
 
 
-def parse_products_from_page(
-    driver: Any, page_url: str, existing_names: Optional[Set[str]] = None
-) -> Tuple[List[Dict[str, Any]], int, int]:
+class DetailWorkerPool:
     """
-    Парсинг товаров с одной страницы каталога.
-
-    Извлекает список товаров со страницы каталога, фильтрует по целевым маркам,
-    получает детальную информацию для каждого товара и валидирует данные.
-
-    Args:
-        driver: Selenium WebDriver объект для навигации по страницам
-        page_url: URL страницы каталога для парсинга
-        existing_names: Множество названий существующих товаров в БД.
-            Товары с названиями из этого множества пропускаются.
+    Пул воркеров для параллельной загрузки страниц товаров.
 
-    Returns:
-        Кортеж из трех элементов:
-        - products_data (list): Список словарей с данными товаров
-        - error_count (int): Количество ошибок при парсинге
-        - skipped_count (int): Количество пропущенных товаров (не целевые марки)
+    Каждый поток пула лениво создает собственный загрузчик страниц через
+    fetcher_factory (WebDriver не потокобезопасен). Частота запросов к сайту
+    ограничивается общим request_limiter, поэтому увеличение числа воркеров
+    сокращает время ожидания загрузки страниц, но не повышает нагрузку на сайт
+    сверх PARSER_CONFIG["MAX_REQUESTS_PER_SECOND"].
 
     Example:
-        >>> driver = get_driver()
-        >>> existing = {"Товар 1", "Товар 2"}
-        >>> products, errors, skipped = parse_products_from_page(driver, "https://example.com/page1", existing)
-        >>> print(f"Найдено товаров: {len(products)}")
-
-    Raises:
-        TimeoutException: Если страница не загрузилась в течение таймаута
-        NoSuchElementException: Если не найдены элементы товаров на странице
-        StaleElementReferenceException: Если элементы стали устаревшими
-        WebDriverException: При ошибках WebDriver
-        Exception: При других неожиданных ошибках
-
-    Note:
-        Товары фильтруются по целевым маркам из PARSER_CONFIG["TARGET_BRANDS"].
-        Для каждого товара вызывается get_product_details() для получения
-        детальной информации.
+        >>> with DetailWorkerPool(4) as pool:
+        ...     details = pool.fetch_details(["https://example.com/p/1"])
     """
-    if existing_names is None:
-        existing_names = set()
 
-    products_data = []
+    def __init__(self, size: int, fetcher_factory: Any = None) -> None:
+        """
+        Args:
+            size: Количество воркеров
+            fetcher_factory: Функция создания загрузчика страниц
+                (по умолчанию build_fetcher)
+        """
+        self.size = max(1, size)
+        self._fetcher_factory = fetcher_factory or build_fetcher
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.size, thread_name_prefix="detail-worker"
+        )
+        self._local = threading.local()
+        self._fetchers: List[PageFetcher] = []
+        self._lock = threading.Lock()
+
+    def _get_fetcher(self) -> PageFetcher:
+        """Возвращает загрузчик текущего потока, создавая его при первом вызове"""
+        fetcher = getattr(self._local, "fetcher", None)
+        if fetcher is None:
+            fetcher = self._fetcher_factory()
+            self._local.fetcher = fetcher
+            with self._lock:
+                self._fetchers.append(fetcher)
+        return fetcher
+
+    def _fetch(
+        self, product_url: str, check_images: Optional[bool] = None
+    ) -> Dict[str, Any]:
+        return get_product_details(self._get_fetcher(), product_url, check_images)
+
+    def submit(self, product_url: str, check_images: Optional[bool] = None) -> Any:
+        """
+        Постановка загрузки деталей одного товара в очередь пула.
+
+        Args:
+            product_url: URL страницы товара
+            check_images: Проверять доступность изображений (см. get_product_details)
+
+        Returns:
+            concurrent.futures.Future с результатом get_product_details()
+        """
+        return self._executor.submit(self._fetch, product_url, check_images)
+
+    def submit_with_fetcher(self, func: Any, *args: Any) -> Any:
+        """
+        Выполнение func(fetcher, *args) в потоке пула с загрузчиком этого потока.
+
+        Используется для загрузки страниц каталога тем же пулом загрузчиков.
+
+        Returns:
+            concurrent.futures.Future с результатом func
+        """
+        return self._executor.submit(
+            lambda: func(self._get_fetcher(), *args)
+        )
+
+    def fetch_details(self, product_urls: List[str]) -> Dict[str, Any]:
+        """
+        Параллельная загрузка деталей товаров.
+
+        Args:
+            product_urls: Список URL страниц товаров
+
+        Returns:
+            Словарь {product_url: детали товара или исключение}. Исключения
+            не пробрасываются, чтобы ошибка одного товара не прерывала страницу.
+        """
+        futures = {
+            product_url: self._executor.submit(self._fetch, product_url)
+            for product_url in product_urls
+        }
+        results: Dict[str, Any] = {}
+        for product_url, future in futures.items():
+            try:
+                results[product_url] = future.result()
+            except Exception as e:
+                results[product_url] = e
+        return results
+
+    def close(self) -> None:
+        """Остановка пула и закрытие загрузчиков всех воркеров"""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            fetchers, self._fetchers = self._fetchers, []
+        for fetcher in fetchers:
+            try:
+                fetcher.close()
+            except Exception as e:
+                logger.warning(f"Ошибка при закрытии загрузчика воркера: {e}")
+        if fetchers:
+            logger.info(f"Закрыто загрузчиков воркеров: {len(fetchers)}")
+
+    def __enter__(self) -> "DetailWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def compute_listing_fingerprint(name: str, price: str, image_url: str) -> str:
+    """
+    Отпечаток карточки товара в каталоге.
+
+    Изменение названия, цены или главного изображения в карточке означает,
+    что страницу товара нужно загрузить заново.
+
+    Args:
+        name: Название товара
+        price: Цена из карточки (как на странице)
+        image_url: URL изображения из карточки (может быть пустым)
+
+    Returns:
+        sha256 в шестнадцатеричном виде (64 символа)
+    """
+    payload = "\x1f".join(
+        " ".join(part.split()) for part in (name, price, image_url)
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def extract_product_cards(
+    soup: BeautifulSoup,
+    page_url: str,
+    existing_names: Set[str],
+    existing_fingerprints: Optional[Dict[str, str]] = None,
+) -> Tuple[List[Tuple[str, str, str, str, str]], int, int, int]:
+    """
+    Извлечение карточек целевых товаров из HTML страницы каталога.
+
+    Args:
+        soup: BeautifulSoup объект страницы каталога
+        page_url: URL страницы каталога (для преобразования относительных ссылок)
+        existing_names: Множество названий существующих товаров в БД.
+            Товары с названиями из этого множества пропускаются.
+        existing_fingerprints: Словарь {название: отпечаток карточки} для
+            инкрементального режима. Если передан, существующий товар
+            пропускается, только если отпечаток его карточки не изменился.
+
+    Returns:
+        Кортеж из четырех элементов:
+        - candidates (list): Список кортежей
+          (name, price, product_url, fingerprint, card_html)
+        - error_count (int): Количество ошибок при разборе карточек
+        - skipped_count (int): Количество пропущенных товаров (не целевые марки)
+        - skipped_existing_count (int): Количество пропущенных товаров, уже
+          существующих в БД (в инкрементальном режиме - без изменений)
+    """
+    candidates = []
     error_count = 0
     skipped_count = 0
     skipped_existing_count = 0
 
-    try:
-        # Переход на страницу каталога с retry
-        if not navigate_to_page(driver, page_url):
-            logger.error(f"Не удалось загрузить страницу: {page_url}")
-            return products_data, error_count, skipped_count
+    # Находим все элементы товаров
+    products = soup.find_all("li", class_="product-type-simple")
 
-        # Получаем HTML страницы для парсинга BeautifulSoup
-        page_source = driver.page_source
-        soup = BeautifulSoup(page_source, "lxml")
+    # Если не нашли с классом product-type-simple, пробуем другие варианты
+    if not products:
+        products = soup.find_all("li", class_=lambda x: x and "product" in x.lower())
 
-        # Находим все элементы товаров
-        products = soup.find_all("li", class_="product-type-simple")
+    if not products:
+        logger.warning(f"Товары не найдены на странице: {page_url}")
+        return candidates, error_count, skipped_count, skipped_existing_count
 
-        # Если не нашли с классом product-type-simple, пробуем другие варианты
-        if not products:
-            products = soup.find_all(
-                "li", class_=lambda x: x and "product" in x.lower()
-            )
+    logger.info(f"Найдено товаров на странице {page_url}: {len(products)}")
 
-        if not products:
-            logger.warning(f"Товары не найдены на странице: {page_url}")
-            return products_data, error_count, skipped_count
+    for product in products:
+        try:
+            # Извлекаем название товара
+            name_element = product.find(
+                "h2", class_="woocommerce-loop-product__title"
+            ) or product.find("h2", class_=lambda x: x and "title" in x.lower())
 
-        logger.info(f"Найдено товаров на странице {page_url}: {len(products)}")
+            if not name_element:
+                continue
 
-        for product in products:
-            try:
-                # Извлекаем название товара
-                name_element = product.find(
-                    "h2", class_="woocommerce-loop-product__title"
-                ) or product.find("h2", class_=lambda x: x and "title" in x.lower())
+            name = name_element.text.strip()
 
-                if not name_element:
-                    continue
+            # Проверяем, принадлежит ли товар одной из целевых марок
+            if not is_target_brand(name):
+                skipped_count += 1
+                continue
 
-                name = name_element.text.strip()
+            # Извлекаем цену
+            price = extract_card_price(product)
+            if price is None:
+                logger.warning(
+                    f"Цена не найдена для товара: {name}, "
+                    "устанавливаем значение по умолчанию"
+                )
+                price = DEFAULT_PRICE
 
-                # Проверяем, принадлежит ли товар одной из целевых марок
-                if not is_target_brand(name):
-                    skipped_count += 1
-                    continue
+            # Извлекаем ссылку на товар
+            link_element = product.find("a")
+            if not link_element or "href" not in link_element.attrs:
+                logger.warning(f"Ссылка не найдена для товара: {name}")
+                continue
 
-                # Проверяем существование товара в БД перед парсингом
-                # Это позволяет избежать дорогих HTTP-запросов для уже существующих товаров
-                if name in existing_names:
+            product_url = urljoin(page_url, link_element["href"])
+
+            image_element = product.find("img")
+            image_url = ""
+            if image_element:
+                image_url = (
+                    image_element.get("data-src") or image_element.get("src") or ""
+                )
+            fingerprint = compute_listing_fingerprint(name, price, image_url)
+
+            # Проверяем существование товара в БД перед парсингом
+            # Это позволяет избежать дорогих HTTP-запросов для уже существующих
+            # товаров (в инкрементальном режиме - для товаров без изменений)
+            if name in existing_names:
+                if existing_fingerprints is None:
                     skipped_existing_count += 1
                     logger.debug(
                         f"Товар '{name}' уже существует в БД, пропускаем парсинг"
                     )
                     continue
+                if existing_fingerprints.get(name) == fingerprint:
+                    skipped_existing_count += 1
+                    logger.debug(f"Карточка товара '{name}' не изменилась, пропускаем")
+                    continue
+                logger.debug(f"Карточка товара '{name}' изменилась, обновляем")
 
-                # Извлекаем цену
-                price_element = product.find(
-                    "span", class_="woocommerce-Price-amount amount"
-                ) or product.find(
-                    "span", class_=lambda x: x and "price" in x.lower() if x else False
-                )
+            candidates.append((name, price, product_url, fingerprint, str(product)))
 
-                if not price_element:
-                    logger.warning(
-                        f"Цена не найдена для товара: {name}, "
-                        "устанавливаем значение по умолчанию"
-                    )
-                    price = "Цену и наличие товара уточняйте у продавца"
-                else:
-                    price = price_element.text.strip()
+        except AttributeError as e:
+            error_count += 1
+            logger.error(f"Ошибка атрибута при извлечении данных товара: {e}")
+            continue
+        except (KeyError, ValueError) as e:
+            error_count += 1
+            logger.error(f"Ошибка данных при обработке товара: {e}")
+            continue
+        except Exception as e:
+            error_count += 1
+            logger.error(f"Неожиданная ошибка при обработке товара: {e}")
+            continue
 
-                # Извлекаем ссылку на товар
-                link_element = product.find("a")
-                if not link_element or "href" not in link_element.attrs:
-                    logger.warning(f"Ссылка не найдена для товара: {name}")
-                    continue
+    return candidates, error_count, skipped_count, skipped_existing_count
 
-                product_url = urljoin(page_url, link_element["href"])
 
-                # Получаем дополнительную информацию со страницы товара
-                logger.info(f"Обработка товара: {name}")
-                details = get_product_details(driver, product_url)
+def build_product_data(
+    name: str,
+    price: str,
+    product_url: str,
+    details: Dict[str, Any],
+    fingerprint: str = "",
+    listing_html: str = "",
+) -> Optional[Dict[str, Any]]:
+    """
+    Формирование данных товара из карточки каталога и деталей страницы товара.
 
-                # Задержка между запросами к страницам товаров для rate limiting
-                # (избежание блокировки IP-адреса сайтом)
-                time.sleep(PARSER_CONFIG["PAGE_DELAY"])
+    Args:
+        name: Название товара
+        price: Цена товара из карточки каталога
+        product_url: URL страницы товара
+        details: Результат get_product_details()
+        fingerprint: Отпечаток карточки каталога (compute_listing_fingerprint)
+        listing_html: HTML карточки каталога (сохраняется для повторного разбора)
 
-                # Логирование основной информации
-                logger.debug("=" * 50)
-                logger.debug(f"Название: {name}")
-                logger.debug(f"Цена: {price}")
-                logger.debug(
-                    f"Страна производства: {details.get('country', 'Не указана')}"
-                )
-                documentation_url = details.get("documentation", "")
-                logger.debug(
-                    f"Документация: {documentation_url if documentation_url else 'Не найдена'}"
-                )
-                logger.debug(f"Ссылка на товар: {product_url}")
-                if details["description"]:
-                    desc_preview = (
-                        f"{details['description'][:100]}..."
-                        if len(details["description"]) > 100
-                        else details["description"]
+    Returns:
+        Словарь с данными товара для сохранения или None, если данные
+        не прошли валидацию
+
+    Raises:
+        KeyError: При отсутствии обязательных ключей в details
+    """
+    # Логирование основной информации
+    logger.debug("=" * 50)
+    logger.debug(f"Название: {name}")
+    logger.debug(f"Цена: {price}")
+    logger.debug(f"Страна производства: {details.get('country', 'Не указана')}")
+    documentation_url = details.get("documentation", "")
+    logger.debug(
+        f"Документация: {documentation_url if documentation_url else 'Не найдена'}"
+    )
+    logger.debug(f"Ссылка на товар: {product_url}")
+    if details["description"]:
+        desc_preview = (
+            f"{details['description'][:100]}..."
+            if len(details["description"]) > 100
+            else details["description"]
+        )
+        logger.debug(f"Описание: {desc_preview}")
+
+    # Логирование характеристик
+    if details["specifications"]:
+        logger.debug("\nХарактеристики:")
+        logger.debug(details["specifications"])
+
+    # Логирование изображений
+    if details["image_urls"]:
+        logger.debug(f"\nНайдено изображений: {len(details['image_urls'])}")
+        max_images = PARSER_CONFIG["MAX_IMAGES_PER_PRODUCT"]
+        for i, img_url in enumerate(details["image_urls"][:max_images], 1):
+            logger.debug(f"Изображение {i}: {img_url}")
+
+    # Подготавливаем данные для сохранения
+    product_data = {
+        "name": name,
+        "price": price,
+        "product_url": product_url,
+        "description": details["description"],
+        "specifications": details["specifications"],
+        "image_urls": details["image_urls"],
+        "country": details.get("country", ""),
+        "documentation": details.get("documentation", ""),
+        "listing_fingerprint": fingerprint,
+        "listing_html": listing_html,
+    }
+
+    # Валидация данных перед добавлением в список
+    is_valid, validation_error = validate_product_data(product_data)
+    if not is_valid:
+        logger.error(f"Данные товара '{name}' не прошли валидацию: {validation_error}")
+        logger.debug(f"Данные товара: {product_data}")
+        return None
+
+    logger.debug("=" * 50)
+    return product_data
+
+
+def parse_products_from_page(
+    fetcher: PageFetcher,
+    page_url: str,
+    existing_names: Optional[Set[str]] = None,
+    pool: Optional[DetailWorkerPool] = None,
+    existing_fingerprints: Optional[Dict[str, str]] = None,
+    skip_product_urls: Optional[Set[str]] = None,
+) -> Tuple[List[Dict[str, Any]], int, int]:
+    """
+    Парсинг товаров с одной страницы каталога.
+
+    Извлекает список товаров со страницы каталога, фильтрует по целевым маркам,
+    получает детальную информацию для каждого товара и валидирует данные.
+
+    Args:
+        fetcher: Загрузчик страниц (HTTP, Selenium или HTTP с резервным Selenium)
+        page_url: URL страницы каталога для парсинга
+        existing_names: Множество названий существующих товаров в БД.
+            Товары с названиями из этого множества пропускаются.
+        pool: Опциональный пул воркеров для параллельной загрузки страниц
+            товаров. Если не указан, страницы загружаются последовательно
+            через fetcher.
+        existing_fingerprints: Отпечатки карточек существующих товаров
+            (инкрементальный режим, см. extract_product_cards)
+        skip_product_urls: URL товаров, уже загруженных в этом запуске
+            (журнал прогресса); такие товары не загружаются повторно
+
+    Returns:
+        Кортеж из трех элементов:
+        - products_data (list): Список словарей с данными товаров
+        - error_count (int): Количество ошибок при парсинге
+        - skipped_count (int): Количество пропущенных товаров (не целевые марки)
+
+    Example:
+        >>> fetcher = build_fetcher()
+        >>> existing = {"Товар 1", "Товар 2"}
+        >>> products, errors, skipped = parse_products_from_page(fetcher, "https://example.com/page1", existing)
+        >>> print(f"Найдено товаров: {len(products)}")
+
+    Raises:
+        TimeoutException: Если страница не загрузилась в течение таймаута
+        NoSuchElementException: Если не найдены элементы товаров на странице
+        StaleElementReferenceException: Если элементы стали устаревшими
+        WebDriverException: При ошибках WebDriver
+        Exception: При других неожиданных ошибках
+
+    Note:
+        Товары фильтруются по целевым маркам из PARSER_CONFIG["TARGET_BRANDS"].
+        Для каждого товара вызывается get_product_details() для получения
+        детальной информации (через pool, если он передан).
+    """
+    if existing_names is None:
+        existing_names = set()
+
+    products_data = []
+    error_count = 0
+    skipped_count = 0
+    skipped_existing_count = 0
+
+    try:
+        # Загрузка страницы каталога с retry
+        page_source = navigate_to_page(fetcher, page_url)
+        if page_source is None:
+            logger.error(f"Не удалось загрузить страницу: {page_url}")
+            # Ошибка страницы: журнал прогресса не отметит ее обработанной
+            return products_data, 1, skipped_count
+
+        # Парсим HTML страницы с помощью BeautifulSoup
+        soup = BeautifulSoup(page_source, "lxml")
+
+        # Этап 1: собираем карточки целевых товаров со страницы каталога
+        (
+            candidates,
+            error_count,
+            skipped_count,
+            skipped_existing_count,
+        ) = extract_product_cards(
+            soup, page_url, existing_names, existing_fingerprints
+        )
+        if skip_product_urls:
+            candidates = [c for c in candidates if c[2] not in skip_product_urls]
+
+        # Этап 2: получаем дополнительную информацию со страниц товаров
+        # (параллельно через пул воркеров или последовательно текущим загрузчиком)
+        if pool is not None and candidates:
+            logger.info(
+                f"Загрузка страниц товаров: {len(candidates)} "
+                f"(воркеров: {pool.size})"
+            )
+            details_by_url = pool.fetch_details([c[2] for c in candidates])
+        else:
+            details_by_url = {}
+            for name, _, product_url, _, _ in candidates:
+                logger.info(f"Обработка товара: {name}")
+                try:
+                    details_by_url[product_url] = get_product_details(
+                        fetcher, product_url
                     )
-                    logger.debug(f"Описание: {desc_preview}")
-
-                # Логирование характеристик
-                if details["specifications"]:
-                    logger.debug("\nХарактеристики:")
-                    logger.debug(details["specifications"])
-
-                # Логирование изображений
-                if details["image_urls"]:
-                    logger.debug(f"\nНайдено изображений: {len(details['image_urls'])}")
-                    max_images = PARSER_CONFIG["MAX_IMAGES_PER_PRODUCT"]
-                    for i, img_url in enumerate(details["image_urls"][:max_images], 1):
-                        logger.debug(f"Изображение {i}: {img_url}")
-
-                # Подготавливаем данные для сохранения
-                product_data = {
-                    "name": name,
-                    "price": price,
-                    "product_url": product_url,
-                    "description": details["description"],
-                    "specifications": details["specifications"],
-                    "image_urls": details["image_urls"],
-                    "country": details.get("country", ""),
-                    "documentation": details.get("documentation", ""),
-                }
-
-                # Валидация данных перед добавлением в список
-                is_valid, validation_error = validate_product_data(product_data)
-                if not is_valid:
+                except Exception as e:
+                    details_by_url[product_url] = e
+
+        # Этап 3: формируем данные товаров для пакетного сохранения
+        for name, price, product_url, fingerprint, listing_html in candidates:
+            try:
+                details = details_by_url.get(product_url)
+                if isinstance(details, Exception):
+                    raise details
+                if details is None:
+                    raise KeyError(product_url)
+
+                product_data = build_product_data(
+                    name, price, product_url, details, fingerprint, listing_html
+                )
+                if product_data is None:
                     error_count += 1
-                    logger.error(
-                        f"Данные товара '{name}' не прошли валидацию: {validation_error}"
-                    )
-                    logger.debug(f"Данные товара: {product_data}")
                     continue
 
                 # Добавляем товар в список для пакетного сохранения
                 products_data.append(product_data)
-                logger.debug("=" * 50)
 
             except AttributeError as e:
                 error_count += 1
@@ -2411,35 +1948,14 @@ def prepare_boiler_object(product_data: Dict[str, Any]) -> Any:
         Количество изображений ограничено PARSER_CONFIG["MAX_IMAGES_PER_PRODUCT"].
     """
     # Парсим характеристики (передаем название товара для специальной обработки)
-    specs_dict = parse_specifications(
-        product_data.get("specifications", ""), product_data.get("name", "")
+    specs_dict = extract_spec_fields(
+        product_data.get("specifications", ""),
+        product_data.get("description", ""),
+        product_data.get("name", ""),
     )
 
-    # Если напряжение не найдено в характеристиках, пытаемся извлечь из описания
-    if "voltage" not in specs_dict or not specs_dict.get("voltage"):
-        description = product_data.get("description", "")
-        product_name = product_data.get("name", "")
-        power_value = specs_dict.get("power", "")
-
-        voltage_from_description = extract_voltage_from_description(
-            description, product_name, power_value
-        )
-
-        if voltage_from_description:
-            specs_dict["voltage"] = voltage_from_description
-
     # Нормализация цены (извлекаем только цифры и знаки)
-    price = product_data.get("price", "")
-
-    # Если цена не указана или пустая, устанавливаем значение по умолчанию
-    if not price or price.strip() == "":
-        price = "Цену и наличие товара уточняйте у продавца"
-    # Если цена найдена, нормализуем её
-    elif "уточняйте" not in price.lower():
-        price = re.sub(REGEX_PRICE_CLEANUP, "", price).strip()
-        # Если после нормализации цена стала пустой, устанавливаем значение по умолчанию
-        if not price:
-            price = "Цену и наличие товара уточняйте у продавца"
+    price = normalize_price(product_data.get("price", ""))
 
     # Получаем страну, если не указана - устанавливаем значение по умолчанию
     country = product_data.get("country") or ""
@@ -2479,6 +1995,9 @@ def prepare_boiler_object(product_data: Dict[str, Any]) -> Any:
         description=description,
         country=country or None,  # Пустая строка преобразуется в None
         documentation=documentation or None,  # Пустая строка преобразуется в None
+        listing_fingerprint=product_data.get("listing_fingerprint") or "",
+        raw_specifications=product_data.get("specifications") or None,
+        raw_listing_html=product_data.get("listing_html") or None,
         **specs_dict,  # Добавляем все распарсенные характеристики
     )
 
@@ -2500,9 +2019,260 @@ def prepare_boiler_object(product_data: Dict[str, Any]) -> Any:
         for i in range(1, max_images + 1):
             setattr(boiler, f"image_{i}", None)
 
+    # Числовые поля и производитель для фильтрации в БД
+    # (bulk_create/bulk_update не вызывают save())
+    boiler.update_numeric_fields()
+    boiler.update_manufacturer()
+
     return boiler
 
 
+def get_boiler_update_fields() -> List[str]:
+    """
+    Список полей ElectricBoiler, обновляемых парсером через bulk_update.
+
+    Returns:
+        Список имен полей (без name и служебных полей)
+    """
+    update_fields = [
+        "price",
+        "product_url",
+        "description",
+        "country",
+        "documentation",
+        "power",
+        "power_regulation",
+        "heating_area",
+        "work_type",
+        "self_work",
+        "water_heating",
+        "floor_heating",
+        "expansion_tank",
+        "circulation_pump",
+        "voltage",
+        "cable",
+        "fuse",
+        "temp_range",
+        "temp_range_radiator",
+        "temp_range_floor",
+        "connection",
+        "dimensions",
+        "wifi",
+        "thermostat",
+        "thermostat_included",
+        "outdoor_sensor",
+        "listing_fingerprint",
+        "raw_specifications",
+        "raw_listing_html",
+        "manufacturer_id",
+        *NUMERIC_FIELDS,
+    ]
+    # Добавляем поля изображений
+    max_images = PARSER_CONFIG["MAX_IMAGES_PER_PRODUCT"]
+    for i in range(1, max_images + 1):
+        update_fields.append(f"image_{i}")
+    return update_fields
+
+
+def prepare_boiler_objects(
+    products_data: List[Dict[str, Any]], existing_names: Set[str]
+) -> Tuple[List[Any], List[Any], int]:
+    """
+    Валидация данных товаров и подготовка объектов ElectricBoiler.
+
+    Args:
+        products_data: Список словарей с данными товаров
+        existing_names: Множество названий существующих товаров в БД
+
+    Returns:
+        Кортеж из трех элементов:
+        - products_to_create (list): Объекты новых товаров
+        - products_to_update (list): Объекты существующих товаров
+        - error_count (int): Количество товаров с ошибками
+    """
+    products_to_create = []
+    products_to_update = []
+    error_count = 0
+
+    for product_data in products_data:
+        # Валидация данных
+        is_valid, error_message = validate_product_data(product_data)
+        if not is_valid:
+            logger.error(
+                f"Данные товара '{product_data.get('name')}' "
+                f"не прошли валидацию: {error_message}"
+            )
+            error_count += 1
+            continue
+
+        try:
+            boiler = prepare_boiler_object(product_data)
+            product_name = product_data["name"]
+
+            if product_name in existing_names:
+                # Товар существует - добавляем в список для обновления
+                products_to_update.append(boiler)
+            else:
+                # Новый товар - добавляем в список для создания
+                products_to_create.append(boiler)
+        except (KeyError, AttributeError) as e:
+            logger.error(
+                f"Ошибка доступа к данным при подготовке товара "
+                f"'{product_data.get('name')}': {e}"
+            )
+            error_count += 1
+            continue
+        except ValueError as e:
+            logger.error(
+                f"Ошибка значения при подготовке товара '{product_data.get('name')}': {e}"
+            )
+            error_count += 1
+            continue
+        except Exception as e:
+            logger.error(
+                f"Неожиданная ошибка при подготовке товара '{product_data.get('name')}': {e}"
+            )
+            error_count += 1
+            continue
+
+    return products_to_create, products_to_update, error_count
+
+
+def save_boiler_objects(
+    products_to_create: List[Any], products_to_update: List[Any]
+) -> Tuple[int, int, int]:
+    """
+    Пакетная запись подготовленных объектов ElectricBoiler в БД.
+
+    Для существующих товаров записываются только изменившиеся поля
+    (и updated_at); товары без изменений не обновляются.
+
+    Args:
+        products_to_create: Объекты новых товаров (bulk_create)
+        products_to_update: Объекты существующих товаров (bulk_update по name)
+
+    Returns:
+        Кортеж (created_count, updated_count, error_count)
+    """
+    created_count = 0
+    updated_count = 0
+    error_count = 0
+    # Обновленные товары, сгруппированные по набору изменившихся полей
+    groups: Dict[Tuple[str, ...], List[Any]] = {}
+
+    # Получаем список всех полей модели для bulk_update
+    # Исключаем поля, которые не должны обновляться
+    update_fields = get_boiler_update_fields()
+
+    # Записи производителей должны существовать до записи котлов (внешний ключ)
+    manufacturers = dict(
+        filter(
+            None,
+            (
+                manufacturer_from_name(boiler.name)
+                for boiler in [*products_to_create, *products_to_update]
+            ),
+        )
+    )
+    try:
+        Manufacturer.objects.ensure(manufacturers)
+    except Exception as e:
+        logger.error(f"Ошибка при создании производителей: {e}")
+
+    # Пакетное создание новых товаров
+    if products_to_create:
+        try:
+            # Выполняем bulk_create для новых товаров
+            created_boilers = ElectricBoiler.objects.bulk_create(
+                products_to_create, ignore_conflicts=True
+            )
+            created_count = len(created_boilers)
+            logger.info(f"Создано новых товаров: {created_count}")
+
+        except IntegrityError as e:
+            logger.error(f"Ошибка целостности данных при bulk_create: {e}")
+            error_count += len(products_to_create)
+        except ValueError as e:
+            logger.error(f"Ошибка значения при bulk_create: {e}")
+            error_count += len(products_to_create)
+        except Exception as e:
+            logger.error(f"Неожиданная ошибка при bulk_create: {e}")
+            error_count += len(products_to_create)
+
+    # Пакетное обновление существующих товаров
+    if products_to_update:
+        try:
+            # Получаем существующие объекты из БД
+            update_names = [p.name for p in products_to_update]
+            existing_boilers = ElectricBoiler.objects.filter(name__in=update_names)
+            existing_boilers_dict = {boiler.name: boiler for boiler in existing_boilers}
+
+            # Копируем в существующие объекты только изменившиеся значения
+            # и группируем объекты по набору изменившихся полей
+            now = timezone.now()
+            unchanged_count = 0
+            for boiler in products_to_update:
+                if boiler.name not in existing_boilers_dict:
+                    continue
+                existing_boiler = existing_boilers_dict[boiler.name]
+                changed_fields = tuple(
+                    field
+                    for field in update_fields
+                    if getattr(existing_boiler, field) != getattr(boiler, field)
+                )
+                if not changed_fields:
+                    unchanged_count += 1
+                    continue
+                for field in changed_fields:
+                    setattr(existing_boiler, field, getattr(boiler, field))
+                # bulk_update не обновляет auto_now поля
+                existing_boiler.updated_at = now
+                groups.setdefault(changed_fields, []).append(existing_boiler)
+
+            # Выполняем bulk_update для каждого набора полей
+            for changed_fields, boilers in groups.items():
+                ElectricBoiler.objects.bulk_update(
+                    boilers, list(changed_fields) + ["updated_at"]
+                )
+                updated_count += len(boilers)
+            if updated_count:
+                logger.info(f"Обновлено существующих товаров: {updated_count}")
+            if unchanged_count:
+                logger.info(f"Товаров без изменений: {unchanged_count}")
+
+        except IntegrityError as e:
+            logger.error(f"Ошибка целостности данных при bulk_update: {e}")
+            error_count += len(products_to_update)
+        except ValueError as e:
+            logger.error(f"Ошибка значения при bulk_update: {e}")
+            error_count += len(products_to_update)
+        except Exception as e:
+            logger.error(f"Неожиданная ошибка при bulk_update: {e}")
+            error_count += len(products_to_update)
+
+    # bulk_create / bulk_update не вызывают save() и сигналы модели: поисковые
+    # векторы, количество котлов производителей, версию каталога (ETag API)
+    # и событие изменения каталога обновляем явно. Товары уже записаны,
+    # поэтому ошибка здесь не считается ошибкой товаров (версия каталога
+    # пересчитается по БД через CATALOG_VERSION_TIMEOUT)
+    if created_count or updated_count:
+        written_names = [b.name for b in products_to_create] + [
+            b.name for boilers in groups.values() for b in boilers
+        ]
+        try:
+            written = ElectricBoiler.objects.filter(name__in=written_names)
+            update_search_vectors(written)
+            Manufacturer.objects.refresh_counts()
+            version = bump_catalog_version()
+            publish_catalog_change(
+                version, changed=written.values_list("id", flat=True)
+            )
+        except Exception as e:
+            logger.error(f"Ошибка обновления данных после записи товаров: {e}")
+
+    return created_count, updated_count, error_count
+
+
 @retry_on_failure(
     max_attempts=PARSER_CONFIG["RETRY_COUNT"],
     delay=PARSER_CONFIG["RETRY_DELAY"],
@@ -2542,7 +2312,8 @@ def bulk_save_to_database(
 
     Note:
         Функция использует декоратор @retry_on_failure для автоматических повторов.
-        Валидация данных выполняется для каждого товара перед сохранением.
+        Валидация данных выполняется для каждого товара перед сохранением
+        (prepare_boiler_objects), запись - в save_boiler_objects.
     """
     if not products_data:
         return 0, 0, 0
@@ -2553,142 +2324,14 @@ def bulk_save_to_database(
 
     try:
         # Разделяем товары на новые и существующие
-        products_to_create = []
-        products_to_update = []
-
-        for product_data in products_data:
-            # Валидация данных
-            is_valid, error_message = validate_product_data(product_data)
-            if not is_valid:
-                logger.error(
-                    f"Данные товара '{product_data.get('name')}' "
-                    f"не прошли валидацию: {error_message}"
-                )
-                error_count += 1
-                continue
-
-            try:
-                boiler = prepare_boiler_object(product_data)
-                product_name = product_data["name"]
-
-                if product_name in existing_names:
-                    # Товар существует - добавляем в список для обновления
-                    products_to_update.append(boiler)
-                else:
-                    # Новый товар - добавляем в список для создания
-                    products_to_create.append(boiler)
-            except (KeyError, AttributeError) as e:
-                logger.error(
-                    f"Ошибка доступа к данным при подготовке товара "
-                    f"'{product_data.get('name')}': {e}"
-                )
-                error_count += 1
-                continue
-            except ValueError as e:
-                logger.error(
-                    f"Ошибка значения при подготовке товара '{product_data.get('name')}': {e}"
-                )
-                error_count += 1
-                continue
-            except Exception as e:
-                logger.error(
-                    f"Неожиданная ошибка при подготовке товара '{product_data.get('name')}': {e}"
-                )
-                error_count += 1
-                continue
-
-        # Получаем список всех полей модели для bulk_update
-        # Исключаем поля, которые не должны обновляться
-        update_fields = [
-            "price",
-            "product_url",
-            "description",
-            "country",
-            "documentation",
-            "power",
-            "power_regulation",
-            "heating_area",
-            "work_type",
-            "self_work",
-            "water_heating",
-            "floor_heating",
-            "expansion_tank",
-            "circulation_pump",
-            "voltage",
-            "cable",
-            "fuse",
-            "temp_range",
-            "temp_range_radiator",
-            "temp_range_floor",
-            "connection",
-            "dimensions",
-            "wifi",
-            "thermostat",
-            "thermostat_included",
-            "outdoor_sensor",
-        ]
-        # Добавляем поля изображений
-        max_images = PARSER_CONFIG["MAX_IMAGES_PER_PRODUCT"]
-        for i in range(1, max_images + 1):
-            update_fields.append(f"image_{i}")
-
-        # Пакетное создание новых товаров
-        if products_to_create:
-            try:
-                # Выполняем bulk_create для новых товаров
-                created_boilers = ElectricBoiler.objects.bulk_create(
-                    products_to_create, ignore_conflicts=True
-                )
-                created_count = len(created_boilers)
-                logger.info(f"Создано новых товаров: {created_count}")
-
-            except IntegrityError as e:
-                logger.error(f"Ошибка целостности данных при bulk_create: {e}")
-                error_count += len(products_to_create)
-            except ValueError as e:
-                logger.error(f"Ошибка значения при bulk_create: {e}")
-                error_count += len(products_to_create)
-            except Exception as e:
-                logger.error(f"Неожиданная ошибка при bulk_create: {e}")
-                error_count += len(products_to_create)
+        products_to_create, products_to_update, error_count = prepare_boiler_objects(
+            products_data, existing_names
+        )
 
-        # Пакетное обновление существующих товаров
-        if products_to_update:
-            try:
-                # Получаем существующие объекты из БД
-                update_names = [p.name for p in products_to_update]
-                existing_boilers = ElectricBoiler.objects.filter(name__in=update_names)
-                existing_boilers_dict = {
-                    boiler.name: boiler for boiler in existing_boilers
-                }
-
-                # Обновляем существующие объекты значениями из новых
-                boilers_to_bulk_update = []
-                for boiler in products_to_update:
-                    if boiler.name in existing_boilers_dict:
-                        existing_boiler = existing_boilers_dict[boiler.name]
-                        # Копируем значения из нового объекта в существующий
-                        for field in update_fields:
-                            setattr(existing_boiler, field, getattr(boiler, field))
-                        boilers_to_bulk_update.append(existing_boiler)
-
-                # Выполняем bulk_update
-                if boilers_to_bulk_update:
-                    ElectricBoiler.objects.bulk_update(
-                        boilers_to_bulk_update, update_fields
-                    )
-                    updated_count = len(boilers_to_bulk_update)
-                    logger.info(f"Обновлено существующих товаров: {updated_count}")
-
-            except IntegrityError as e:
-                logger.error(f"Ошибка целостности данных при bulk_update: {e}")
-                error_count += len(products_to_update)
-            except ValueError as e:
-                logger.error(f"Ошибка значения при bulk_update: {e}")
-                error_count += len(products_to_update)
-            except Exception as e:
-                logger.error(f"Неожиданная ошибка при bulk_update: {e}")
-                error_count += len(products_to_update)
+        created_count, updated_count, save_errors = save_boiler_objects(
+            products_to_create, products_to_update
+        )
+        error_count += save_errors
 
     except IntegrityError as e:
         logger.error(
@@ -2768,36 +2411,14 @@ def save_to_database(product_data: Dict[str, Any]) -> Tuple[bool, str]:
 
     try:
         # Парсим характеристики (передаем название товара для специальной обработки)
-        specs_dict = parse_specifications(
-            product_data.get("specifications", ""), product_data.get("name", "")
+        specs_dict = extract_spec_fields(
+            product_data.get("specifications", ""),
+            product_data.get("description", ""),
+            product_data.get("name", ""),
         )
 
-        # Если напряжение не найдено в характеристиках, пытаемся извлечь из описания
-        if "voltage" not in specs_dict or not specs_dict.get("voltage"):
-            description = product_data.get("description", "")
-            product_name = product_data.get("name", "")
-            power_value = specs_dict.get("power", "")
-
-            voltage_from_description = extract_voltage_from_description(
-                description, product_name, power_value
-            )
-
-            if voltage_from_description:
-                specs_dict["voltage"] = voltage_from_description
-
         # Нормализация цены (извлекаем только цифры и знаки)
-        price = product_data.get("price", "")
-
-        # Если цена не указана или пустая, устанавливаем значение по умолчанию
-        if not price or price.strip() == "":
-            price = "Цену и наличие товара уточняйте у продавца"
-        # Если цена найдена, нормализуем её
-        # (удаляем лишние символы, оставляем только цифры, точку, запятую и пробелы)
-        elif "уточняйте" not in price.lower():
-            price = re.sub(REGEX_PRICE_CLEANUP, "", price).strip()
-            # Если после нормализации цена стала пустой, устанавливаем значение по умолчанию
-            if not price:
-                price = "Цену и наличие товара уточняйте у продавца"
+        price = normalize_price(product_data.get("price", ""))
 
         # Получаем страну, если не указана - устанавливаем значение по умолчанию
         country = product_data.get("country") or ""
@@ -2883,6 +2504,54 @@ def save_to_database(product_data: Dict[str, Any]) -> Tuple[bool, str]:
         return False, error_msg
 
 
+def load_existing_products() -> Tuple[Set[str], Optional[Dict[str, str]]]:
+    """
+    Загрузка названий существующих товаров (и отпечатков их карточек).
+
+    Returns:
+        Кортеж (existing_names, existing_fingerprints). existing_fingerprints
+        равен None, если инкрементальный режим (PARSER_CONFIG["INCREMENTAL_MODE"])
+        выключен: тогда существующие товары не обновляются.
+    """
+    if not PARSER_CONFIG.get("INCREMENTAL_MODE"):
+        return set(ElectricBoiler.objects.values_list("name", flat=True)), None
+    existing_fingerprints = dict(
+        ElectricBoiler.objects.values_list("name", "listing_fingerprint")
+    )
+    return set(existing_fingerprints), existing_fingerprints
+
+
+def remember_saved_products(
+    products_data: List[Dict[str, Any]],
+    existing_names: Set[str],
+    existing_fingerprints: Optional[Dict[str, str]],
+) -> None:
+    """
+    Добавление сохраненных товаров в existing_names/existing_fingerprints,
+    чтобы не загружать их повторно на следующих страницах.
+    """
+    for product_data in products_data:
+        existing_names.add(product_data["name"])
+        if existing_fingerprints is not None:
+            existing_fingerprints[product_data["name"]] = product_data.get(
+                "listing_fingerprint", ""
+            )
+
+
+def open_checkpoint() -> Optional[CrawlCheckpoint]:
+    """
+    Открытие журнала прогресса по настройкам PARSER_CONFIG["CHECKPOINT_*"].
+
+    Returns:
+        CrawlCheckpoint или None, если журнал отключен
+    """
+    if not PARSER_CONFIG.get("CHECKPOINT_ENABLED"):
+        return None
+    return CrawlCheckpoint(
+        PARSER_CONFIG["CHECKPOINT_PATH"], max_age=PARSER_CONFIG["CHECKPOINT_MAX_AGE"]
+    )
+
+
 def parse_azbuka_tepla() -> None:
     """
     Основная функция парсера для сайта azbukatepla.by.
@@ -2892,12 +2561,13 @@ def parse_azbuka_tepla() -> None:
     со всех доступных страниц и использует пакетную обработку БД.
 
     Процесс работы:
-    1. Инициализация WebDriver
+    1. Инициализация загрузчика страниц (и пула воркеров при DETAIL_WORKERS > 1)
     2. Получение всех URL страниц пагинации
-    3. Парсинг товаров с каждой страницы
+    3. Парсинг товаров с каждой страницы (страницы товаров загружаются
+       параллельно воркерами пула)
     4. Пакетное сохранение в БД (при достижении BATCH_SIZE)
     5. Финальное сохранение оставшихся товаров
-    6. Закрытие WebDriver
+    6. Закрытие загрузчика и воркеров
 
     Returns:
         None. Результаты работы логируются в консоль и файл.
@@ -2919,12 +2589,33 @@ def parse_azbuka_tepla() -> None:
         - TEKNIX ESPRO
 
         Размер батча для сохранения определяется в PARSER_CONFIG["BATCH_SIZE"].
-        WebDriver автоматически закрывается в блоке finally.
+        Количество воркеров определяется PARSER_CONFIG["DETAIL_WORKERS"],
+        общий лимит запросов - PARSER_CONFIG["MAX_REQUESTS_PER_SECOND"].
+        Способ загрузки страниц определяется PARSER_CONFIG["FETCH_BACKEND"]:
+        в режиме "auto" WebDriver запускается, только если HTTP-загрузка
+        не вернула ожидаемую разметку.
+        В инкрементальном режиме (PARSER_CONFIG["INCREMENTAL_MODE"]) страницы
+        существующих товаров загружаются повторно только при изменении
+        карточки в каталоге (названия, цены или изображения).
+        Прогресс запуска записывается в журнал (PARSER_CONFIG["CHECKPOINT_*"]):
+        после падения следующий запуск пропускает обработанные страницы
+        и товары и записывает в БД загруженные, но не сохраненные товары.
+        Журнал удаляется, только если запуск завершился без ошибок.
+        Загрузчик и воркеры автоматически закрываются в блоке finally.
     """
-    driver = None
+    fetcher = None
+    pool = None
+    checkpoint = None
     try:
-        # Создаем WebDriver
-        driver = get_driver()
+        # Создаем загрузчик страниц
+        fetcher = build_fetcher()
+        logger.info(f"Загрузка страниц: {fetcher.name}")
+
+        # Пул воркеров для параллельной загрузки страниц товаров
+        detail_workers = PARSER_CONFIG["DETAIL_WORKERS"]
+        if detail_workers > 1:
+            pool = DetailWorkerPool(detail_workers)
+            logger.info(f"Параллельная загрузка товаров: воркеров={detail_workers}")
 
         logger.info("=" * 50)
         logger.info("Начало парсинга azbukatepla.by")
@@ -2933,11 +2624,11 @@ def parse_azbuka_tepla() -> None:
 
         # Загружаем существующие названия товаров в память для оптимизации
         logger.info("Загрузка существующих товаров из БД...")
-        existing_names = set(ElectricBoiler.objects.values_list("name", flat=True))
+        existing_names, existing_fingerprints = load_existing_products()
         logger.info(f"Найдено существующих товаров в БД: {len(existing_names)}")
 
         # Получаем все URL страниц пагинации
-        page_urls = get_all_pages_urls(driver, url)
+        page_urls = get_all_pages_urls(fetcher, url)
 
         if not page_urls:
             logger.error("Не удалось получить URL страниц для парсинга")
@@ -2947,6 +2638,21 @@ def parse_azbuka_tepla() -> None:
 
         # Собираем все товары для пакетной обработки
         all_products_data = []
+        done_pages: Set[str] = set()
+        done_products: Set[str] = set()
+
+        # Продолжаем прерванный запуск: отложенные товары попадают в первый батч
+        checkpoint = open_checkpoint()
+        if checkpoint is not None and checkpoint.is_resumed:
+            all_products_data = checkpoint.pending_products()
+            done_pages = checkpoint.completed_pages()
+            done_products = checkpoint.completed_products()
+            logger.info(
+                f"Продолжение прерванного запуска: обработано страниц="
+                f"{len(done_pages)}, загружено товаров={len(done_products)}, "
+                f"ожидают записи={len(all_products_data)}"
+            )
+
         total_errors = 0
         total_skipped = 0
         total_created = 0
@@ -2959,11 +2665,27 @@ def parse_azbuka_tepla() -> None:
             logger.info(f"Обработка страницы {page_num}/{len(page_urls)}: {page_url}")
             logger.info("-" * 50)
 
+            if page_url in done_pages:
+                logger.info("Страница уже обработана (журнал прогресса), пропускаем")
+                continue
+
             # Парсим товары со страницы (передаем existing_names для проверки)
             products_data, errors, skipped = parse_products_from_page(
-                driver, page_url, existing_names
+                fetcher,
+                page_url,
+                existing_names,
+                pool=pool,
+                existing_fingerprints=existing_fingerprints,
+                skip_product_urls=done_products,
             )
 
+            # Страница с ошибками будет обработана повторно при продолжении
+            if checkpoint is not None:
+                checkpoint.record_page(page_url, products_data, page_done=not errors)
+                done_products.update(p["product_url"] for p in products_data)
+                if not errors:
+                    done_pages.add(page_url)
+
             # Добавляем товары в общий список
             all_products_data.extend(products_data)
             total_errors += errors
@@ -2987,17 +2709,16 @@ def parse_azbuka_tepla() -> None:
                     f"Батч сохранен: создано={created}, обновлено={updated}, "
                     f"ошибок={batch_errors}"
                 )
+                if checkpoint is not None and not batch_errors:
+                    checkpoint.mark_saved(all_products_data)
                 # Обновляем список существующих названий для следующих страниц
                 # Это позволяет пропускать уже обработанные товары
-                for product_data in all_products_data:
-                    existing_names.add(product_data["name"])
+                remember_saved_products(
+                    all_products_data, existing_names, existing_fingerprints
+                )
                 # Очищаем список для следующего батча
                 all_products_data = []
 
-            # Небольшая задержка между страницами для снижения нагрузки на сервер
-            if page_num < len(page_urls):
-                time.sleep(PARSER_CONFIG["PAGE_DELAY"])
-
         # Сохраняем оставшиеся товары
         if all_products_data:
             logger.info(f"Сохранение оставшихся товаров ({len(all_products_data)})...")
@@ -3011,9 +2732,25 @@ def parse_azbuka_tepla() -> None:
                 f"Финальный батч сохранен: создано={created}, обновлено={updated}, "
                 f"ошибок={batch_errors}"
             )
+            if checkpoint is not None and not batch_errors:
+                checkpoint.mark_saved(all_products_data)
             # Обновляем список существующих названий после финального батча
-            for product_data in all_products_data:
-                existing_names.add(product_data["name"])
+            remember_saved_products(
+                all_products_data, existing_names, existing_fingerprints
+            )
+
+        # Журнал удаляется, только если все страницы обработаны и записаны без
+        # ошибок; иначе следующий запуск повторит лишь незавершенную часть
+        if checkpoint is not None:
+            if total_errors == 0 and done_pages.issuperset(page_urls):
+                checkpoint.clear()
+                checkpoint = None
+            else:
+                logger.warning(
+                    f"Запуск завершен с ошибками, журнал прогресса сохранен "
+                    f"в {checkpoint.path}: повторный запуск обработает только "
+                    "незавершенные страницы и товары"
+                )
 
         # Итоговая статистика
         total_processed = total_created + total_updated
@@ -3025,16 +2762,29 @@ def parse_azbuka_tepla() -> None:
         logger.info(f"Ошибок: {total_errors}")
         logger.info("=" * 50)
 
+        # Статические снимки каталога для чтения без Django и БД
+        if total_processed:
+            publish_snapshots_on_commit()
+
     except Exception as e:
         logger.critical(f"Критическая ошибка парсера: {e}")
         import traceback
 
         logger.critical(traceback.format_exc())
+        if checkpoint is not None:
+            logger.critical(
+                f"Прогресс сохранен в {checkpoint.path}, "
+                "повторный запуск продолжит парсинг с места остановки"
+            )
     finally:
-        # Закрываем WebDriver
-        if driver:
-            driver.quit()
-            logger.info("WebDriver закрыт")
+        if checkpoint is not None:
+            checkpoint.close()
+        # Закрываем воркеры пула
+        if pool:
+            pool.close()
+        # Закрываем загрузчик страниц (и WebDriver, если он запускался)
+        if fetcher:
+            fetcher.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,193 @@
+"""
+Журнал прогресса парсера (контрольная точка для продолжения прерванного запуска)
+
+В локальной SQLite базе хранятся обработанные страницы каталога, загруженные
+товары и данные товаров, еще не записанные в основную БД. Если запуск
+прервался (ошибка, падение WebDriver, Ctrl+C), следующий запуск пропускает
+обработанные страницы и товары и сначала записывает отложенные данные.
+Журнал удаляется, только если запуск завершился без ошибок.
+"""
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    url TEXT PRIMARY KEY,
+    done_at REAL NOT NULL
+);
+-- data IS NOT NULL - товар загружен, но еще не записан в основную БД
+CREATE TABLE IF NOT EXISTS products (
+    url TEXT PRIMARY KEY,
+    data TEXT,
+    done_at REAL NOT NULL
+);
+"""
+
+
+class CrawlCheckpoint:
+    """
+    Журнал прогресса одного запуска парсера
+
+    Example:
+        >>> checkpoint = CrawlCheckpoint("cache/checkpoint.sqlite3")
+        >>> if not checkpoint.is_page_done(page_url):
+        ...     checkpoint.record_page(page_url, products_data)
+        >>> checkpoint.mark_saved(products_data)
+        >>> checkpoint.clear()  # запуск завершен без ошибок
+    """
+
+    def __init__(self, path: str, max_age: Optional[float] = None) -> None:
+        """
+        Args:
+            path: Путь к файлу журнала
+            max_age: Максимальный возраст журнала (секунды). Более старый
+                журнал не используется для продолжения и начинается заново
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+
+        started_at = self._get_meta("started_at")
+        if started_at is not None and max_age and time.time() - float(started_at) > max_age:
+            logger.warning("Журнал прогресса устарел, начинаем запуск заново")
+            self._reset()
+            started_at = None
+        if started_at is None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('started_at', ?)",
+                    (str(time.time()),),
+                )
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _reset(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM meta")
+            self._conn.execute("DELETE FROM pages")
+            self._conn.execute("DELETE FROM products")
+
+    @property
+    def is_resumed(self) -> bool:
+        """Журнал содержит прогресс предыдущего (прерванного) запуска"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT EXISTS (SELECT 1 FROM pages) OR EXISTS (SELECT 1 FROM products)"
+            ).fetchone()
+        return bool(row[0])
+
+    def completed_pages(self) -> Set[str]:
+        """URL обработанных страниц каталога"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT url FROM pages")}
+
+    def is_page_done(self, page_url: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM pages WHERE url = ?", (page_url,)
+            ).fetchone()
+        return row is not None
+
+    def completed_products(self) -> Set[str]:
+        """URL загруженных товаров (записанных в БД или отложенных)"""
+        with self._lock:
+            return {row[0] for row in self._conn.execute("SELECT url FROM products")}
+
+    def pending_products(self) -> List[Dict[str, Any]]:
+        """Данные загруженных, но еще не записанных в БД товаров"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM products WHERE data IS NOT NULL ORDER BY done_at"
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def record_page(
+        self,
+        page_url: str,
+        products_data: Iterable[Dict[str, Any]],
+        page_done: bool = True,
+    ) -> None:
+        """
+        Запись загруженных товаров страницы каталога
+
+        Товары и отметка страницы записываются в одной транзакции.
+
+        Args:
+            page_url: URL страницы каталога
+            products_data: Данные товаров страницы (ожидают записи в БД)
+            page_done: Отметить страницу обработанной. False, если часть
+                товаров не загрузилась: тогда страница будет обработана
+                повторно, но уже загруженные товары будут пропущены
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._insert_products(products_data, now)
+            if page_done:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO pages (url, done_at) VALUES (?, ?)",
+                    (page_url, now),
+                )
+
+    def record_products(self, products_data: Iterable[Dict[str, Any]]) -> None:
+        """
+        Запись загруженных товаров без отметки страницы каталога
+
+        Используется асинхронным конвейером (parsers.pipeline), где товары
+        одной страницы обрабатываются независимо друг от друга.
+        """
+        with self._lock, self._conn:
+            self._insert_products(products_data, time.time())
+
+    def _insert_products(self, products_data: Iterable[Dict[str, Any]], now: float) -> None:
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO products (url, data, done_at) VALUES (?, ?, ?)",
+            [
+                (p["product_url"], json.dumps(p, ensure_ascii=False), now)
+                for p in products_data
+            ],
+        )
+
+    def mark_saved(self, products_data: Iterable[Dict[str, Any]]) -> None:
+        """
+        Отметка товаров записанными в основную БД
+
+        Args:
+            products_data: Данные записанных товаров
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO products (url, data, done_at) VALUES (?, NULL, ?)",
+                [(p["product_url"], now) for p in products_data],
+            )
+
+    def clear(self) -> None:
+        """Удаление журнала после завершения запуска без ошибок"""
+        self.close()
+        for suffix in ("", "-journal", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -19,9 +19,42 @@ PARSER_CONFIG = {
     "RETRY_COUNT": 3,
     "RETRY_DELAY": 5,  # секунды между попытками
     
-    # Задержки между операциями (в секундах)
-    "PAGE_DELAY": 1,  # Задержка между переходами на страницы
-    "PAGINATION_DELAY": 1,  # Задержка при обработке пагинации
+    # Частота запросов к сайту: единственное место, задающее паузы между
+    # загрузками страниц (общий RateLimiter для всех загрузчиков и воркеров)
+    "MAX_REQUESTS_PER_SECOND": 2,  # Общий лимит запросов к сайту для всех воркеров (0 - без лимита)
+    
+    # Способ загрузки страниц: "http" - без браузера, "selenium" - через WebDriver,
+    # "auto" - HTTP, а при отсутствии маркеров в HTML - Selenium
+    "FETCH_BACKEND": os.getenv("PARSER_FETCH_BACKEND", "auto"),
+    # Маркеры полностью отрендеренных страниц (подстроки HTML)
+    "CATALOG_PAGE_MARKERS": ["product-type-simple"],
+    "PRODUCT_PAGE_MARKERS": ["woocommerce-product-gallery"],
+    
+    # Дисковый кэш страниц для HTTP-загрузчика
+    "HTTP_CACHE_ENABLED": os.getenv("PARSER_HTTP_CACHE", "1") not in ("0", "false", "False", ""),
+    "HTTP_CACHE_DIR": os.getenv("PARSER_HTTP_CACHE_DIR", "cache/pages"),
+    "HTTP_CACHE_TTL": int(os.getenv("PARSER_HTTP_CACHE_TTL", "3600")),  # Секунды без перепроверки (0 - всегда условный запрос)
+    
+    # Параллельная загрузка страниц товаров
+    "DETAIL_WORKERS": int(os.getenv("PARSER_DETAIL_WORKERS", "4")),  # Количество воркеров (1 - последовательно)
+    
+    # Асинхронный конвейер (parsers/pipeline.py): параллельность этапов и очереди
+    "PIPELINE_LIST_CONCURRENCY": 2,  # Одновременно загружаемых страниц каталога
+    "PIPELINE_DETAIL_CONCURRENCY": 4,  # Одновременно загружаемых страниц товаров
+    "PIPELINE_PARSE_CONCURRENCY": 2,  # Одновременно разбираемых товаров
+    "PIPELINE_IMAGE_CHECK_CONCURRENCY": 8,  # Одновременных HEAD-запросов к изображениям
+    "PIPELINE_QUEUE_SIZE": 20,  # Размер очередей между этапами (обратное давление)
+    "PIPELINE_SAVE_BATCH_SIZE": 10,  # Максимальный размер батча записи в БД
+    "PIPELINE_FLUSH_INTERVAL": 5,  # Запись неполного батча не реже раза в N секунд
+    
+    # Инкрементальный режим: существующие товары обновляются, если изменилась
+    # их карточка в каталоге (название, цена, изображение); без него пропускаются
+    "INCREMENTAL_MODE": os.getenv("PARSER_INCREMENTAL", "1") not in ("0", "false", "False", ""),
+    
+    # Журнал прогресса для продолжения прерванного запуска (удаляется после успешного)
+    "CHECKPOINT_ENABLED": os.getenv("PARSER_CHECKPOINT", "1") not in ("0", "false", "False", ""),
+    "CHECKPOINT_PATH": os.getenv("PARSER_CHECKPOINT_PATH", "cache/checkpoint.sqlite3"),
+    "CHECKPOINT_MAX_AGE": 24 * 3600,  # Более старый журнал не используется (секунды)
     
     # Ограничения
     "MAX_PAGES_TO_CHECK": 50,  # Максимальное количество страниц для проверки пагинации
@@ -0,0 +1,416 @@
+"""
+Загрузчики HTML-страниц для парсера
+
+Парсер использует только HTML страницы (дальше работает BeautifulSoup),
+поэтому запуск браузера нужен лишь для страниц, которые рендерятся на клиенте.
+Модуль предоставляет единый интерфейс PageFetcher и реализации:
+- HttpFetcher: обычные HTTP-запросы с keep-alive соединениями, gzip
+  и дисковым кэшем страниц (PageCache)
+- SeleniumFetcher: загрузка через WebDriver
+- FallbackFetcher: HTTP, а при отсутствии нужных маркеров в HTML - Selenium
+"""
+import gzip
+import http.client
+import logging
+import threading
+import zlib
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from parsers.http_cache import PageCache
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# HTTP статусы редиректов, по которым выполняется переход
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+class FetchError(Exception):
+    """Ошибка загрузки страницы (неуспешный HTTP статус, слишком много редиректов)"""
+
+
+class PageFetcher:
+    """
+    Базовый интерфейс загрузчика страниц
+
+    Реализации возвращают HTML страницы в виде строки.
+    """
+
+    name = "base"
+
+    def fetch(
+        self,
+        url: str,
+        wait_class: Optional[str] = None,
+        markers: Sequence[str] = (),
+        wait_required: bool = True,
+    ) -> str:
+        """
+        Загрузка HTML страницы
+
+        Args:
+            url: URL страницы
+            wait_class: CSS класс элемента, появления которого нужно дождаться
+                (используется только браузерными загрузчиками)
+            markers: Подстроки, которые должны присутствовать в HTML, чтобы
+                страница считалась полностью отрендеренной
+            wait_required: Если True, таймаут ожидания wait_class - ошибка;
+                если False, возвращается то, что успело загрузиться
+
+        Returns:
+            HTML страницы
+
+        Raises:
+            FetchError, TimeoutException, OSError: При ошибках загрузки
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Освобождение ресурсов загрузчика"""
+
+
+class HttpFetcher(PageFetcher):
+    """
+    Загрузчик страниц через HTTP без браузера
+
+    Держит по одному keep-alive соединению на хост в каждом потоке,
+    запрашивает сжатие gzip/deflate и следует редиректам. С кэшем страниц
+    свежие записи отдаются без запроса, устаревшие перепроверяются условным
+    запросом.
+    """
+
+    name = "http"
+
+    def __init__(
+        self,
+        user_agent: str,
+        timeout: float = 15,
+        limiter: Any = None,
+        max_redirects: int = 5,
+        cache: Optional[PageCache] = None,
+    ) -> None:
+        """
+        Args:
+            user_agent: Заголовок User-Agent
+            timeout: Таймаут соединения и чтения (секунды)
+            limiter: Опциональный RateLimiter для ограничения частоты запросов
+            max_redirects: Максимальное количество редиректов
+            cache: Опциональный дисковый кэш страниц
+        """
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.limiter = limiter
+        self.max_redirects = max_redirects
+        self.cache = cache
+        self._local = threading.local()
+        # Соединения всех потоков (в том числе рабочих потоков DetailWorkerPool)
+        # для закрытия в close()
+        self._all_connections: List[Dict[Tuple[str, str], http.client.HTTPConnection]] = []
+        self._lock = threading.Lock()
+
+    def _connections(self) -> Dict[Tuple[str, str], http.client.HTTPConnection]:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = {}
+            self._local.connections = connections
+            with self._lock:
+                self._all_connections.append(connections)
+        return connections
+
+    def _get_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        """Возвращает keep-alive соединение потока для хоста"""
+        connections = self._connections()
+        key = (scheme, netloc)
+        conn = connections.get(key)
+        if conn is None:
+            conn_class = (
+                http.client.HTTPSConnection
+                if scheme == "https"
+                else http.client.HTTPConnection
+            )
+            conn = conn_class(netloc, timeout=self.timeout)
+            connections[key] = conn
+        return conn
+
+    def _drop_connection(self, scheme: str, netloc: str) -> None:
+        conn = self._connections().pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def request(
+        self, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[int, Dict[str, str], bytes, str]:
+        """
+        Выполнение GET запроса с переходом по редиректам
+
+        Args:
+            url: URL запроса
+            headers: Дополнительные заголовки запроса
+
+        Returns:
+            Кортеж (статус, заголовки ответа в нижнем регистре,
+            распакованное тело, итоговый URL после редиректов)
+        """
+        for _ in range(self.max_redirects + 1):
+            parts = urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path = f"{path}?{parts.query}"
+            request_headers = {
+                "User-Agent": self.user_agent,
+                "Accept": "text/html,application/xhtml+xml,*/*;q=0.8",
+                "Accept-Encoding": "gzip, deflate",
+                "Connection": "keep-alive",
+            }
+            if headers:
+                request_headers.update(headers)
+
+            if self.limiter is not None:
+                self.limiter.wait()
+
+            # Повторяем один раз, если сервер закрыл keep-alive соединение
+            for attempt in range(2):
+                conn = self._get_connection(parts.scheme, parts.netloc)
+                try:
+                    conn.request("GET", path, headers=request_headers)
+                    response = conn.getresponse()
+                    body = response.read()
+                    break
+                except (http.client.RemoteDisconnected, ConnectionError) as e:
+                    self._drop_connection(parts.scheme, parts.netloc)
+                    if attempt:
+                        raise
+                    logger.debug(f"Соединение закрыто сервером, переподключение: {e}")
+                except (OSError, http.client.HTTPException):
+                    self._drop_connection(parts.scheme, parts.netloc)
+                    raise
+
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            if response_headers.get("connection", "").lower() == "close":
+                self._drop_connection(parts.scheme, parts.netloc)
+
+            if response.status in REDIRECT_STATUSES and "location" in response_headers:
+                url = urljoin(url, response_headers["location"])
+                continue
+
+            return response.status, response_headers, self._decode_body(
+                body, response_headers.get("content-encoding", "")
+            ), url
+
+        raise FetchError(f"Слишком много редиректов: {url}")
+
+    @staticmethod
+    def _decode_body(body: bytes, content_encoding: str) -> bytes:
+        """Распаковка тела ответа по Content-Encoding"""
+        encoding = content_encoding.lower().strip()
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        return body
+
+    @staticmethod
+    def decode_text(body: bytes, headers: Dict[str, str]) -> str:
+        """Декодирование тела ответа в строку по charset из Content-Type"""
+        charset = "utf-8"
+        for param in headers.get("content-type", "").split(";")[1:]:
+            key, _, value = param.strip().partition("=")
+            if key.lower() == "charset" and value:
+                charset = value.strip("\"'")
+        try:
+            return body.decode(charset, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
+
+    def fetch(
+        self,
+        url: str,
+        wait_class: Optional[str] = None,
+        markers: Sequence[str] = (),
+        wait_required: bool = True,
+    ) -> str:
+        if self.cache is None:
+            status, headers, body, _ = self.request(url)
+            if status != 200:
+                raise FetchError(f"HTTP {status} при загрузке {url}")
+            return self.decode_text(body, headers)
+
+        entry = self.cache.get(url)
+        if entry is not None and self.cache.is_fresh(entry):
+            logger.debug(f"Страница из кэша: {url}")
+            return self.decode_text(entry.body, entry.headers)
+
+        request_headers = entry.conditional_headers() if entry is not None else None
+        status, headers, body, _ = self.request(url, request_headers)
+        if status == 304 and entry is not None:
+            logger.debug(f"Страница не изменилась (304): {url}")
+            self.cache.touch(entry, headers)
+            return self.decode_text(entry.body, entry.headers)
+        if status != 200:
+            raise FetchError(f"HTTP {status} при загрузке {url}")
+        self.cache.put(url, body, headers)
+        return self.decode_text(body, headers)
+
+    def close(self) -> None:
+        """Закрытие keep-alive соединений всех потоков"""
+        with self._lock:
+            all_connections = self._all_connections
+            self._all_connections = []
+        for connections in all_connections:
+            for conn in list(connections.values()):
+                conn.close()
+            connections.clear()
+        # Поток, продолжающий работу после close(), заведет новый словарь
+        self._local = threading.local()
+
+
+class SeleniumFetcher(PageFetcher):
+    """
+    Загрузчик страниц через Selenium WebDriver
+
+    WebDriver создается лениво при первом запросе, чтобы не запускать браузер,
+    если он так и не понадобится (например, в FallbackFetcher).
+    """
+
+    name = "selenium"
+
+    def __init__(
+        self,
+        driver_factory: Callable[[], Any],
+        page_load_timeout: float = 15,
+        limiter: Any = None,
+    ) -> None:
+        """
+        Args:
+            driver_factory: Функция создания WebDriver
+            page_load_timeout: Таймаут ожидания элемента wait_class (секунды)
+            limiter: Опциональный RateLimiter для ограничения частоты запросов
+        """
+        self._driver_factory = driver_factory
+        self.page_load_timeout = page_load_timeout
+        self.limiter = limiter
+        self._driver = None
+
+    @property
+    def driver(self) -> Any:
+        """WebDriver (создается при первом обращении)"""
+        if self._driver is None:
+            self._driver = self._driver_factory()
+        return self._driver
+
+    def fetch(
+        self,
+        url: str,
+        wait_class: Optional[str] = None,
+        markers: Sequence[str] = (),
+        wait_required: bool = True,
+    ) -> str:
+        driver = self.driver
+        if self.limiter is not None:
+            self.limiter.wait()
+        driver.get(url)
+        if wait_class:
+            try:
+                WebDriverWait(driver, self.page_load_timeout).until(
+                    EC.presence_of_element_located((By.CLASS_NAME, wait_class))
+                )
+            except TimeoutException:
+                if wait_required:
+                    raise
+                logger.warning(f"Таймаут при загрузке страницы: {url}")
+        return driver.page_source
+
+    def close(self) -> None:
+        if self._driver is not None:
+            self._driver.quit()
+            self._driver = None
+            logger.info("WebDriver закрыт")
+
+
+class FallbackFetcher(PageFetcher):
+    """
+    Загрузчик HTTP с резервным Selenium
+
+    Сначала загружает страницу обычным HTTP-запросом. Если запрос не удался
+    или в HTML нет ожидаемых маркеров (страница рендерится на клиенте),
+    страница загружается через Selenium.
+    """
+
+    name = "auto"
+
+    def __init__(self, primary: PageFetcher, fallback: PageFetcher) -> None:
+        """
+        Args:
+            primary: Основной загрузчик (HttpFetcher)
+            fallback: Резервный загрузчик (SeleniumFetcher)
+        """
+        self.primary = primary
+        self.fallback = fallback
+
+    def fetch(
+        self,
+        url: str,
+        wait_class: Optional[str] = None,
+        markers: Sequence[str] = (),
+        wait_required: bool = True,
+    ) -> str:
+        try:
+            html = self.primary.fetch(url, wait_class, markers, wait_required)
+            if all(marker in html for marker in markers):
+                return html
+            logger.info(
+                f"В HTML нет маркеров {list(markers)}, загрузка через Selenium: {url}"
+            )
+        except (FetchError, OSError, http.client.HTTPException) as e:
+            logger.warning(f"HTTP загрузка не удалась ({e}), загрузка через Selenium: {url}")
+        return self.fallback.fetch(url, wait_class, markers, wait_required)
+
+    def close(self) -> None:
+        self.primary.close()
+        self.fallback.close()
+
+
+def create_fetcher(
+    backend: str,
+    driver_factory: Callable[[], Any],
+    user_agent: str,
+    timeout: float = 15,
+    limiter: Any = None,
+    cache: Optional[PageCache] = None,
+) -> PageFetcher:
+    """
+    Создание загрузчика страниц по названию backend
+
+    Args:
+        backend: "http", "selenium" или "auto" (HTTP с резервным Selenium)
+        driver_factory: Функция создания WebDriver для Selenium
+        user_agent: Заголовок User-Agent для HTTP-запросов
+        timeout: Таймаут загрузки страницы (секунды)
+        limiter: Опциональный RateLimiter, общий для всех загрузчиков
+        cache: Опциональный кэш страниц для HTTP-загрузчика (Selenium
+            не поддерживает условные запросы и всегда загружает страницу)
+
+    Returns:
+        Экземпляр PageFetcher
+
+    Raises:
+        ValueError: При неизвестном названии backend
+    """
+    backend = (backend or "auto").lower()
+    if backend == "http":
+        return HttpFetcher(user_agent, timeout=timeout, limiter=limiter, cache=cache)
+    if backend == "selenium":
+        return SeleniumFetcher(driver_factory, timeout, limiter=limiter)
+    if backend == "auto":
+        return FallbackFetcher(
+            HttpFetcher(user_agent, timeout=timeout, limiter=limiter, cache=cache),
+            SeleniumFetcher(driver_factory, timeout, limiter=limiter),
+        )
+    raise ValueError(f"Неизвестный FETCH_BACKEND: {backend}")
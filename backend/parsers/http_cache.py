@@ -0,0 +1,160 @@
+"""
+Дисковый кэш загруженных страниц
+
+Для каждого URL хранится тело ответа, валидаторы (ETag, Last-Modified)
+и время загрузки. Страницы моложе TTL отдаются без обращения к сайту,
+более старые перепроверяются условным запросом
+(If-None-Match / If-Modified-Since): ответ 304 лишь продлевает запись.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """Запись кэша страницы"""
+
+    url: str
+    body: bytes
+    headers: Dict[str, str]
+    fetched_at: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    @property
+    def age(self) -> float:
+        """Возраст записи (секунды)"""
+        return time.time() - self.fetched_at
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Заголовки условного запроса для перепроверки записи"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """
+    Кэш страниц на диске
+
+    Запись хранится в двух файлах, имя которых - sha256 от URL:
+    <hash>.body (тело ответа) и <hash>.json (метаданные). Файлы записываются
+    атомарно, поэтому кэш можно использовать из нескольких потоков
+    и процессов.
+    """
+
+    # Заголовки ответа, сохраняемые вместе с телом
+    STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+    def __init__(self, cache_dir: str, ttl: float = 0) -> None:
+        """
+        Args:
+            cache_dir: Каталог кэша (создается при необходимости)
+            ttl: Время (секунды), в течение которого запись считается свежей
+                и отдается без запроса к сайту. 0 - всегда перепроверять
+        """
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, url: str) -> Tuple[str, str]:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key[:2], key)
+        return f"{base}.body", f"{base}.json"
+
+    @staticmethod
+    def _write_atomic(path: str, data: bytes) -> None:
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Запись кэша для URL или None, если ее нет или она повреждена"""
+        body_path, meta_path = self._paths(url)
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Поврежденная запись кэша для {url}: {e}")
+            return None
+        return CacheEntry(
+            url=url,
+            body=body,
+            headers=meta.get("headers", {}),
+            fetched_at=meta.get("fetched_at", 0),
+        )
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Запись моложе TTL и может использоваться без перепроверки"""
+        return self.ttl > 0 and entry.age < self.ttl
+
+    def _write_meta(self, url: str, headers: Dict[str, str]) -> None:
+        _, meta_path = self._paths(url)
+        meta = {"url": url, "headers": headers, "fetched_at": time.time()}
+        self._write_atomic(
+            meta_path, json.dumps(meta, ensure_ascii=False).encode("utf-8")
+        )
+
+    def put(self, url: str, body: bytes, headers: Dict[str, str]) -> None:
+        """
+        Сохранение ответа в кэш
+
+        Args:
+            url: URL страницы
+            body: Распакованное тело ответа
+            headers: Заголовки ответа (ключи в нижнем регистре)
+        """
+        body_path, _ = self._paths(url)
+        stored = {k: headers[k] for k in self.STORED_HEADERS if k in headers}
+        try:
+            # Тело пишется первым: метаданные без тела считаются промахом
+            self._write_atomic(body_path, body)
+            self._write_meta(url, stored)
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить страницу в кэш {url}: {e}")
+
+    def touch(self, entry: CacheEntry, headers: Dict[str, str]) -> None:
+        """
+        Продление записи после ответа 304 Not Modified
+
+        Args:
+            entry: Перепроверенная запись
+            headers: Заголовки ответа 304 (могут содержать новые валидаторы)
+        """
+        stored = dict(entry.headers)
+        stored.update({k: headers[k] for k in ("etag", "last-modified") if k in headers})
+        try:
+            self._write_meta(entry.url, stored)
+        except OSError as e:
+            logger.warning(f"Не удалось обновить запись кэша {entry.url}: {e}")
@@ -0,0 +1,68 @@
+"""
+Разбор карточки товара в каталоге (цена)
+
+Используется парсером (azbuka_tepla.py) и командой reparse_boilers, которая
+повторно извлекает цену из сохраненного HTML карточки (raw_listing_html).
+Модуль не зависит от Django и не настраивает логирование при импорте.
+"""
+import re
+from typing import Optional
+
+from bs4 import BeautifulSoup
+
+# Цена товара, если в карточке ее нет или она не содержит цифр
+DEFAULT_PRICE = "Цену и наличие товара уточняйте у продавца"
+
+# Паттерн для очистки цены от нецифровых символов
+# Оставляет только цифры, запятые, точки и пробелы
+# Используется для нормализации цен перед сохранением
+REGEX_PRICE_CLEANUP = r"[^\d,.\s]"
+
+
+def extract_card_price(card: BeautifulSoup) -> Optional[str]:
+    """
+    Текст цены из карточки товара
+
+    Args:
+        card: Элемент карточки товара (li) или разобранный HTML карточки
+
+    Returns:
+        Цена как на странице или None, если элемент цены не найден
+    """
+    price_element = card.find(
+        "span", class_="woocommerce-Price-amount amount"
+    ) or card.find("span", class_=lambda x: x and "price" in x.lower() if x else False)
+    if not price_element:
+        return None
+    return price_element.text.strip()
+
+
+def price_from_listing_html(listing_html: str) -> Optional[str]:
+    """
+    Текст цены из сохраненного HTML карточки (raw_listing_html)
+
+    Returns:
+        Цена как на странице или None, если элемент цены не найден
+    """
+    if not listing_html:
+        return None
+    return extract_card_price(BeautifulSoup(listing_html, "lxml"))
+
+
+def normalize_price(price: Optional[str]) -> str:
+    """
+    Нормализация цены перед сохранением
+
+    Examples:
+        "12 500,00 BYN" -> "12 500,00"; "" -> DEFAULT_PRICE
+    """
+    # Если цена не указана или пустая, устанавливаем значение по умолчанию
+    if not price or price.strip() == "":
+        return DEFAULT_PRICE
+    # "Цену и наличие уточняйте..." сохраняется как есть
+    if "уточняйте" in price.lower():
+        return price
+    # Извлекаем только цифры и знаки
+    price = re.sub(REGEX_PRICE_CLEANUP, "", price).strip()
+    # Если после нормализации цена стала пустой, устанавливаем значение по умолчанию
+    return price or DEFAULT_PRICE
@@ -0,0 +1,461 @@
+"""
+Асинхронный конвейер парсинга azbukatepla.by
+
+Этапы связаны ограниченными очередями asyncio (обратное давление):
+поиск страниц -> список товаров -> детали товаров (+ проверка изображений)
+-> разбор характеристик -> пакетная запись в БД.
+У каждого этапа свой лимит параллельности (PARSER_CONFIG["PIPELINE_*"]).
+Товары записываются в БД небольшими батчами по мере готовности, не дожидаясь
+накопления BATCH_SIZE товаров.
+
+Журнал прогресса (PARSER_CONFIG["CHECKPOINT_*"], parsers.checkpoint) ведется
+по товарам: после прерванного запуска загруженные товары не загружаются
+повторно, а не записанные в БД записываются первыми. Страницы каталога
+загружаются заново (отметки страниц ведет только parse_azbuka_tepla()).
+
+Запуск: python parsers/pipeline.py
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# Получаем абсолютный путь к корню проекта
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+# Локальные импорты (azbuka_tepla настраивает Django и логирование)
+from parsers.azbuka_tepla import (  # noqa: E402
+    DetailWorkerPool,
+    build_product_data,
+    check_image_availability,
+    extract_product_cards,
+    get_all_pages_urls,
+    load_existing_products,
+    navigate_to_page,
+    open_checkpoint,
+    prepare_boiler_object,
+    remember_saved_products,
+    save_boiler_objects,
+    url,
+)
+from parsers.checkpoint import CrawlCheckpoint  # noqa: E402
+from parsers.config import PARSER_CONFIG  # noqa: E402
+from products.snapshots import publish_snapshots_on_commit  # noqa: E402
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+# Сигнал завершения для этапа записи в БД
+_STOP = object()
+
+
+class CrawlPipeline:
+    """
+    Асинхронный конвейер парсинга каталога.
+
+    Загрузка страниц выполняется в потоках DetailWorkerPool (у каждого потока
+    свой загрузчик), запись в БД - через sync_to_async в одном потоке.
+    """
+
+    def __init__(
+        self,
+        start_url: str,
+        existing_names: Set[str],
+        pool: DetailWorkerPool,
+        check_images: Optional[bool] = None,
+        existing_fingerprints: Optional[Dict[str, str]] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+    ) -> None:
+        """
+        Args:
+            start_url: URL первой страницы каталога
+            existing_names: Множество названий существующих товаров в БД
+                (пополняется по мере записи батчей)
+            pool: Пул загрузчиков страниц
+            check_images: Проверять доступность изображений. Если не указан,
+                используется PARSER_CONFIG["CHECK_IMAGE_AVAILABILITY"]
+            existing_fingerprints: Отпечатки карточек существующих товаров
+                (инкрементальный режим, см. extract_product_cards)
+            checkpoint: Журнал прогресса (None - без продолжения запуска)
+        """
+        self.start_url = start_url
+        self.existing_names = existing_names
+        self.existing_fingerprints = existing_fingerprints
+        self.pool = pool
+        if check_images is None:
+            check_images = PARSER_CONFIG.get("CHECK_IMAGE_AVAILABILITY", False)
+        self.check_images = check_images
+        self.checkpoint = checkpoint
+        # Товары, загруженные прерванным запуском (по журналу прогресса)
+        self._done_products: Set[str] = (
+            checkpoint.completed_products() if checkpoint is not None else set()
+        )
+
+        queue_size = PARSER_CONFIG["PIPELINE_QUEUE_SIZE"]
+        self.pages_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.products_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.parse_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.save_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.image_semaphore = asyncio.Semaphore(
+            PARSER_CONFIG["PIPELINE_IMAGE_CHECK_CONCURRENCY"]
+        )
+
+        # Товары, уже поставленные в очередь в этом запуске
+        # (один товар может встречаться на нескольких страницах)
+        self._queued_urls: Set[str] = set()
+
+        self.stats = {
+            "pages": 0,
+            "products": 0,
+            "created": 0,
+            "updated": 0,
+            "errors": 0,
+            "skipped": 0,
+            "skipped_existing": 0,
+            "skipped_checkpoint": 0,
+        }
+
+    async def _run_in_pool(self, func: Any, *args: Any) -> Any:
+        """Выполнение func(fetcher, *args) в потоке пула загрузчиков"""
+        return await asyncio.wrap_future(self.pool.submit_with_fetcher(func, *args))
+
+    def _start_workers(
+        self, queue: asyncio.Queue, handler: Any, concurrency: int, stage: str
+    ) -> List[asyncio.Task]:
+        """
+        Запуск воркеров этапа.
+
+        Каждый воркер берет элементы из queue и передает их в handler. Ошибки
+        обработчика логируются и не останавливают этап.
+        """
+
+        async def worker() -> None:
+            while True:
+                item = await queue.get()
+                try:
+                    await handler(item)
+                except Exception as e:
+                    self.stats["errors"] += 1
+                    logger.error(f"Ошибка на этапе '{stage}': {e}")
+                finally:
+                    queue.task_done()
+
+        return [
+            asyncio.create_task(worker(), name=f"{stage}-{i}")
+            for i in range(max(1, concurrency))
+        ]
+
+    async def _discover_pages(self) -> None:
+        """Этап 1: поиск страниц пагинации каталога"""
+        page_urls = await self._run_in_pool(get_all_pages_urls, self.start_url)
+        logger.info(f"Будет обработано страниц: {len(page_urls)}")
+        for page_url in page_urls:
+            await self.pages_queue.put(page_url)
+
+    async def _list_products(self, page_url: str) -> None:
+        """Этап 2: загрузка страницы каталога и извлечение карточек товаров"""
+        page_source = await self._run_in_pool(navigate_to_page, page_url)
+        if page_source is None:
+            logger.error(f"Не удалось загрузить страницу: {page_url}")
+            self.stats["errors"] += 1
+            return
+
+        soup = BeautifulSoup(page_source, "lxml")
+        candidates, errors, skipped, skipped_existing = extract_product_cards(
+            soup, page_url, self.existing_names, self.existing_fingerprints
+        )
+        self.stats["pages"] += 1
+        self.stats["errors"] += errors
+        self.stats["skipped"] += skipped
+        self.stats["skipped_existing"] += skipped_existing
+
+        for candidate in candidates:
+            product_url = candidate[2]
+            if product_url in self._queued_urls:
+                continue
+            if product_url in self._done_products:
+                self.stats["skipped_checkpoint"] += 1
+                continue
+            self._queued_urls.add(product_url)
+            await self.products_queue.put(candidate)
+
+    async def _check_image(self, image_url: str) -> bool:
+        async with self.image_semaphore:
+            return await asyncio.to_thread(check_image_availability, image_url)
+
+    async def _fetch_details(self, candidate: Tuple[str, str, str, str, str]) -> None:
+        """Этап 3: загрузка страницы товара и проверка изображений"""
+        name, price, product_url, fingerprint, listing_html = candidate
+        logger.info(f"Обработка товара: {name}")
+        # Изображения проверяются ниже параллельно, а не внутри загрузки страницы
+        details = await asyncio.wrap_future(
+            self.pool.submit(product_url, check_images=False)
+        )
+
+        if self.check_images and details.get("image_urls"):
+            image_urls = details["image_urls"]
+            available = await asyncio.gather(
+                *(self._check_image(image_url) for image_url in image_urls)
+            )
+            details["image_urls"] = [
+                image_url for image_url, ok in zip(image_urls, available) if ok
+            ]
+
+        await self.parse_queue.put(
+            (name, price, product_url, fingerprint, listing_html, details)
+        )
+
+    async def _parse_product(
+        self, item: Tuple[str, str, str, str, str, Dict[str, Any]]
+    ) -> None:
+        """Этап 4: валидация данных и разбор характеристик"""
+        name, price, product_url, fingerprint, listing_html, details = item
+        product_data = build_product_data(
+            name, price, product_url, details, fingerprint, listing_html
+        )
+        if product_data is None:
+            self.stats["errors"] += 1
+            return
+        if self.checkpoint is not None:
+            await asyncio.to_thread(self.checkpoint.record_products, [product_data])
+        boiler = await asyncio.to_thread(prepare_boiler_object, product_data)
+        await self.save_queue.put(boiler)
+
+    async def _save_batch(self, boilers: List[Any]) -> None:
+        """
+        Запись батча в БД (создание новых и обновление существующих товаров)
+
+        Ошибка записи не останавливает этап: товары батча считаются ошибками
+        и не отмечаются в журнале прогресса, следующий запуск загрузит их снова.
+        """
+        products_to_create = [b for b in boilers if b.name not in self.existing_names]
+        products_to_update = [b for b in boilers if b.name in self.existing_names]
+        try:
+            created, updated, errors = await sync_to_async(
+                save_boiler_objects, thread_sensitive=True
+            )(products_to_create, products_to_update)
+        except Exception as e:
+            logger.error(f"Ошибка записи батча ({len(boilers)} товаров): {e}")
+            self.stats["errors"] += len(boilers)
+            return
+        self.stats["created"] += created
+        self.stats["updated"] += updated
+        self.stats["errors"] += errors
+        self.stats["products"] += len(boilers)
+        if self.checkpoint is not None and not errors:
+            await asyncio.to_thread(
+                self.checkpoint.mark_saved,
+                [{"product_url": b.product_url} for b in boilers],
+            )
+        remember_saved_products(
+            [
+                {"name": b.name, "listing_fingerprint": b.listing_fingerprint}
+                for b in boilers
+            ],
+            self.existing_names,
+            self.existing_fingerprints,
+        )
+        logger.info(
+            f"Батч сохранен: создано={created}, обновлено={updated}, ошибок={errors}"
+        )
+
+    async def _saver(self) -> None:
+        """
+        Этап 5: пакетная запись в БД.
+
+        Батч записывается при достижении PIPELINE_SAVE_BATCH_SIZE или,
+        если новые товары не поступают, по истечении PIPELINE_FLUSH_INTERVAL.
+        """
+        batch_size = PARSER_CONFIG["PIPELINE_SAVE_BATCH_SIZE"]
+        flush_interval = PARSER_CONFIG["PIPELINE_FLUSH_INTERVAL"]
+        buffer: List[Any] = []
+
+        while True:
+            try:
+                item = await asyncio.wait_for(
+                    self.save_queue.get(), timeout=flush_interval
+                )
+            except asyncio.TimeoutError:
+                if buffer:
+                    await self._save_batch(buffer)
+                    buffer = []
+                continue
+
+            self.save_queue.task_done()
+            if item is _STOP:
+                break
+            buffer.append(item)
+            if len(buffer) >= batch_size:
+                await self._save_batch(buffer)
+                buffer = []
+
+        if buffer:
+            await self._save_batch(buffer)
+
+    @staticmethod
+    async def _until_done(awaitable: Any, saver: asyncio.Task) -> None:
+        """
+        Ожидание awaitable, пока работает этап записи
+
+        Если этап записи завершился с ошибкой, очереди перед ним больше
+        не разбираются: ожидание прерывается исключением этапа записи.
+        """
+        waiter = asyncio.ensure_future(awaitable)
+        await asyncio.wait({waiter, saver}, return_when=asyncio.FIRST_COMPLETED)
+        if waiter.done():
+            waiter.result()
+            return
+        waiter.cancel()
+        saver.result()
+        raise RuntimeError("Этап записи в БД завершился раньше остальных этапов")
+
+    async def _join(self, queue: asyncio.Queue, saver: asyncio.Task) -> None:
+        """Ожидание обработки всех элементов очереди (см. _until_done)"""
+        await self._until_done(queue.join(), saver)
+
+    async def _put_save(self, item: Any, saver: asyncio.Task) -> None:
+        """Постановка элемента в очередь записи (см. _until_done)"""
+        await self._until_done(self.save_queue.put(item), saver)
+
+    async def run(self) -> Dict[str, int]:
+        """
+        Запуск конвейера до обработки всех страниц.
+
+        Returns:
+            Словарь со статистикой запуска
+        """
+        workers = (
+            self._start_workers(
+                self.pages_queue,
+                self._list_products,
+                PARSER_CONFIG["PIPELINE_LIST_CONCURRENCY"],
+                "list",
+            )
+            + self._start_workers(
+                self.products_queue,
+                self._fetch_details,
+                PARSER_CONFIG["PIPELINE_DETAIL_CONCURRENCY"],
+                "details",
+            )
+            + self._start_workers(
+                self.parse_queue,
+                self._parse_product,
+                PARSER_CONFIG["PIPELINE_PARSE_CONCURRENCY"],
+                "parse",
+            )
+        )
+        saver = asyncio.create_task(self._saver(), name="save")
+
+        try:
+            # Товары прерванного запуска, загруженные, но не записанные в БД
+            if self.checkpoint is not None:
+                for product_data in self.checkpoint.pending_products():
+                    boiler = await asyncio.to_thread(prepare_boiler_object, product_data)
+                    await self._put_save(boiler, saver)
+            await self._discover_pages()
+            # Очереди завершаются по порядку этапов: элемент попадает
+            # в следующую очередь до task_done() в предыдущей
+            for queue in (self.pages_queue, self.products_queue, self.parse_queue):
+                await self._join(queue, saver)
+            await self._put_save(_STOP, saver)
+            await saver
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if not saver.done():
+                saver.cancel()
+
+        return self.stats
+
+
+def parse_azbuka_tepla_async() -> None:
+    """
+    Парсинг azbukatepla.by асинхронным конвейером.
+
+    Аналог parse_azbuka_tepla() с потоковой записью в БД: загрузка страниц
+    каталога и товаров, проверка изображений и запись выполняются параллельно
+    с ограничением параллельности каждого этапа.
+
+    Журнал прогресса удаляется, только если запуск завершился без ошибок.
+
+    Returns:
+        None. Результаты работы логируются в консоль и файл.
+    """
+    pool = None
+    checkpoint = None
+    start_time = time.time()
+    try:
+        logger.info("=" * 50)
+        logger.info("Начало парсинга azbukatepla.by (асинхронный конвейер)")
+        logger.info(f"Ищем товары марок: {', '.join(PARSER_CONFIG['TARGET_BRANDS'])}")
+        logger.info("=" * 50)
+
+        # Загружаем существующие названия товаров в память для оптимизации
+        existing_names, existing_fingerprints = load_existing_products()
+        logger.info(f"Найдено существующих товаров в БД: {len(existing_names)}")
+
+        # Потоков пула хватает на все одновременно загружаемые страницы
+        pool = DetailWorkerPool(
+            PARSER_CONFIG["PIPELINE_LIST_CONCURRENCY"]
+            + PARSER_CONFIG["PIPELINE_DETAIL_CONCURRENCY"]
+        )
+        checkpoint = open_checkpoint()
+        if checkpoint is not None and checkpoint.is_resumed:
+            logger.info("Продолжение прерванного запуска по журналу прогресса")
+        stats = asyncio.run(
+            CrawlPipeline(
+                url,
+                existing_names,
+                pool,
+                existing_fingerprints=existing_fingerprints,
+                checkpoint=checkpoint,
+            ).run()
+        )
+
+        if checkpoint is not None:
+            if stats["errors"] == 0:
+                checkpoint.clear()
+                checkpoint = None
+            else:
+                logger.warning(
+                    f"Запуск завершен с ошибками, журнал прогресса сохранен "
+                    f"в {checkpoint.path}: повторный запуск не будет загружать "
+                    "уже загруженные товары"
+                )
+
+        logger.info("=" * 50)
+        logger.info(f"Парсинг завершен за {time.time() - start_time:.1f}с")
+        logger.info(f"Обработано страниц: {stats['pages']}")
+        logger.info(
+            f"Успешно обработано товаров: {stats['created'] + stats['updated']}"
+        )
+        logger.info(f"Пропущено (не целевые марки): {stats['skipped']}")
+        logger.info(f"Пропущено (уже в БД): {stats['skipped_existing']}")
+        logger.info(f"Пропущено (журнал прогресса): {stats['skipped_checkpoint']}")
+        logger.info(f"Ошибок: {stats['errors']}")
+        logger.info("=" * 50)
+
+        # Статические снимки каталога для чтения без Django и БД
+        if stats["created"] or stats["updated"]:
+            publish_snapshots_on_commit()
+
+    except Exception as e:
+        logger.critical(f"Критическая ошибка парсера: {e}")
+        import traceback
+
+        logger.critical(traceback.format_exc())
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+        if pool:
+            pool.close()
+
+
+if __name__ == "__main__":
+    parse_azbuka_tepla_async()
@@ -1,104 +1,368 @@
 """
 Модуль для парсинга технических характеристик
 Разбивает большую функцию parse_specifications на более мелкие части
+
+Здесь же находятся общие правила разбора (маппинг названий характеристик на
+поля модели, марки со специальной обработкой мощности, признаки выносного
+бака ГВС), разбор мощности, ГВС и напряжения (в том числе из описания товара)
+и extract_spec_fields, которую используют парсер azbuka_tepla.py и команда
+reparse_boilers.
+
+Модуль не зависит от Django и не настраивает логирование при импорте:
+его можно импортировать в процессах-воркерах reparse_boilers.
 """
 import re
-from typing import Dict
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+# Маппинг названий характеристик на поля модели ElectricBoiler
+# Учитываем различные варианты написания. Порядок важен: строка относится
+# к первому по порядку ключу, который входит в ее название
+FIELD_MAPPING: Dict[str, str] = {
+    "Мощность до , кВт": "power",
+    "Максимальная тепловая мощность": "power",
+    "Максимальная мощность": "power",
+    "Мощность": "power",
+    "Мощность, кВт": "power",
+    "Мощность (кВт)": "power",
+    "Регулировка мощности": "power_regulation",
+    "Регулировка": "power_regulation",
+    "Площадь отопления": "heating_area",
+    "Площадь отопления, рекомендуемая до": "heating_area",
+    "Площадь отопления (м²)": "heating_area",
+    "Начальный вариант работы": "work_type",
+    "Режим работы": "work_type",
+    "Возможность для работы самостоятельно": "self_work",
+    "Автономная работа": "self_work",
+    "Возможность для нагрева воды": "water_heating",
+    "Нагрев воды": "water_heating",
+    "ГВС (вода)": "water_heating",
+    "ГВС": "water_heating",
+    "DHW (water)": "water_heating",
+    "DHW": "water_heating",
+    "Возможность нагрева теплого пола": "floor_heating",
+    "Теплый пол": "floor_heating",
+    "Расширительный бак": "expansion_tank",
+    "Объем расширительного бака": "expansion_tank",
+    "Expansion tank volume": "expansion_tank",
+    "Циркуляционный насос": "circulation_pump",
+    "Насос": "circulation_pump",
+    "Питание от сети": "voltage",
+    "Питание от сети, Вольт": "voltage",
+    "Напряжение": "voltage",
+    "Напряжение (В)": "voltage",
+    "Кабель подключения": "cable",
+    "Кабель": "cable",
+    "Предохранитель": "fuse",
+    "Предохранитель, А": "fuse",
+    "Предохранитель (А)": "fuse",
+    "Диапазон выбираемых температур": "temp_range",
+    "Диапазон температур": "temp_range",
+    "Температура радиаторного отопления": "temp_range_radiator",
+    "Температура теплого пола": "temp_range_floor",
+    "Подключение к системе": "connection",
+    "Подключение": "connection",
+    "Габаритные размеры": "dimensions",
+    "Размеры": "dimensions",
+    "Размеры (мм)": "dimensions",
+    "WiFi": "wifi",
+    "Возможность подключения WiFi": "wifi",
+    "Wi-Fi": "wifi",
+    "Возможность подключения комнатного термостата": "thermostat",
+    "Комнатный термостат": "thermostat",
+    "Комнатный термостат в комплекте": "thermostat_included",
+    "Термостат в комплекте": "thermostat_included",
+    "Возможно подключение датчика уличной температуры": "outdoor_sensor",
+    "Датчик уличной температуры": "outdoor_sensor",
+}
+
+# Поля модели, значения которых получаются из текста характеристик
+SPEC_FIELDS = tuple(dict.fromkeys(FIELD_MAPPING.values()))
+
+# Марки, для которых мощность извлекается из "Максимальная тепловая мощность"
+# и "Регулировка мощности"
+POWER_TARGET_BRANDS = (
+    "vaillant",
+    "eloblock",
+    "protherm",
+    "скат",
+    "teknix",
+    "espro",
+    "tecline",
+)
+
+# Признаки нагрева воды в выносном баке
+EXTERNAL_TANK_INDICATORS = (
+    "в выносном баке",
+    "внешний бак",
+    "выносной бак",
+    "external tank",
+    "внешнем баке",
+)
+
+# Значения, означающие отсутствие характеристики
+EMPTY_SPEC_VALUES = ("Ø", "", "-", "—", "нет", "no")
+
+# Паттерн для извлечения числовых значений (мощность, диапазоны)
+# Извлекает: целые числа, десятичные числа (с точкой или запятой),
+# диапазоны чисел (например: "6-12", "3.5-7.5")
+# Примеры совпадений: "6", "12.5", "3,5", "6-12", "3.5-7.5"
+REGEX_POWER_NUMERIC_VALUE = r"(\d+(?:[.,]\d+)?(?:\s*-\s*\d+(?:[.,]\d+)?)?)"
+
+# Паттерн для удаления единиц измерения "кВт" из значений мощности
+# Удаляет "кВт", "квт", "КВт" и т.д. с любым количеством пробелов вокруг
+REGEX_REMOVE_KW_UNIT = r"\s*квт\s*"
+
+# Паттерн для удаления единиц измерения ГВС с числовым значением
+# Удаляет паттерны типа "12.5 л/мин", "10 л/мин" и т.д.
+# Поддерживает различные варианты написания: л/мин, л\/мин, l/min, l\/min
+REGEX_REMOVE_DHW_UNIT_WITH_NUMBER = (
+    r"\s*\d+(?:[.,]\d+)?\s*(?:л/мин|л\/мин|l/min|l\/min|л/мин\.?)\s*"
+)
+
+# Паттерн для удаления единиц измерения ГВС без числового значения
+# Удаляет просто "л/мин" без предшествующего числа
+REGEX_REMOVE_DHW_UNIT_SIMPLE = r"\s*(?:л/мин|л\/мин|l/min|l\/min|л/мин\.?)\s*"
+
+# Паттерн для извлечения простого числового значения (без диапазона)
+# Используется для извлечения мощности из уже найденного значения
+# Примеры совпадений: "6", "12.5", "3,5"
+REGEX_SIMPLE_NUMERIC_VALUE = r"(\d+(?:[.,]\d+)?)"
 
+# Паттерн для поиска напряжения для котлов 6 и 9 кВт
+# Ищет текст типа: "котлы мощностью 6 кВт и 9 кВт ... могут работать ...
+# от сети ... с напряжением ~220 В и ~380 В"
+# Извлекает часть с напряжением (220 В и 380 В)
+REGEX_VOLTAGE_6_9_KW = (
+    r"котлы\s+мощностью\s+6\s+квт\s+и\s+9\s+квт"
+    r".*?(?:могут\s+работать|работать)"
+    r".*?(?:от\s+сети|сети)"
+    r".*?(?:с\s+напряжением|напряжением)\s*"
+    r"(~?\s*220\s*в\s+и\s+~?\s*380\s*в)"
+)
 
-def extract_power_for_target_brands(specs_text: str, product_name: str) -> Dict[str, str]:
+# Паттерн для поиска напряжения для котлов 12+ кВт (обычный вариант)
+# Ищет текст типа: "модели ... начиная с 12 кВт ... могут работать ...
+# только от сети ... напряжением ~380 В"
+REGEX_VOLTAGE_12_PLUS_KW = (
+    r"модели.*?начиная\s+с\s+12\s+квт"
+    r".*?(?:могут\s+работать|работать)"
+    r".*?(?:только\s+от\s+сети|от\s+сети)"
+    r".*?(?:мощностью|напряжением)\s*"
+    r"(~?\s*380\s*в)"
+)
+
+# Паттерн для поиска напряжения для котлов 12+ кВт (вариант с "Важно")
+# Ищет текст типа: "важно ... модели ... начиная с 12 кВт ...
+# могут работать ... только от сети ... напряжением ~380 В"
+REGEX_VOLTAGE_12_PLUS_KW_IMPORTANT = (
+    r"важно.*?модели.*?начиная\s+с\s+12\s+квт"
+    r".*?(?:могут\s+работать|работать)"
+    r".*?(?:только\s+от\s+сети|от\s+сети)"
+    r".*?(?:мощностью|напряжением)\s*"
+    r"(~?\s*380\s*в)"
+)
+
+# Паттерн для удаления символа "~" (тильда) из текста напряжения
+REGEX_REMOVE_TILDE = r"~"
+
+# Все ключи маппинга в одном регулярном выражении: lookahead находит в каждой
+# позиции названия первый по порядку ключ, начинающийся в ней, а номер группы
+# совпадения - это индекс ключа в FIELD_MAPPING
+_FIELD_MAPPING_FIELDS = list(FIELD_MAPPING.values())
+_FIELD_MAPPING_PATTERN = re.compile(
+    "(?=(?:"
+    + "|".join(f"({re.escape(key.lower())})" for key in FIELD_MAPPING)
+    + "))"
+)
+
+
+@lru_cache(maxsize=2048)
+def classify_spec_key(key_lower: str) -> Optional[str]:
     """
-    Извлечение мощности для целевых марок котлов
+    Определение поля модели по названию характеристики
+
+    Правила приоритета для ГВС и объема расширительного бака проверяются
+    первыми, затем выбирается первый по порядку ключ FIELD_MAPPING,
+    входящий в название. Названий характеристик немного, поэтому результат
+    кэшируется.
 
     Args:
-        specs_text: Текст характеристик
-        product_name: Название товара
+        key_lower: Название характеристики в нижнем регистре
 
     Returns:
-        dict: Словарь с извлеченными значениями мощности
+        Имя поля модели или None, если характеристика не используется
     """
-    result = {}
-    target_brands_for_power_extraction = [
-        "vaillant",
-        "eloblock",
-        "protherm",
-        "скат",
-        "teknix",
-        "espro",
-        "tecline",
-    ]
+    # Специальная проверка для ГВС (приоритет)
+    if "гвс" in key_lower or "dhw" in key_lower:
+        # Проверяем наличие упоминания воды или если это просто ГВС/DHW
+        if (
+            "вода" in key_lower
+            or "water" in key_lower
+            or key_lower.strip() in ("гвс", "dhw")
+        ):
+            return "water_heating"
 
-    is_target_brand = any(
-        brand in product_name.lower() for brand in target_brands_for_power_extraction
-    )
+    # Специальная проверка для объема расширительного бака (приоритет)
+    if "объем расширительного бака" in key_lower or "expansion tank volume" in key_lower:
+        return "expansion_tank"
+
+    best_index = None
+    for match in _FIELD_MAPPING_PATTERN.finditer(key_lower):
+        if best_index is None or match.lastindex < best_index:
+            best_index = match.lastindex
+            if best_index == 1:
+                break
+    if best_index is None:
+        return None
+    return _FIELD_MAPPING_FIELDS[best_index - 1]
 
-    if not is_target_brand:
-        return result
 
-    max_power_found = False
+def split_spec_lines(specs_text: str) -> List[Tuple[str, str, str]]:
+    """
+    Разбиение текста характеристик на строки "Ключ: Значение"
 
+    Args:
+        specs_text: Текст характеристик
+
+    Returns:
+        Список кортежей (строка, ключ в нижнем регистре, значение) для строк,
+        содержащих двоеточие
+    """
+    result = []
     for line in specs_text.split("\n"):
         if ":" not in line:
             continue
+        key, value = line.split(":", 1)
+        result.append((line, key.strip().lower(), value.strip()))
+    return result
 
-        key = line.split(":")[0].strip().lower()
-        value = line.split(":", 1)[1].strip() if ":" in line else ""
 
-        # Проверяем "Максимальная тепловая мощность" (приоритет)
-        if (
-            "максимальная тепловая мощность" in key
-            and value
-            and not max_power_found
-        ):
-            value_clean = value.strip()
-            power_match = re.search(
-                r"(\d+(?:[.,]\d+)?(?:\s*-\s*\d+(?:[.,]\d+)?)?)", value_clean
-            )
-            if power_match:
-                result["power"] = power_match.group(1).strip()
-                max_power_found = True
-            else:
-                power_value_clean = re.sub(
-                    r"\s*квт\s*", "", value_clean, flags=re.IGNORECASE
-                ).strip()
-                result["power"] = (
-                    power_value_clean if power_value_clean else value_clean
-                )
-                max_power_found = True
-
-        # Проверяем "Регулировка мощности"
-        elif "регулировка мощности" in key and value:
-            value_clean = value.strip()
-            power_match = re.search(
-                r"(\d+(?:[.,]\d+)?(?:\s*-\s*\d+(?:[.,]\d+)?)?)", value_clean
-            )
-            if power_match:
-                power_value = power_match.group(1).strip()
-                if not max_power_found:
+def is_power_target_brand(product_name: str) -> bool:
+    """Товар относится к маркам со специальной обработкой мощности"""
+    name_lower = product_name.lower()
+    return any(brand in name_lower for brand in POWER_TARGET_BRANDS)
+
+
+def extract_power(
+    specs_text: str,
+    product_name: str = "",
+    lines: Optional[List[Tuple[str, str, str]]] = None,
+) -> Dict[str, str]:
+    """
+    Извлечение мощности из текста характеристик.
+
+    Извлекает значения мощности с приоритетом:
+    1. "Мощность до , кВт" — сохраняет значение как есть (напр. "от 3 до 18,1 (6 ступеней)")
+    2. "Максимальная тепловая мощность" (для целевых марок)
+    3. "Регулировка мощности" (для power_regulation и как запасной вариант)
+    4. Просто "Мощность" (если предыдущие не найдены)
+
+    Args:
+        specs_text: Текст характеристик в формате "Ключ: Значение"
+        product_name: Название товара для определения целевых марок.
+            Если товар не является целевой маркой, возвращается пустой словарь.
+        lines: Результат split_spec_lines(specs_text), если текст уже разобран
+
+    Returns:
+        Словарь с извлеченными значениями:
+        - power (str): Значение мощности в кВт
+        - power_regulation (str): Значение регулировки мощности (опционально)
+
+    Example:
+        >>> specs = "Максимальная тепловая мощность: 6-12 кВт"
+        >>> extract_power(specs, "Vaillant eloBLOCK")
+        {'power': '6-12'}
+
+    Note:
+        Работает только для целевых марок: vaillant, eloblock, protherm,
+        скат, teknix, espro, tecline. Для других марок возвращает пустой словарь.
+    """
+    result = {}
+
+    if not specs_text:
+        return result
+
+    if lines is None:
+        lines = split_spec_lines(specs_text)
+
+    # Приоритет 1: "Мощность до , кВт" — сохраняем значение как есть
+    # (например: "Мощность до , кВт : от 3 до 18,1 (6 ступеней)" → "от 3 до 18,1 (6 ступеней)")
+    for _, key, value in lines:
+        if "мощность до" in key and "квт" in key and value:
+            result["power"] = value.strip()
+            return result
+
+    # Марки, для которых нужно извлекать мощность из "Регулировка мощности"
+    if is_power_target_brand(product_name):
+        # Ищем "Максимальная тепловая мощность" (приоритет)
+        # Затем ищем "Регулировка мощности" (если максимальная мощность не найдена)
+        max_power_found = False
+
+        for _, key, value in lines:
+            # Проверяем "Максимальная тепловая мощность" (приоритет)
+            if (
+                "максимальная тепловая мощность" in key
+                and value
+                and not max_power_found
+            ):
+                value_clean = value.strip()
+
+                # Извлекаем числовое значение (убираем "кВт" и другие единицы измерения)
+                power_match = re.search(REGEX_POWER_NUMERIC_VALUE, value_clean)
+                if power_match:
+                    power_value = power_match.group(1).strip()
+                    # Сохраняем только числовое значение без "кВт"
                     result["power"] = power_value
-                result["power_regulation"] = power_value
-            else:
-                power_value_clean = re.sub(
-                    r"\s*квт\s*", "", value_clean, flags=re.IGNORECASE
-                ).strip()
-                if not max_power_found:
+                    max_power_found = True
+                else:
+                    # Если не нашли число, убираем "кВт" если есть
+                    power_value_clean = re.sub(
+                        REGEX_REMOVE_KW_UNIT, "", value_clean, flags=re.IGNORECASE
+                    ).strip()
                     result["power"] = (
                         power_value_clean if power_value_clean else value_clean
                     )
-                result["power_regulation"] = (
-                    power_value_clean if power_value_clean else value_clean
-                )
+                    max_power_found = True
+                # Не прерываем цикл, продолжаем искать
+                # "Регулировка мощности" для power_regulation
 
-            if max_power_found:
-                break
+            # Проверяем "Регулировка мощности"
+            # (для power_regulation и как запасной вариант для power)
+            elif "регулировка мощности" in key and value:
+                value_clean = value.strip()
 
-    # Если не нашли ни максимальную мощность, ни регулировку, ищем просто "Мощность"
-    if "power" not in result:
-        for line in specs_text.split("\n"):
-            if ":" in line:
-                key = line.split(":")[0].strip().lower()
-                value = line.split(":", 1)[1].strip() if ":" in line else ""
+                # Извлекаем числовое значение
+                power_match = re.search(REGEX_POWER_NUMERIC_VALUE, value_clean)
+                if power_match:
+                    power_value = power_match.group(1).strip()
+                    # Если максимальная мощность не найдена, используем регулировку для power
+                    if not max_power_found:
+                        result["power"] = power_value
+                    # Для power_regulation сохраняем числовое значение без "кВт"
+                    result["power_regulation"] = power_value
+                else:
+                    # Если не нашли число, убираем "кВт" если есть
+                    power_value_clean = re.sub(
+                        REGEX_REMOVE_KW_UNIT, "", value_clean, flags=re.IGNORECASE
+                    ).strip()
+                    if not max_power_found:
+                        result["power"] = (
+                            power_value_clean if power_value_clean else value_clean
+                        )
+                    # Для power_regulation сохраняем без "кВт"
+                    result["power_regulation"] = (
+                        power_value_clean if power_value_clean else value_clean
+                    )
+
+                # Если уже нашли максимальную мощность, можно прервать
+                if max_power_found:
+                    break
 
+        # Если не нашли ни максимальную мощность, ни регулировку, ищем просто "Мощность"
+        if "power" not in result:
+            for _, key, value in lines:
+                # Ищем просто "Мощность" (без "максимальная" и "регулировка")
                 if (
                     "мощность" in key
                     and "максимальная" not in key
@@ -106,14 +370,16 @@ def extract_power_for_target_brands(specs_text: str, product_name: str) -> Dict[
                     and value
                 ):
                     value_clean = value.strip()
-                    power_match = re.search(
-                        r"(\d+(?:[.,]\d+)?(?:\s*-\s*\d+(?:[.,]\d+)?)?)", value_clean
-                    )
+                    power_match = re.search(REGEX_POWER_NUMERIC_VALUE, value_clean)
                     if power_match:
-                        result["power"] = power_match.group(1).strip()
+                        power_value = power_match.group(1).strip()
+                        result["power"] = power_value
                     else:
                         power_value_clean = re.sub(
-                            r"\s*квт\s*", "", value_clean, flags=re.IGNORECASE
+                            REGEX_REMOVE_KW_UNIT,
+                            "",
+                            value_clean,
+                            flags=re.IGNORECASE,
                         ).strip()
                         result["power"] = (
                             power_value_clean if power_value_clean else value_clean
@@ -123,54 +389,405 @@ def extract_power_for_target_brands(specs_text: str, product_name: str) -> Dict[
     return result
 
 
-def process_water_heating_value(value: str, line: str) -> str:
+def extract_water_heating(value: str, line: str) -> str:
     """
-    Обработка значения для ГВС (нагрев воды)
+    Извлечение и обработка значения ГВС (нагрев воды).
+
+    Обрабатывает значения ГВС, удаляя единицы измерения (л/мин) и проверяя
+    наличие упоминаний о внешнем баке. Фильтрует пустые и невалидные значения.
 
     Args:
-        value: Исходное значение
-        line: Полная строка для проверки контекста
+        value: Исходное значение характеристики ГВС
+        line: Полная строка для проверки контекста (используется для
+            поиска упоминаний о внешнем баке)
 
     Returns:
-        str: Обработанное значение или пустая строка для пропуска
+        Обработанное значение ГВС или пустая строка для пропуска невалидных значений
+
+    Example:
+        >>> extract_water_heating("12.5 л/мин", "ГВС: 12.5 л/мин")
+        '12.5'
+        >>> extract_water_heating("в выносном баке", "ГВС: в выносном баке")
+        'в выносном баке'
+        >>> extract_water_heating("Ø", "ГВС: Ø")
+        ''
+
+    Note:
+        Удаляет единицы измерения: л/мин, l/min
+        Проверяет наличие упоминаний о внешнем баке в значении и строке
     """
+    if not value:
+        return ""
+
     line_lower = line.lower()
-    external_tank_indicators = [
-        "в выносном баке",
-        "внешний бак",
-        "выносной бак",
-        "external tank",
-        "внешнем баке",
-    ]
 
+    # Проверяем наличие примечаний о внешнем баке
     has_external_tank = any(
-        indicator in line_lower for indicator in external_tank_indicators
+        indicator in line_lower for indicator in EXTERNAL_TANK_INDICATORS
     )
 
-    # Убираем единицы измерения
-    units_pattern = re.compile(
-        r"\s*\d+(?:[.,]\d+)?\s*(?:л/мин|л\/мин|l/min|l\/min|л/мин\.?)\s*",
-        re.IGNORECASE,
-    )
-    simple_units_pattern = re.compile(
-        r"\s*(?:л/мин|л\/мин|l/min|l\/min|л/мин\.?)\s*", re.IGNORECASE
-    )
+    # Убираем единицы измерения (л/мин, л/мин, л/мин и т.д.)
+    # Паттерны для удаления единиц измерения и числовых значений с единицами
+    # Удаляем паттерны типа "12.5 л/мин", "10 л/мин", "л/мин" и т.д.
+    units_pattern = re.compile(REGEX_REMOVE_DHW_UNIT_WITH_NUMBER, re.IGNORECASE)
+    # Также удаляем просто "л/мин" без числа
+    simple_units_pattern = re.compile(REGEX_REMOVE_DHW_UNIT_SIMPLE, re.IGNORECASE)
     value_clean = units_pattern.sub("", value)
     value_clean = simple_units_pattern.sub("", value_clean).strip()
     value_clean_lower = value_clean.lower()
 
+    # Проверяем наличие упоминания о внешнем баке в очищенном значении
     has_external_tank_in_value = any(
-        indicator in value_clean_lower for indicator in external_tank_indicators
+        indicator in value_clean_lower for indicator in EXTERNAL_TANK_INDICATORS
     )
 
+    # Если есть упоминание о внешнем баке в очищенном значении или в исходной строке
     if has_external_tank_in_value or has_external_tank:
+        # Оставляем только текст о внешнем баке, убирая единицы измерения
         return "в выносном баке"
-    elif value_clean.strip() in ["Ø", "", "-", "—", "нет", "no"]:
-        return ""  # Пустая строка означает пропуск
-    elif value_clean.strip() not in ["Ø", "", "-", "—", "нет", "no"]:
-        return value_clean
+    # Если значение "Ø" или пустое после очистки, не сохраняем его
+    elif value_clean.strip() in EMPTY_SPEC_VALUES:
+        return ""
+    # Значение не пустое и не "Ø" после очистки
     else:
+        return value_clean
+
+
+def normalize_spec_value(value: str) -> str:
+    """
+    Нормализация значения характеристики (удаление лишних пробелов, символов).
+
+    Удаляет лишние пробелы, двоеточия в конце и нормализует строку
+    для последующего использования в парсинге.
+
+    Args:
+        value: Исходное значение характеристики
+
+    Returns:
+        Нормализованное значение без лишних пробелов и символов
+
+    Example:
+        >>> normalize_spec_value("  6 кВт  :")
+        '6 кВт'
+        >>> normalize_spec_value("220  В")
+        '220 В'
+
+    Note:
+        Если value пустая строка или None, возвращается пустая строка.
+    """
+    if not value:
         return ""
+    # Убираем лишние пробелы
+    value = " ".join(value.split())
+    # Убираем лишние двоеточия в конце
+    value = value.rstrip(":")
+    return value.strip()
+
+
+def extract_voltage(specs_text: str) -> str:
+    """
+    Извлечение напряжения из текста характеристик.
+
+    Ищет строки с ключевыми словами "питание от сети" или "напряжение"
+    и извлекает значение напряжения.
+
+    Args:
+        specs_text: Текст характеристик в формате "Ключ: Значение"
+
+    Returns:
+        Извлеченное значение напряжения или пустая строка, если не найдено
+
+    Example:
+        >>> specs = "Питание от сети: 220 В"
+        >>> extract_voltage(specs)
+        '220 В'
+
+    Note:
+        Ищет ключевые слова: "питание от сети", "напряжение"
+    """
+    if not specs_text:
+        return ""
+
+    voltage_keywords = [
+        "питание от сети",
+        "напряжение",
+    ]
+
+    for _, key, value in split_spec_lines(specs_text):
+        # Проверяем наличие ключевых слов напряжения
+        if any(keyword in key for keyword in voltage_keywords):
+            value_clean = normalize_spec_value(value)
+            if value_clean:
+                return value_clean
+
+    return ""
+
+
+def parse_specifications(specs_text: str, product_name: str = "") -> Dict[str, Any]:
+    """
+    Парсинг текста характеристик в словарь с нормализацией данных.
+
+    Извлекает технические характеристики из текста и преобразует их в словарь
+    с нормализованными ключами. Поддерживает специальную обработку для целевых
+    марок котлов (извлечение мощности из "Регулировка мощности").
+
+    Args:
+        specs_text: Текст характеристик в формате "Ключ: Значение"
+        product_name: Название товара для специальной обработки.
+            Используется для определения целевых марок.
+
+    Returns:
+        Словарь с распарсенными характеристиками. Ключи соответствуют полям
+        модели ElectricBoiler (power, voltage, water_heating и т.д.)
+
+    Example:
+        >>> specs = "Мощность: 6 кВт\\nНапряжение: 220 В"
+        >>> parse_specifications(specs)
+        {'power': '6', 'voltage': '220 В'}
+
+    Raises:
+        ValueError: Если specs_text содержит некорректные данные
+        (обрабатывается внутри функции, возвращается пустой словарь)
+
+    Note:
+        Для целевых марок (vaillant, protherm и др.) выполняется специальная
+        обработка мощности из поля "Регулировка мощности".
+    """
+    specs_dict = {}
+
+    if not specs_text:
+        return specs_dict
+
+    # Текст разбивается на строки один раз для всех этапов разбора
+    lines = split_spec_lines(specs_text)
+
+    # Извлекаем мощность с помощью специализированной функции
+    power_data = extract_power(specs_text, product_name, lines)
+    specs_dict.update(power_data)
+
+    # Определяем, является ли товар целевой маркой для специальной обработки мощности
+    is_target_brand = is_power_target_brand(product_name)
+
+    # Парсим характеристики построчно
+    for line, key_lower, raw_value in lines:
+        # Нормализуем значение
+        value = normalize_spec_value(raw_value)
+
+        # Поле модели по названию характеристики (маппинг и правила
+        # приоритета - в spec_parser.FIELD_MAPPING / classify_spec_key)
+        matched_field = classify_spec_key(key_lower)
+
+        if matched_field:
+            # Для целевых марок: если мощность уже извлечена из "Максимальная тепловая мощность"
+            # или "Регулировка мощности", не перезаписываем её обычным парсингом
+            if matched_field == "power" and is_target_brand and "power" in specs_dict:
+                # Пропускаем установку мощности, если она уже была извлечена специальной логикой
+                continue
+
+            # Для мощности убираем "кВт" из значения (кроме формата "от X до Y (Z ступеней)")
+            if matched_field == "power":
+                # Формат "Мощность до , кВт : от 3 до 18,1 (6 ступеней)" — сохраняем как есть
+                if re.match(r"от\s+\d+", value, re.IGNORECASE):
+                    specs_dict[matched_field] = value
+                else:
+                    # Убираем "кВт" и другие единицы измерения, оставляем только числовое значение
+                    power_value_clean = re.sub(
+                        REGEX_REMOVE_KW_UNIT, "", value, flags=re.IGNORECASE
+                    ).strip()
+                    specs_dict[matched_field] = (
+                        power_value_clean if power_value_clean else value
+                    )
+            # Для регулировки мощности также убираем "кВт" из значения
+            elif matched_field == "power_regulation":
+                # Убираем "кВт" и другие единицы измерения, оставляем только числовое значение
+                power_reg_value_clean = re.sub(
+                    REGEX_REMOVE_KW_UNIT, "", value, flags=re.IGNORECASE
+                ).strip()
+                specs_dict[matched_field] = (
+                    power_reg_value_clean if power_reg_value_clean else value
+                )
+            # Для температурных диапазонов нужно проверить контекст
+            elif matched_field == "temp_range":
+                # Если в ключе есть "радиатор", то это temp_range_radiator
+                if "радиатор" in key_lower:
+                    specs_dict["temp_range_radiator"] = value
+                    continue
+                # Если в ключе есть "пол" или "теплый", то это temp_range_floor
+                elif "пол" in key_lower or "теплый" in key_lower:
+                    specs_dict["temp_range_floor"] = value
+                    continue
+                else:
+                    specs_dict[matched_field] = value
+            # Специальная обработка для ГВС (нагрев воды) с помощью специализированной функции
+            elif matched_field == "water_heating":
+                water_heating_value = extract_water_heating(value, line)
+                # Если функция вернула пустую строку, пропускаем это значение
+                if not water_heating_value:
+                    continue
+                specs_dict[matched_field] = water_heating_value
+            # Специальная обработка для объема расширительного бака
+            elif matched_field == "expansion_tank":
+                # Сохраняем значение с единицей измерения (если есть)
+                # Если единица уже в значении, оставляем как есть
+                if value and value.strip() not in EMPTY_SPEC_VALUES:
+                    # Нормализуем значение, убирая лишние пробелы
+                    value_clean = " ".join(value.split())
+                    specs_dict[matched_field] = value_clean
+                elif value.strip() in EMPTY_SPEC_VALUES:
+                    # Если значение пустое или "Ø", не сохраняем
+                    continue
+            else:
+                specs_dict[matched_field] = value
+
+    return specs_dict
+
+
+def extract_voltage_from_description(
+    description: str, product_name: str, power_value: str
+) -> str:
+    """
+    Извлечение напряжения питания из описания товара на основе мощности.
+
+    Специализированная функция для котлов Vaillant eloBLOCK, которая извлекает
+    информацию о напряжении из описания на основе мощности котла.
+
+    Для котлов Vaillant eloBLOCK:
+    - Котлы мощностью 6 кВт и 9 кВт могут работать от сети с напряжением ~220В и ~380В
+    - Модели, начиная с 12 кВт, могут работать только от сети мощностью ~380 В
+
+    Args:
+        description: Описание товара для поиска информации о напряжении
+        product_name: Название товара для проверки марки
+        power_value: Значение мощности котла в кВт
+
+    Returns:
+        Текст с информацией о напряжении или пустая строка, если не найдено
+
+    Example:
+        >>> desc = "Котлы мощностью 6 кВт и 9 кВт могут работать от сети с напряжением ~220В и ~380В"
+        >>> extract_voltage_from_description(desc, "Vaillant eloBLOCK VE 6", "6")
+        '220 В и 380 В'
+
+    Note:
+        Работает только для товаров марки Vaillant eloBLOCK.
+        Использует регулярные выражения для поиска паттернов напряжения.
+    """
+    if not description or not product_name:
+        return ""
+
+    # Проверяем, является ли это котлом Vaillant eloBLOCK
+    name_lower = product_name.lower()
+    if "vaillant" not in name_lower or "eloblock" not in name_lower:
+        return ""
+
+    description_lower = description.lower()
+
+    # Определяем мощность котла
+    power_num = None
+    if power_value:
+        try:
+            # Извлекаем числовое значение мощности
+            power_match = re.search(REGEX_SIMPLE_NUMERIC_VALUE, str(power_value))
+            if power_match:
+                power_num = float(power_match.group(1).replace(",", "."))
+        except (ValueError, AttributeError):
+            pass
+
+    # Паттерны для поиска информации о напряжении в описании
+    # Паттерн 1: "Котлы мощностью 6 кВт и 9 кВт могут работать от сети с напряжением ~220В и ~380В"
+    pattern_6_9 = re.compile(REGEX_VOLTAGE_6_9_KW, re.IGNORECASE | re.DOTALL)
+
+    # Паттерн 2: "Модели, начиная с 12 кВт, могут работать только от сети мощностью ~380 В"
+    pattern_12_plus = re.compile(REGEX_VOLTAGE_12_PLUS_KW, re.IGNORECASE | re.DOTALL)
+
+    # Паттерн 3: "Важно!!! Модели, начиная с 12 кВт,
+    # могут работать только от сети мощностью ~380 В"
+    pattern_important = re.compile(
+        REGEX_VOLTAGE_12_PLUS_KW_IMPORTANT, re.IGNORECASE | re.DOTALL
+    )
+
+    # Ищем информацию о напряжении в описании
+    # Сначала проверяем паттерн для 6 и 9 кВт
+    match_6_9 = pattern_6_9.search(description_lower)
+    if match_6_9:
+        voltage_text = match_6_9.group(1)
+        if voltage_text:
+            # Нормализуем текст напряжения (убираем ~ и лишние пробелы)
+            voltage_text = re.sub(REGEX_REMOVE_TILDE, "", voltage_text)
+            voltage_text = " ".join(voltage_text.split())
+            # Если мощность соответствует, возвращаем найденное значение
+            if power_num is None or power_num == 6 or power_num == 9:
+                return voltage_text
+
+    # Проверяем паттерн для 12 кВт и выше
+    match_12_plus = pattern_12_plus.search(
+        description_lower
+    ) or pattern_important.search(description_lower)
+    if match_12_plus:
+        voltage_text = match_12_plus.group(1)
+        if voltage_text:
+            # Нормализуем текст напряжения
+            voltage_text = re.sub(REGEX_REMOVE_TILDE, "", voltage_text)
+            voltage_text = " ".join(voltage_text.split())
+            # Если мощность соответствует, возвращаем найденное значение
+            if power_num is None or power_num >= 12:
+                return voltage_text
+
+    # Если не нашли точные паттерны, определяем на основе мощности и наличия упоминаний
+    if power_num is not None:
+        # Для мощности 6 кВт или 9 кВт
+        if power_num == 6 or power_num == 9:
+            # Проверяем, есть ли в описании упоминание о 220В и 380В
+            if "220" in description_lower and "380" in description_lower:
+                # Проверяем контекст - должны быть упоминания о мощности 6 или 9 кВт
+                if (
+                    "6" in description_lower or "9" in description_lower
+                ) and "квт" in description_lower:
+                    return "220В и 380В"
+
+        # Для мощности 12 кВт и выше
+        elif power_num >= 12:
+            # Проверяем, есть ли в описании упоминание о 380В и "только"
+            if "380" in description_lower and (
+                "только" in description_lower or "начиная с 12" in description_lower
+            ):
+                return "380В"
+
+    return ""
+
+
+def extract_spec_fields(
+    specifications: str, description: str, product_name: str
+) -> Dict[str, Any]:
+    """
+    Извлечение полей характеристик котла из исходных текстов.
+
+    Используется при парсинге и при повторном разборе сохраненных текстов
+    (команда reparse_boilers).
+
+    Args:
+        specifications: Текст характеристик со страницы товара
+        description: Описание товара (источник напряжения, если его нет
+            в характеристиках)
+        product_name: Название товара
+
+    Returns:
+        Словарь {поле модели: значение} (подмножество SPEC_FIELDS)
+    """
+    specs_dict = parse_specifications(specifications or "", product_name or "")
+
+    # Если напряжение не найдено в характеристиках, пытаемся извлечь из описания
+    if "voltage" not in specs_dict or not specs_dict.get("voltage"):
+        power_value = specs_dict.get("power", "")
+
+        voltage_from_description = extract_voltage_from_description(
+            description or "", product_name or "", power_value
+        )
+
+        if voltage_from_description:
+            specs_dict["voltage"] = voltage_from_description
+
+    return specs_dict
 
 
 def get_field_mapping() -> Dict[str, str]:
@@ -178,61 +795,6 @@ def get_field_mapping() -> Dict[str, str]:
     Получение маппинга названий характеристик на поля модели
 
     Returns:
-        dict: Словарь маппинга
-    """
-    return {
-        "Максимальная тепловая мощность": "power",
-        "Максимальная мощность": "power",
-        "Мощность": "power",
-        "Мощность, кВт": "power",
-        "Мощность (кВт)": "power",
-        "Регулировка мощности": "power_regulation",
-        "Регулировка": "power_regulation",
-        "Площадь отопления": "heating_area",
-        "Площадь отопления, рекомендуемая до": "heating_area",
-        "Площадь отопления (м²)": "heating_area",
-        "Начальный вариант работы": "work_type",
-        "Режим работы": "work_type",
-        "Возможность для работы самостоятельно": "self_work",
-        "Автономная работа": "self_work",
-        "Возможность для нагрева воды": "water_heating",
-        "Нагрев воды": "water_heating",
-        "ГВС (вода)": "water_heating",
-        "ГВС": "water_heating",
-        "DHW (water)": "water_heating",
-        "DHW": "water_heating",
-        "Возможность нагрева теплого пола": "floor_heating",
-        "Теплый пол": "floor_heating",
-        "Расширительный бак": "expansion_tank",
-        "Объем расширительного бака": "expansion_tank",
-        "Expansion tank volume": "expansion_tank",
-        "Циркуляционный насос": "circulation_pump",
-        "Насос": "circulation_pump",
-        "Питание от сети": "voltage",
-        "Питание от сети, Вольт": "voltage",
-        "Напряжение": "voltage",
-        "Напряжение (В)": "voltage",
-        "Кабель подключения": "cable",
-        "Кабель": "cable",
-        "Предохранитель": "fuse",
-        "Предохранитель, А": "fuse",
-        "Предохранитель (А)": "fuse",
-        "Диапазон выбираемых температур": "temp_range",
-        "Диапазон температур": "temp_range",
-        "Температура радиаторного отопления": "temp_range_radiator",
-        "Температура теплого пола": "temp_range_floor",
-        "Подключение к системе": "connection",
-        "Подключение": "connection",
-        "Габаритные размеры": "dimensions",
-        "Размеры": "dimensions",
-        "Размеры (мм)": "dimensions",
-        "WiFi": "wifi",
-        "Возможность подключения WiFi": "wifi",
-        "Wi-Fi": "wifi",
-        "Возможность подключения комнатного термостата": "thermostat",
-        "Комнатный термостат": "thermostat",
-        "Комнатный термостат в комплекте": "thermostat_included",
-        "Термостат в комплекте": "thermostat_included",
-        "Возможно подключение датчика уличной температуры": "outdoor_sensor",
-        "Датчик уличной температуры": "outdoor_sensor",
-    }
+        dict: Копия FIELD_MAPPING
+    """
+    return dict(FIELD_MAPPING)
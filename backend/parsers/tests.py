@@ -0,0 +1,496 @@
+import asyncio
+import gzip
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+
+from parsers.azbuka_tepla import (
+    DetailWorkerPool,
+    compute_listing_fingerprint,
+    parse_products_from_page,
+    prepare_boiler_objects,
+    save_boiler_objects,
+)
+from parsers.checkpoint import CrawlCheckpoint
+from parsers.config import PARSER_CONFIG
+from parsers.fetchers import (
+    FallbackFetcher,
+    FetchError,
+    HttpFetcher,
+    PageFetcher,
+    create_fetcher,
+)
+from parsers.http_cache import PageCache
+from parsers.pipeline import CrawlPipeline
+from parsers.spec_parser import (
+    FIELD_MAPPING,
+    classify_spec_key,
+    extract_power,
+    extract_water_heating,
+)
+from products.models import ElectricBoiler
+
+CATALOG_URL = "https://example.com/catalog/"
+PRODUCT_URL = "https://example.com/product/vaillant-eloblock-ve-6/"
+PRODUCT_NAME = "Котел электрический Vaillant eloBLOCK VE 6"
+
+CATALOG_PAGE = f"""
+<ul class="products">
+  <li class="product product-type-simple">
+    <a href="{PRODUCT_URL}"><img src="https://example.com/ve6.jpg"></a>
+    <h2 class="woocommerce-loop-product__title">{PRODUCT_NAME}</h2>
+    <span class="woocommerce-Price-amount amount">1 300,00</span>
+  </li>
+</ul>
+"""
+
+PRODUCT_PAGE = """
+<div class="product">
+  <div class="woocommerce-product-gallery">
+    <img src="https://example.com/ve6-new.jpg">
+  </div>
+  <table class="woocommerce-product-attributes">
+    <tr><th>Мощность</th><td>6 кВт</td></tr>
+  </table>
+</div>
+"""
+
+
+class StaticFetcher(PageFetcher):
+    """Загрузчик страниц из словаря {url: HTML или исключение}"""
+
+    name = "static"
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.closed = False
+
+    def fetch(self, url, wait_class=None, markers=(), wait_required=True):
+        page = self.pages[url]
+        if isinstance(page, Exception):
+            raise page
+        return page
+
+    def close(self):
+        self.closed = True
+
+
+SITE_PAGE = "<html><body>Котел</body></html>"
+SITE_ETAG = '"v1"'
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """
+    Тестовый сайт: /page (gzip, windows-1251, ETag), /redirect -> /page,
+    остальные пути - 404
+    """
+
+    def do_GET(self):
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "/page")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+        elif self.path == "/page" and self.headers.get("If-None-Match") == SITE_ETAG:
+            self.send_response(304)
+            self.send_header("ETag", SITE_ETAG)
+            self.end_headers()
+        elif self.path == "/page":
+            body = gzip.compress(SITE_PAGE.encode("windows-1251"))
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=windows-1251")
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("ETag", SITE_ETAG)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalSiteTestCase(SimpleTestCase):
+    """Тестовый сайт SiteHandler в отдельном потоке"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), SiteHandler)
+        cls.server.requests = []
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.requests.clear()
+
+
+class HttpFetcherTests(LocalSiteTestCase):
+    """Загрузка страниц без браузера"""
+
+    def setUp(self):
+        super().setUp()
+        self.fetcher = HttpFetcher("test-agent", timeout=5)
+        self.addCleanup(self.fetcher.close)
+
+    def test_follows_redirect_and_decodes_body(self):
+        self.assertEqual(self.fetcher.fetch(f"{self.base_url}/redirect"), SITE_PAGE)
+        self.assertEqual(
+            [path for path, _ in self.server.requests], ["/redirect", "/page"]
+        )
+
+    def test_error_status(self):
+        with self.assertRaises(FetchError):
+            self.fetcher.fetch(f"{self.base_url}/missing")
+
+
+class PageCacheTests(LocalSiteTestCase):
+    """Дисковый кэш страниц с условной перепроверкой"""
+
+    def fetcher(self, ttl):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        fetcher = HttpFetcher("test-agent", timeout=5, cache=PageCache(cache_dir.name, ttl))
+        self.addCleanup(fetcher.close)
+        return fetcher
+
+    def test_revalidates_with_etag(self):
+        fetcher = self.fetcher(ttl=0)
+        url = f"{self.base_url}/page"
+        self.assertEqual(fetcher.fetch(url), SITE_PAGE)
+        self.assertEqual(fetcher.fetch(url), SITE_PAGE)
+        (_, first), (_, second) = self.server.requests
+        self.assertNotIn("If-None-Match", first)
+        self.assertEqual(second["If-None-Match"], SITE_ETAG)
+
+    def test_fresh_entry_served_without_request(self):
+        fetcher = self.fetcher(ttl=3600)
+        url = f"{self.base_url}/page"
+        fetcher.fetch(url)
+        self.assertEqual(fetcher.fetch(url), SITE_PAGE)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_corrupted_entry_is_a_miss(self):
+        fetcher = self.fetcher(ttl=3600)
+        url = f"{self.base_url}/page"
+        fetcher.fetch(url)
+        _, meta_path = fetcher.cache._paths(url)
+        with open(meta_path, "w", encoding="utf-8") as f:
+            f.write("{")
+        self.assertIsNone(fetcher.cache.get(url))
+        self.assertEqual(fetcher.fetch(url), SITE_PAGE)
+        self.assertEqual(len(self.server.requests), 2)
+
+
+class FallbackFetcherTests(SimpleTestCase):
+    """HTTP-загрузка с резервным загрузчиком (Selenium)"""
+
+    def fetch(self, primary_page):
+        fetcher = FallbackFetcher(
+            StaticFetcher({CATALOG_URL: primary_page}),
+            StaticFetcher({CATALOG_URL: "fallback product-type-simple"}),
+        )
+        return fetcher.fetch(CATALOG_URL, markers=["product-type-simple"])
+
+    def test_primary_page_with_markers(self):
+        self.assertEqual(self.fetch(CATALOG_PAGE), CATALOG_PAGE)
+
+    def test_fallback_without_markers_or_on_error(self):
+        for primary_page in ("<div id='app'></div>", FetchError("HTTP 503")):
+            with self.subTest(primary_page=primary_page):
+                self.assertEqual(self.fetch(primary_page), "fallback product-type-simple")
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            create_fetcher("ftp", driver_factory=None, user_agent="test-agent")
+
+
+@mock.patch("parsers.utils.time.sleep")
+class DetailWorkerPoolTests(SimpleTestCase):
+    """Параллельная загрузка страниц товаров загрузчиками потоков пула"""
+
+    def test_fetch_details_and_close(self, sleep):
+        missing_url = "https://example.com/product/missing/"
+        fetchers = []
+
+        def fetcher_factory():
+            fetcher = StaticFetcher(
+                {PRODUCT_URL: PRODUCT_PAGE, missing_url: FetchError("HTTP 404")}
+            )
+            fetchers.append(fetcher)
+            return fetcher
+
+        with DetailWorkerPool(2, fetcher_factory=fetcher_factory) as pool:
+            results = pool.fetch_details([PRODUCT_URL, missing_url])
+
+        self.assertIn("Мощность", results[PRODUCT_URL]["specifications"])
+        # Ошибка одного товара возвращается в результате, а не пробрасывается
+        self.assertIsInstance(results[missing_url], FetchError)
+        self.assertTrue(fetchers)
+        self.assertTrue(all(fetcher.closed for fetcher in fetchers))
+
+
+class CrawlCheckpointTests(SimpleTestCase):
+    """Журнал прогресса прерванного запуска"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = f"{directory.name}/checkpoint.sqlite3"
+
+    def open(self, **kwargs):
+        checkpoint = CrawlCheckpoint(self.path, **kwargs)
+        self.addCleanup(checkpoint.close)
+        return checkpoint
+
+    def test_resume_after_interruption(self):
+        saved = {"product_url": "https://example.com/p/1", "name": "1"}
+        pending = {"product_url": "https://example.com/p/2", "name": "2"}
+        checkpoint = self.open()
+        self.assertFalse(checkpoint.is_resumed)
+        checkpoint.record_page(CATALOG_URL, [saved, pending])
+        checkpoint.record_page(f"{CATALOG_URL}page/2/", [], page_done=False)
+        checkpoint.mark_saved([saved])
+        checkpoint.close()
+
+        checkpoint = self.open()
+        self.assertTrue(checkpoint.is_resumed)
+        self.assertEqual(checkpoint.completed_pages(), {CATALOG_URL})
+        self.assertEqual(
+            checkpoint.completed_products(),
+            {saved["product_url"], pending["product_url"]},
+        )
+        self.assertEqual(checkpoint.pending_products(), [pending])
+
+    def test_stale_journal_starts_over(self):
+        checkpoint = self.open()
+        checkpoint.record_page(CATALOG_URL, [])
+        checkpoint.close()
+        with mock.patch("parsers.checkpoint.time.time", return_value=time.time() + 60):
+            checkpoint = self.open(max_age=30)
+        self.assertFalse(checkpoint.is_resumed)
+
+    def test_clear_removes_journal(self):
+        checkpoint = self.open()
+        checkpoint.record_page(CATALOG_URL, [])
+        checkpoint.clear()
+        self.assertFalse(self.open().is_resumed)
+
+
+def classify_spec_key_reference(key_lower):
+    """Исходный разбор: приоритетные правила, затем первый по порядку ключ-подстрока"""
+    if "гвс" in key_lower or "dhw" in key_lower:
+        if (
+            "вода" in key_lower
+            or "water" in key_lower
+            or key_lower.strip() in ("гвс", "dhw")
+        ):
+            return "water_heating"
+    if "объем расширительного бака" in key_lower or "expansion tank volume" in key_lower:
+        return "expansion_tank"
+    for key, field in FIELD_MAPPING.items():
+        if key.lower() in key_lower:
+            return field
+    return None
+
+
+class ClassifySpecKeyTests(SimpleTestCase):
+    """classify_spec_key совпадает с перебором FIELD_MAPPING по порядку"""
+
+    KEYS = [
+        # Ключи FIELD_MAPPING как есть и с окружением
+        *(key.lower() for key in FIELD_MAPPING),
+        *(f"  {key.lower()} (доп.)" for key in FIELD_MAPPING),
+        # Более поздний и длинный ключ начинается в названии раньше
+        "регулировка мощности",
+        "регулировка мощность",
+        "напряжение питание от сети",
+        "размеры габаритные размеры",
+        "кабель подключения",
+        "температура теплого пола",
+        "комнатный термостат в комплекте",
+        "теплый пол, возможность нагрева теплого пола",
+        "диапазон температур радиаторного отопления",
+        "насос циркуляционный насос",
+        "подключение wifi",
+        # Приоритетные правила ГВС/DHW
+        "гвс",
+        " dhw ",
+        "гвс (вода)",
+        "dhw (water)",
+        "нагрев воды гвс",
+        "гвс в выносном баке",
+        "dhw tank",
+        "мощность гвс",
+        # Приоритет объема расширительного бака
+        "объем расширительного бака",
+        "расширительный бак, объем расширительного бака",
+        "expansion tank volume, l",
+        "мощность; объем расширительного бака",
+        # Без совпадений
+        "",
+        "цвет",
+        "гарантия производителя",
+    ]
+
+    def test_matches_ordered_substring_loop(self):
+        for key_lower in self.KEYS:
+            with self.subTest(key=key_lower):
+                self.assertEqual(
+                    classify_spec_key(key_lower), classify_spec_key_reference(key_lower)
+                )
+
+    def test_priority_rules(self):
+        self.assertEqual(classify_spec_key("гвс"), "water_heating")
+        self.assertEqual(classify_spec_key("dhw (water)"), "water_heating")
+        self.assertEqual(
+            classify_spec_key("мощность; объем расширительного бака"), "expansion_tank"
+        )
+        # "Мощность" раньше "Регулировка" в FIELD_MAPPING, хотя входит в название позже
+        self.assertEqual(classify_spec_key("регулировка мощность"), "power")
+        self.assertEqual(classify_spec_key("регулировка мощности"), "power_regulation")
+
+
+class SpecValueTests(SimpleTestCase):
+    """Разбор мощности и ГВС (parsers.spec_parser)"""
+
+    def test_extract_power(self):
+        name = "Vaillant eloBLOCK VE 12"
+        self.assertEqual(
+            extract_power("Мощность до , кВт: от 3 до 18,1 (6 ступеней)", name),
+            {"power": "от 3 до 18,1 (6 ступеней)"},
+        )
+        self.assertEqual(
+            extract_power(
+                "Регулировка мощности: 4-12 кВт\nМаксимальная тепловая мощность: 12 кВт",
+                name,
+            ),
+            {"power": "12", "power_regulation": "4-12"},
+        )
+        self.assertEqual(extract_power("Мощность: 9 кВт", name), {"power": "9"})
+        # Не целевая марка: мощность разбирается общим маппингом
+        self.assertEqual(extract_power("Мощность: 9 кВт", "Котел Warmos"), {})
+
+    def test_extract_water_heating(self):
+        self.assertEqual(
+            extract_water_heating("да", "ГВС: да (в выносном баке)"), "в выносном баке"
+        )
+        self.assertEqual(extract_water_heating("Ø", "ГВС: Ø"), "")
+        self.assertEqual(extract_water_heating("проточный", "ГВС: проточный"), "проточный")
+
+
+# Повторные попытки загрузки без ожидания между ними
+@mock.patch("parsers.utils.time.sleep")
+class IncrementalDetailFailureTests(TestCase):
+    """Ошибка загрузки страницы товара не затирает сохраненные данные"""
+
+    def setUp(self):
+        self.boiler = ElectricBoiler.objects.create(
+            name=PRODUCT_NAME,
+            price="1 200,00",
+            product_url=PRODUCT_URL,
+            description="Сохраненное описание",
+            raw_specifications="Мощность: 6 кВт",
+            image_1="https://example.com/ve6.jpg",
+            listing_fingerprint="old",
+        )
+
+    def parse(self, product_page):
+        fetcher = StaticFetcher({CATALOG_URL: CATALOG_PAGE, PRODUCT_URL: product_page})
+        return parse_products_from_page(
+            fetcher,
+            CATALOG_URL,
+            {PRODUCT_NAME},
+            existing_fingerprints={PRODUCT_NAME: "old"},
+        )
+
+    def save(self, products_data):
+        to_create, to_update, _ = prepare_boiler_objects(products_data, {PRODUCT_NAME})
+        return save_boiler_objects(to_create, to_update)
+
+    def test_failed_detail_page_keeps_stored_data_and_fingerprint(self, sleep):
+        products_data, errors, _ = self.parse(FetchError("HTTP 503"))
+
+        self.assertEqual(products_data, [])
+        self.assertEqual(errors, 1)
+        self.assertEqual(self.save(products_data), (0, 0, 0))
+        self.boiler.refresh_from_db()
+        self.assertEqual(self.boiler.description, "Сохраненное описание")
+        self.assertEqual(self.boiler.raw_specifications, "Мощность: 6 кВт")
+        # Прежний отпечаток: следующий запуск загрузит товар снова
+        self.assertEqual(self.boiler.listing_fingerprint, "old")
+
+    def test_changed_card_updates_product(self, sleep):
+        products_data, errors, _ = self.parse(PRODUCT_PAGE)
+
+        self.assertEqual(errors, 0)
+        self.assertEqual(self.save(products_data)[1], 1)
+        self.boiler.refresh_from_db()
+        self.assertEqual(
+            self.boiler.listing_fingerprint,
+            compute_listing_fingerprint(
+                PRODUCT_NAME, "1 300,00", "https://example.com/ve6.jpg"
+            ),
+        )
+        self.assertEqual(self.boiler.image_1, "https://example.com/ve6-new.jpg")
+
+
+# Очереди и батчи по одному товару: этапы перед записью быстро заполняются
+@mock.patch.dict(
+    PARSER_CONFIG,
+    {
+        "PIPELINE_QUEUE_SIZE": 1,
+        "PIPELINE_SAVE_BATCH_SIZE": 1,
+        "PIPELINE_PARSE_CONCURRENCY": 1,
+        "CHECK_IMAGE_AVAILABILITY": False,
+    },
+)
+class PipelineSaveFailureTests(SimpleTestCase):
+    """Конвейер завершается, если запись в БД не удалась"""
+
+    PRODUCTS = 5
+
+    def run_pipeline(self):
+        pages = {CATALOG_URL: ""}
+        cards = []
+        for i in range(self.PRODUCTS):
+            product_url = f"{PRODUCT_URL}{i}/"
+            pages[product_url] = PRODUCT_PAGE
+            cards.append(
+                f"""<li class="product product-type-simple">
+                  <a href="{product_url}"><img src="https://example.com/{i}.jpg"></a>
+                  <h2 class="woocommerce-loop-product__title">{PRODUCT_NAME} #{i}</h2>
+                  <span class="woocommerce-Price-amount amount">{i}00</span>
+                </li>"""
+            )
+        pages[CATALOG_URL] = f'<ul class="products">{"".join(cards)}</ul>'
+
+        with DetailWorkerPool(2, fetcher_factory=lambda: StaticFetcher(pages)) as pool:
+            pipeline = CrawlPipeline(CATALOG_URL, set(), pool)
+            return asyncio.run(asyncio.wait_for(pipeline.run(), timeout=30))
+
+    @mock.patch("parsers.pipeline.save_boiler_objects", side_effect=RuntimeError("БД"))
+    def test_failed_batches_are_counted(self, save):
+        stats = self.run_pipeline()
+        self.assertEqual(stats["errors"], self.PRODUCTS)
+        self.assertEqual(stats["created"], 0)
+        self.assertEqual(save.call_count, self.PRODUCTS)
+
+    @mock.patch.object(CrawlPipeline, "_save_batch", side_effect=RuntimeError("БД"))
+    def test_stopped_saver_stops_pipeline(self, save_batch):
+        with self.assertRaisesMessage(RuntimeError, "БД"):
+            self.run_pipeline()
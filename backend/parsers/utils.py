@@ -3,6 +3,7 @@
 """
 import logging
 import os
+import threading
 import time
 from functools import wraps
 from typing import Callable, Any
@@ -158,3 +159,35 @@ def measure_time(func: Callable) -> Callable:
             logger.error(f"{func.__name__} завершился с ошибкой за {elapsed:.2f}с: {e}")
             raise
     return wrapper
+
+
+class RateLimiter:
+    """
+    Потокобезопасный ограничитель частоты запросов
+
+    Гарантирует, что суммарно (из всех потоков) к сайту уходит не больше
+    max_per_second запросов в секунду: каждый вызов wait() резервирует
+    следующий свободный слот и спит до его наступления.
+    """
+
+    def __init__(self, max_per_second: float) -> None:
+        """
+        Args:
+            max_per_second: Максимальное количество запросов в секунду.
+                Значение <= 0 отключает ограничение.
+        """
+        self.interval = 1.0 / max_per_second if max_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def wait(self) -> None:
+        """Блокирует вызывающий поток до наступления его слота"""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
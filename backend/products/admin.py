@@ -6,7 +6,9 @@
 """
 
 from django.contrib import admin
-from .models import CustomUser, ElectricBoiler
+from .models import CustomUser, ElectricBoiler, Manufacturer
+from .search import is_search_supported, search_boilers
+from .snapshots import publish_snapshots_on_commit
 
 
 @admin.register(CustomUser)
@@ -97,15 +99,43 @@ class ElectricBoilerAdmin(admin.ModelAdmin):
         "updated_at",
     )
     list_display_links = ("name",)  # Поле для перехода к редактированию
-    list_filter = ("country", "created_at", "updated_at", "power")
+    list_filter = ("manufacturer", "country", "created_at", "updated_at", "power")
     search_fields = ("name", "description", "country", "power", "price")
     ordering = ("-created_at", "name")  # Сначала новые, потом по имени
-    readonly_fields = ("created_at", "updated_at")
+    readonly_fields = (
+        "created_at",
+        "updated_at",
+        "manufacturer",
+        "price_byn",
+        "power_min_kw",
+        "power_max_kw",
+        "heating_area_m2",
+        "voltage_v",
+    )
 
     # Количество объектов на странице
     list_per_page = 25
     list_max_show_all = 100
 
+    # Снимки каталога (products.snapshots) перезаписываются после изменений
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        publish_snapshots_on_commit()
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        publish_snapshots_on_commit()
+
+    def delete_queryset(self, request, queryset):
+        super().delete_queryset(request, queryset)
+        publish_snapshots_on_commit()
+
+    def get_search_results(self, request, queryset, search_term):
+        """Поиск по search_vector и pg_trgm (индексы) вместо icontains по описанию"""
+        if search_term and is_search_supported():
+            return search_boilers(queryset, search_term), False
+        return super().get_search_results(request, queryset, search_term)
+
     # Группировка полей для удобства в админ-панели
     fieldsets = (
         (
@@ -176,6 +206,20 @@ class ElectricBoilerAdmin(admin.ModelAdmin):
                 )
             },
         ),
+        (
+            "Вычисляемые значения (заполняются при сохранении)",
+            {
+                "fields": (
+                    "manufacturer",
+                    "price_byn",
+                    "power_min_kw",
+                    "power_max_kw",
+                    "heating_area_m2",
+                    "voltage_v",
+                ),
+                "classes": ("collapse",),
+            },
+        ),
         (
             "Метаданные",
             {"fields": ("created_at", "updated_at"), "classes": ("collapse",)},
@@ -186,3 +230,17 @@ class ElectricBoilerAdmin(admin.ModelAdmin):
     save_on_top = True  # Кнопки сохранения сверху и снизу
     save_as = True  # Возможность сохранить как новый объект
     save_as_continue = True  # Продолжить редактирование после сохранения как нового
+
+
+@admin.register(Manufacturer)
+class ManufacturerAdmin(admin.ModelAdmin):
+    """
+    Административный интерфейс для модели Manufacturer
+
+    Производители создаются при сохранении котлов, количество котлов
+    пересчитывается автоматически
+    """
+
+    list_display = ("name", "slug", "product_count")
+    search_fields = ("name", "slug")
+    readonly_fields = ("product_count",)
@@ -1,5 +1,28 @@
+import logging
+
 from django.apps import AppConfig
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
 
 
 class ProductsConfig(AppConfig):
     name = 'products'
+
+    def ready(self):
+        from . import signals  # noqa: F401
+        from .compression import brotli
+        from .fast_json import orjson
+
+        # Пакеты из requirements.txt, без которых API работает медленнее
+        if settings.CATALOG_FAST_JSON and orjson is None:
+            logger.warning(
+                "CATALOG_FAST_JSON включен, но пакет orjson не установлен: "
+                "ответы кодируются стандартным json"
+            )
+        compression = "products.compression.CompressionMiddleware" in settings.MIDDLEWARE
+        if compression and brotli is None:
+            logger.warning(
+                "Пакет brotli не установлен: ответы API и снимки каталога "
+                "сжимаются только gzip"
+            )
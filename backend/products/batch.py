@@ -0,0 +1,71 @@
+"""
+Пакетная выборка котлов по списку id (корзина, избранное, сравнение)
+
+Все записи читаются одним запросом id IN (...), ответ сохраняет порядок
+запрошенных id и перечисляет id, которых нет в каталоге.
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+from rest_framework.exceptions import ValidationError
+
+from .fieldsets import project
+from .models import ElectricBoiler
+
+IDS_PARAM = "ids"
+
+# Максимальное количество id в одном запросе
+BATCH_MAX_IDS = 100
+
+
+def parse_ids(values: Iterable) -> List[int]:
+    """
+    Список id без повторов в исходном порядке
+
+    Args:
+        values: Числа или строки ("1,2,3" разбивается по запятым)
+
+    Raises:
+        ValidationError: Нечисловые id, пустой список или больше BATCH_MAX_IDS
+    """
+    ids: List[int] = []
+    seen = set()
+    for value in values:
+        parts = value.split(",") if isinstance(value, str) else [value]
+        for part in parts:
+            if isinstance(part, str):
+                part = part.strip()
+                if not part:
+                    continue
+            try:
+                boiler_id = int(part)
+            except (TypeError, ValueError):
+                raise ValidationError({IDS_PARAM: f"Некорректный id: {part}"})
+            if boiler_id not in seen:
+                seen.add(boiler_id)
+                ids.append(boiler_id)
+    if not ids:
+        raise ValidationError({IDS_PARAM: "Укажите id товаров"})
+    if len(ids) > BATCH_MAX_IDS:
+        raise ValidationError(
+            {IDS_PARAM: f"Не более {BATCH_MAX_IDS} id в одном запросе"}
+        )
+    return ids
+
+
+def get_boilers_batch(
+    ids: List[int], serializer_class, fields: Optional[List[str]] = None
+) -> Dict:
+    """
+    Записи котлов в порядке ids (один запрос)
+
+    Returns:
+        {"results": [...], "missing": [id, ...]}
+    """
+    qs = project(ElectricBoiler.objects.all(), serializer_class, fields)
+    boilers = qs.in_bulk(ids)
+    found = [boilers[boiler_id] for boiler_id in ids if boiler_id in boilers]
+    return {
+        "results": serializer_class(found, many=True, fields=fields).data,
+        "missing": [boiler_id for boiler_id in ids if boiler_id not in boilers],
+    }
@@ -0,0 +1,126 @@
+"""
+Версия каталога котлов для условных HTTP-ответов (ETag / Last-Modified)
+
+Версия вычисляется по количеству записей и max(updated_at) и хранится в кэше
+Django, поэтому проверка If-None-Match и выбор закэшированного ответа
+(products.response_cache) не требуют запросов к БД. Код, изменяющий каталог
+в обход save() (bulk_create / bulk_update парсера, reparse_boilers), вызывает
+bump_catalog_version(); изменения через save() и delete() (админка)
+обрабатываются сигналами (products.signals).
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime
+from functools import wraps
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+from rest_framework.permissions import SAFE_METHODS
+
+from .models import ElectricBoiler
+
+CATALOG_VERSION_CACHE_KEY = "products:catalog_version"
+
+
+@dataclass(frozen=True)
+class CatalogVersion:
+    """Версия каталога"""
+
+    tag: str
+    last_modified: Optional[datetime]
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.tag}"'
+
+
+def compute_catalog_version() -> CatalogVersion:
+    """Версия каталога по данным БД (один агрегирующий запрос)"""
+    stats = ElectricBoiler.objects.aggregate(
+        count=Count("id"), last_modified=Max("updated_at")
+    )
+    last_modified = stats["last_modified"]
+    raw = f"{stats['count']}:{last_modified.isoformat() if last_modified else ''}"
+    return CatalogVersion(
+        tag=hashlib.sha1(raw.encode("utf-8")).hexdigest()[:20],
+        last_modified=last_modified,
+    )
+
+
+def _store(version: CatalogVersion) -> None:
+    cache.set(
+        CATALOG_VERSION_CACHE_KEY,
+        (version.tag, version.last_modified),
+        settings.CATALOG_VERSION_TIMEOUT,
+    )
+
+
+def get_catalog_version() -> CatalogVersion:
+    """Текущая версия каталога (из кэша, при отсутствии - по БД)"""
+    cached = cache.get(CATALOG_VERSION_CACHE_KEY)
+    if cached is not None:
+        return CatalogVersion(*cached)
+    version = compute_catalog_version()
+    _store(version)
+    return version
+
+
+def request_catalog_version(request) -> CatalogVersion:
+    """Версия каталога, запомненная на время обработки запроса"""
+    version = getattr(request, "catalog_version", None)
+    if version is None:
+        version = get_catalog_version()
+        request.catalog_version = version
+    return version
+
+
+def bump_catalog_version() -> CatalogVersion:
+    """
+    Пересчет версии каталога после изменения данных
+
+    Ответы, закэшированные для прежней версии, перестают использоваться.
+    """
+    from .response_cache import response_cache
+
+    version = compute_catalog_version()
+    _store(version)
+    response_cache.clear_local()
+    return version
+
+
+def conditional_on_catalog_version(view_method):
+    """
+    Декоратор метода ViewSet: ETag и Last-Modified по версии каталога
+
+    Если клиент прислал совпадающий If-None-Match (или If-Modified-Since),
+    возвращается 304 без вызова метода и без запросов к БД. Ответы помечаются
+    Cache-Control: no-cache, чтобы браузер перепроверял их при каждом запросе.
+    Запросы, кроме GET/HEAD (например, POST /boilers/batch/), не проверяются.
+    """
+
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        if request.method not in SAFE_METHODS:
+            return view_method(self, request, *args, **kwargs)
+        version = request_catalog_version(request)
+        last_modified = (
+            int(version.last_modified.timestamp()) if version.last_modified else None
+        )
+        response = get_conditional_response(
+            request, etag=version.etag, last_modified=last_modified
+        )
+        if response is None:
+            response = view_method(self, request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response.headers.setdefault("ETag", version.etag)
+            if last_modified is not None:
+                response.headers.setdefault("Last-Modified", http_date(last_modified))
+            patch_cache_control(response, no_cache=True)
+        return response
+
+    return wrapper
@@ -0,0 +1,113 @@
+"""
+Изменения каталога с момента since (синхронизация локальной копии клиента)
+
+Измененные и добавленные котлы выбираются по индексу updated_at, удаленные -
+по отметкам DeletedBoiler. Ответ содержит новую метку since для следующего
+запроса: максимальное время изменения среди возвращенных записей, но не
+позже, чем за CHANGES_SAFETY_OVERLAP_SECONDS до момента запроса.
+
+updated_at и deleted_at проставляются до фиксации транзакции, поэтому запись
+с меткой T может стать видимой уже после того, как клиент получил since >= T.
+Отступ метки назад гарантирует, что такая запись будет возвращена, если ее
+транзакция зафиксирована в течение CHANGES_SAFETY_OVERLAP_SECONDS после
+метки. Записи из интервала отступа возвращаются повторно, поэтому клиент
+применяет upserted и deleted идемпотентно (по id). При неизменном каталоге
+ответ для той же метки не меняется.
+"""
+
+import re
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+
+from .fieldsets import project
+from .models import DeletedBoiler, ElectricBoiler
+
+SINCE_PARAM = "since"
+UTC_OFFSET_SPACE_RE = re.compile(r" (\d{2}(?::?\d{2})?)$")
+
+
+def parse_since(value: Optional[str]) -> Optional[datetime]:
+    """
+    Метка since: дата/время ISO 8601 или метка времени Unix (секунды)
+
+    Returns:
+        Дата/время с часовым поясом или None, если параметр не задан
+    """
+    if value in (None, ""):
+        return None
+    try:
+        return datetime.fromtimestamp(float(value), tz=dt_timezone.utc)
+    except (OverflowError, ValueError):
+        pass
+    # "+" смещения часового пояса в незакодированном URL превращается в пробел
+    value = UTC_OFFSET_SPACE_RE.sub(r"+\1", value)
+    try:
+        since = parse_datetime(value)
+    except ValueError:
+        since = None
+    if since is None:
+        raise ValidationError(
+            {SINCE_PARAM: "Ожидается дата/время ISO 8601 или метка времени Unix"}
+        )
+    if timezone.is_naive(since):
+        since = timezone.make_aware(since, dt_timezone.utc)
+    return since
+
+
+def tombstone_cutoff() -> datetime:
+    """Время, раньше которого отметки об удалении не хранятся"""
+    return timezone.now() - timedelta(days=settings.CHANGES_TOMBSTONE_RETENTION_DAYS)
+
+
+def prune_tombstones() -> int:
+    """Удаление устаревших отметок DeletedBoiler"""
+    deleted, _ = DeletedBoiler.objects.filter(deleted_at__lt=tombstone_cutoff()).delete()
+    return deleted
+
+
+def get_changes(
+    since: Optional[datetime], serializer_class, fields: Optional[List[str]] = None
+) -> Dict:
+    """
+    Котлы, измененные после since, и id удаленных котлов
+
+    Если since не задана или старше срока хранения отметок об удалении,
+    возвращаются все котлы и reset=True: клиент заменяет локальную копию.
+
+    Returns:
+        {"since": "...", "reset": bool, "upserted": [...], "deleted": [id, ...]}
+    """
+    reset = since is None or since < tombstone_cutoff()
+    boilers = ElectricBoiler.objects.order_by("updated_at", "id")
+    tombstones = []
+    if not reset:
+        boilers = boilers.filter(updated_at__gt=since)
+        tombstones = list(
+            DeletedBoiler.objects.filter(deleted_at__gt=since).values_list(
+                "boiler_id", "deleted_at"
+            )
+        )
+
+    # updated_at читается для новой метки since, даже если не запрошено в fields
+    upserted = list(project(boilers, serializer_class, fields, extra=["updated_at"]))
+    deleted_ids = sorted({boiler_id for boiler_id, _ in tombstones})
+
+    marks = [since] + [boiler.updated_at for boiler in upserted[-1:]]
+    marks += [deleted_at for _, deleted_at in tombstones]
+    marks = [mark for mark in marks if mark is not None]
+    next_since = max(marks) if marks else None
+    # Метка не новее момента, до которого все транзакции считаются зафиксированными
+    watermark = timezone.now() - timedelta(seconds=settings.CHANGES_SAFETY_OVERLAP_SECONDS)
+    if next_since is not None and next_since > watermark:
+        next_since = max(watermark, since) if since is not None else watermark
+    return {
+        "since": next_since.isoformat() if next_since else None,
+        "reset": reset,
+        "upserted": serializer_class(upserted, many=True, fields=fields).data,
+        "deleted": deleted_ids,
+    }
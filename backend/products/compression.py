@@ -0,0 +1,155 @@
+"""
+Сжатие ответов API (brotli, gzip)
+
+CompressionMiddleware сжимает ответы по Accept-Encoding клиента:
+- только типы содержимого из RESPONSE_COMPRESSION["CONTENT_TYPES"] (JSON,
+  CSV; HTML не сжимается - страницы админки содержат CSRF-токен);
+- обычные ответы - не короче RESPONSE_COMPRESSION["MIN_SIZE"] байт;
+- потоковые ответы сжимаются по частям со сбросом буфера после каждой
+  части, поэтому клиент получает данные без задержки;
+- ответы 304, ответы без тела и уже сжатые ответы (снимки каталога
+  с готовыми .gz/.br) не обрабатываются.
+
+Для ответов из products.response_cache сжатое тело сохраняется в том же
+кэше рядом с исходным, и повторные запросы не сжимаются заново.
+"""
+
+import re
+import zlib
+from typing import Optional, Set
+
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from .response_cache import response_cache
+
+try:
+    import brotli
+except ImportError:  # без пакета brotli ответы сжимаются только gzip
+    brotli = None
+
+# Кодировки в порядке предпочтения
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+CACHED_BODY_ATTR = "compression_cache_key"
+
+_q_zero_re = re.compile(r"^q=0(\.0*)?$")
+
+
+def accepted_encodings(request) -> Set[str]:
+    """Кодировки из Accept-Encoding (кроме запрещенных через q=0)"""
+    accepted = set()
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        name, *params = [item.strip().lower() for item in part.split(";")]
+        if name and not any(_q_zero_re.match(param) for param in params):
+            accepted.add(name)
+    return accepted
+
+
+def choose_encoding(request) -> Optional[str]:
+    accepted = accepted_encodings(request)
+    for encoding in ENCODINGS:
+        if encoding in accepted or "*" in accepted:
+            return encoding
+    return None
+
+
+def compress(content: bytes, encoding: str) -> bytes:
+    config = settings.RESPONSE_COMPRESSION
+    if encoding == "br":
+        return brotli.compress(content, quality=config["BROTLI_QUALITY"])
+    compressor = zlib.compressobj(config["GZIP_LEVEL"], zlib.DEFLATED, 31)
+    return compressor.compress(content) + compressor.flush()
+
+
+class StreamCompressor:
+    """Потоковое сжатие: каждая часть сбрасывается и может быть отправлена сразу"""
+
+    def __init__(self, encoding: str) -> None:
+        config = settings.RESPONSE_COMPRESSION
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=config["BROTLI_QUALITY"])
+        else:
+            self._compressor = zlib.compressobj(config["GZIP_LEVEL"], zlib.DEFLATED, 31)
+        self.encoding = encoding
+
+    def chunk(self, data) -> bytes:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+    def wrap(self, iterator):
+        for data in iterator:
+            compressed = self.chunk(data)
+            if compressed:
+                yield compressed
+        yield self.finish()
+
+    async def awrap(self, iterator):
+        async for data in iterator:
+            compressed = self.chunk(data)
+            if compressed:
+                yield compressed
+        yield self.finish()
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """Сжатие ответов API по Accept-Encoding (см. описание модуля)"""
+
+    def process_response(self, request, response):
+        if response.status_code == 304 or response.has_header("Content-Encoding"):
+            return response
+        content_type = response.get("Content-Type", "").split(";")[0].strip().lower()
+        if content_type not in settings.RESPONSE_COMPRESSION["CONTENT_TYPES"]:
+            return response
+        if not response.streaming and (
+            len(response.content) < settings.RESPONSE_COMPRESSION["MIN_SIZE"]
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        encoding = choose_encoding(request)
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            compressor = StreamCompressor(encoding)
+            if response.is_async:
+                response.streaming_content = compressor.awrap(response.streaming_content)
+            else:
+                response.streaming_content = compressor.wrap(response.streaming_content)
+            # Размер сжатого потока заранее неизвестен
+            del response.headers["Content-Length"]
+        else:
+            compressed = self._cached_compress(response, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # Сильный ETag относится к несжатому телу (RFC 9110, 8.8.1)
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def _cached_compress(self, response, encoding: str) -> bytes:
+        """Сжатое тело, для ответов из response_cache - из кэша"""
+        cache_key = getattr(response, CACHED_BODY_ATTR, None)
+        if cache_key is None:
+            return compress(response.content, encoding)
+        version, key = cache_key
+        key = f"{key}|{encoding}"
+        compressed = response_cache.get(version, key)
+        if compressed is None:
+            compressed = compress(response.content, encoding)
+            response_cache.set(version, key, compressed)
+        return compressed
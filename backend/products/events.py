@@ -0,0 +1,128 @@
+"""
+События изменения каталога для клиентов (server-sent events)
+
+Парсер, reparse_boilers и админка работают в разных процессах с сервером,
+поэтому события передаются через общий кэш Django (тот же, что хранит
+версию каталога): публикация записывает событие под следующим номером,
+потоки SSE (views.catalog_events) опрашивают номер последнего события
+с интервалом CATALOG_EVENTS["POLL_INTERVAL"]. Брокер можно заменить
+на Redis pub/sub, сохранив методы publish() и read().
+
+Номера событий выдает cache.incr, поэтому кэш CATALOG_EVENTS["CACHE_ALIAS"]
+должен увеличивать счетчик атомарно: Redis или Memcached (LocMemCache
+атомарен, но события видны только внутри одного процесса). В FileBasedCache
+и DatabaseCache incr - это чтение и запись, два процесса могут получить
+один номер и перезаписать событие друг друга; с такими кэшами события
+не публикуются, а /boilers/events/ отвечает 503 (клиент опрашивает API
+по таймеру).
+"""
+
+import logging
+from typing import Dict, Iterable, List, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.cache.backends.memcached import BaseMemcachedCache
+from django.core.cache.backends.redis import RedisCache
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CACHE_PREFIX = "products:events"
+
+# Бэкенды кэша с атомарным incr
+ATOMIC_INCR_BACKENDS = (RedisCache, BaseMemcachedCache, LocMemCache)
+
+
+class CacheEventBroker:
+    """Очередь событий в кэше Django с последовательными номерами"""
+
+    def __init__(self, alias: str, ttl: int, max_backlog: int) -> None:
+        """
+        Args:
+            alias: Алиас CACHES
+            ttl: Время хранения события (секунды)
+            max_backlog: Сколько последних событий отдается отставшему подписчику
+        """
+        self.alias = alias
+        self.ttl = ttl
+        self.max_backlog = max_backlog
+        self.sequence_key = f"{EVENTS_CACHE_PREFIX}:last"
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def available(self) -> bool:
+        """Кэш брокера выдает номера событий атомарно (см. описание модуля)"""
+        return isinstance(self.cache, ATOMIC_INCR_BACKENDS)
+
+    def _event_key(self, event_id: int) -> str:
+        return f"{EVENTS_CACHE_PREFIX}:{event_id}"
+
+    def last_id(self) -> int:
+        """Номер последнего опубликованного события (0 - событий не было)"""
+        return self.cache.get(self.sequence_key, 0)
+
+    def publish(self, data: Dict) -> int:
+        """Публикация события, возвращает его номер"""
+        if not self.available:
+            raise RuntimeError(
+                f"Кэш {self.alias!r} ({type(self.cache).__name__}) не поддерживает "
+                "атомарный incr, события каталога отключены"
+            )
+        self.cache.add(self.sequence_key, 0, None)
+        event_id = self.cache.incr(self.sequence_key)
+        self.cache.set(self._event_key(event_id), data, self.ttl)
+        return event_id
+
+    def read(self, after: int) -> List[Tuple[int, Dict]]:
+        """
+        События с номерами больше after (не более max_backlog последних)
+
+        Если счетчик событий был сброшен (очистка кэша), возвращаются
+        события нового счетчика.
+        """
+        last = self.last_id()
+        if last == after:
+            return []
+        if last < after:
+            after = 0
+        first = max(after + 1, last - self.max_backlog + 1)
+        keys = {self._event_key(event_id): event_id for event_id in range(first, last + 1)}
+        found = self.cache.get_many(list(keys))
+        return sorted((keys[key], data) for key, data in found.items())
+
+
+event_broker = CacheEventBroker(
+    alias=settings.CATALOG_EVENTS["CACHE_ALIAS"],
+    ttl=settings.CATALOG_EVENTS["TTL"],
+    max_backlog=settings.CATALOG_EVENTS["MAX_BACKLOG"],
+)
+
+
+def publish_catalog_change(
+    version, changed: Iterable[int] = (), deleted: Iterable[int] = ()
+) -> None:
+    """
+    Событие "каталог изменен" для подписчиков /boilers/events/
+
+    Args:
+        version: Новая версия каталога (CatalogVersion)
+        changed: id добавленных и измененных котлов
+        deleted: id удаленных котлов
+    """
+    if not event_broker.available:
+        return
+    try:
+        event_broker.publish(
+            {
+                "version": version.tag,
+                "changed": sorted(changed),
+                "deleted": sorted(deleted),
+            }
+        )
+    except Exception as e:
+        # Клиенты узнают об изменении по версии каталога при следующем запросе
+        logger.warning(f"Не удалось опубликовать событие изменения каталога: {e}")
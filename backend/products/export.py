@@ -0,0 +1,112 @@
+"""
+Потоковая выгрузка каталога котлов (JSON Lines, CSV)
+
+Строки читаются из БД курсором (QuerySet.iterator) порциями по
+CATALOG_EXPORT_CHUNK_SIZE и сразу отправляются клиенту, поэтому память
+сервера не зависит от размера каталога. Поля - как у карточки товара
+(ElectricBoilerDetailSerializer, включая все характеристики), значения
+строятся из values_list (products.fast_json).
+"""
+
+import csv
+import io
+from itertools import islice
+from typing import Iterator, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+
+from .fast_json import ValuesRows, dumps
+
+OUTPUT_PARAM = "output"
+# Формат выгрузки -> (Content-Type, расширение файла)
+EXPORT_FORMATS = {
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "csv": ("text/csv", "csv"),
+}
+DEFAULT_EXPORT_FORMAT = "jsonl"
+
+
+def parse_output(params) -> str:
+    """Формат выгрузки из ?output= (jsonl или csv)"""
+    output = (params.get(OUTPUT_PARAM) or DEFAULT_EXPORT_FORMAT).strip().lower()
+    if output not in EXPORT_FORMATS:
+        raise ValidationError(
+            {OUTPUT_PARAM: f"Ожидается одно из: {', '.join(EXPORT_FORMATS)}"}
+        )
+    return output
+
+
+def _chunks(iterator, size: int) -> Iterator[List]:
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _jsonl(rows: ValuesRows, chunks) -> Iterator[bytes]:
+    for chunk in chunks:
+        yield b"".join(dumps(row) + b"\n" for row in rows.rows(chunk))
+
+
+def _csv(rows: ValuesRows, chunks) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush() -> bytes:
+        content = buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+        return content
+
+    writer.writerow(rows.names)
+    yield flush()
+    for chunk in chunks:
+        writer.writerows(
+            ["" if value is None else value for value in row.values()]
+            for row in rows.rows(chunk)
+        )
+        yield flush()
+
+
+def export_rows(
+    queryset, serializer_class, output: str, fields: Optional[List[str]] = None
+) -> Iterator[bytes]:
+    """
+    Части файла выгрузки
+
+    Args:
+        queryset: Отфильтрованные и отсортированные котлы
+        serializer_class: Сериализатор, задающий поля и их порядок
+        output: Формат (ключ EXPORT_FORMATS)
+        fields: Поля из ?fields= (None - все)
+
+    Returns:
+        Итератор байт: одна часть на порцию строк из БД
+    """
+    rows = ValuesRows(serializer_class, fields)
+    chunk_size = settings.CATALOG_EXPORT_CHUNK_SIZE
+    tuples = rows.queryset(queryset).iterator(chunk_size=chunk_size)
+    chunks = _chunks(tuples, chunk_size)
+    if output == "csv":
+        return _csv(rows, chunks)
+    return _jsonl(rows, chunks)
+
+
+async def aiter_sync(iterator):
+    """
+    Асинхронный итератор поверх синхронного (для ответа под ASGI)
+
+    StreamingHttpResponse под ASGI читает синхронный итератор целиком перед
+    отправкой. Здесь части читаются по одной в потоке запроса
+    (thread_sensitive), где открыт курсор БД.
+    """
+    sentinel = object()
+    read = sync_to_async(next, thread_sensitive=True)
+    while True:
+        part = await read(iterator, sentinel)
+        if part is sentinel:
+            return
+        yield part
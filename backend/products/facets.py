@@ -0,0 +1,112 @@
+"""
+Счетчики фасетов каталога для боковой панели фильтров
+
+Все счетчики вычисляются одним запросом с группировкой по сочетанию
+измерений (производитель, страна, диапазон мощности, наличие функций):
+число таких сочетаний не больше числа котлов, а счетчики каждого фасета
+суммируются из строк результата.
+"""
+
+from collections import Counter
+from typing import Any, Dict, Optional
+
+from django.db.models import BooleanField, Case, CharField, Count, Value, When
+
+from .filters import FEATURE_FIELDS, POWER_BANDS, feature_flag_q
+
+
+def power_band_label(lower: Optional[int], upper: Optional[int]) -> str:
+    if lower is None:
+        return f"до {upper} кВт"
+    if upper is None:
+        return f"от {lower} кВт"
+    return f"{lower}–{upper} кВт"
+
+
+def _power_band_expression():
+    whens = [
+        When(power_max_kw__lte=upper, then=Value(key))
+        for key, _, upper in POWER_BANDS
+        if upper is not None
+    ]
+    open_key = next(key for key, _, upper in POWER_BANDS if upper is None)
+    return Case(
+        When(power_max_kw__isnull=True, then=Value(None)),
+        *whens,
+        default=Value(open_key),
+        output_field=CharField(),
+    )
+
+
+def compute_facets(queryset) -> Dict[str, Any]:
+    """
+    Счетчики фасетов для котлов queryset (одним запросом)
+
+    Returns:
+        {
+            "total": N,
+            "manufacturers": [{"slug", "name", "count"}, ...],
+            "countries": [{"value", "count"}, ...],
+            "power": [{"key", "label", "min", "max", "count"}, ...],
+            "features": {"wifi": N, "thermostat": N, ...},
+        }
+    """
+    flags = {
+        f"has_{field}": Case(
+            When(feature_flag_q(field), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+        for field in FEATURE_FIELDS
+    }
+    rows = (
+        queryset.order_by()
+        .annotate(power_band=_power_band_expression(), **flags)
+        .values("manufacturer", "manufacturer__name", "country", "power_band", *flags)
+        .annotate(count=Count("id"))
+    )
+
+    total = 0
+    manufacturers: Counter = Counter()
+    manufacturer_names: Dict[str, str] = {}
+    countries: Counter = Counter()
+    power_bands: Counter = Counter()
+    features: Counter = Counter()
+    for row in rows:
+        count = row["count"]
+        total += count
+        if row["manufacturer"]:
+            manufacturers[row["manufacturer"]] += count
+            manufacturer_names[row["manufacturer"]] = row["manufacturer__name"]
+        if row["country"]:
+            countries[row["country"]] += count
+        if row["power_band"]:
+            power_bands[row["power_band"]] += count
+        for field in FEATURE_FIELDS:
+            if row[f"has_{field}"]:
+                features[field] += count
+
+    return {
+        "total": total,
+        "manufacturers": sorted(
+            (
+                {"slug": slug, "name": manufacturer_names[slug], "count": count}
+                for slug, count in manufacturers.items()
+            ),
+            key=lambda item: item["name"].lower(),
+        ),
+        "countries": [
+            {"value": value, "count": count} for value, count in countries.most_common()
+        ],
+        "power": [
+            {
+                "key": key,
+                "label": power_band_label(lower, upper),
+                "min": lower,
+                "max": upper,
+                "count": power_bands[key],
+            }
+            for key, lower, upper in POWER_BANDS
+        ],
+        "features": {field: features[field] for field in FEATURE_FIELDS},
+    }
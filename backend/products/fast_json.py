@@ -0,0 +1,143 @@
+"""
+Быстрый путь JSON-ответов списков каталога
+
+- ValuesRows: строки ответа строятся из кортежей values_list по полям
+  сериализатора, без создания объектов модели и обхода полей ModelSerializer;
+- FastJSONRenderer: кодирование orjson (если установлен) или стандартным
+  C-кодировщиком json в байты за один вызов.
+
+Ответы совпадают с ответами через сериализатор и JSONRenderer DRF. Быстрый
+путь включается настройкой CATALOG_FAST_JSON и используется только для
+JSON-ответов (браузерный API DRF строится через сериализатор).
+"""
+
+from decimal import Decimal
+from typing import Callable, List, Optional
+
+from django.conf import settings
+from rest_framework import serializers
+from rest_framework.utils.encoders import JSONEncoder
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from .fieldsets import project
+from .metrics import timed
+
+try:
+    import orjson
+except ImportError:  # orjson необязателен, без него - стандартный json
+    orjson = None
+
+# Поля сериализатора, значения которых из БД выводятся без преобразования
+PLAIN_FIELD_TYPES = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+)
+
+_encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(data) -> bytes:
+    """JSON в байтах (как JSONRenderer DRF без отступов)"""
+    if orjson is not None:
+        content = orjson.dumps(data, default=_encoder.default)
+    else:
+        content = _encoder.encode(data).encode("utf-8")
+    # Как и DRF: вывод должен оставаться подмножеством JavaScript
+    if b"\xe2\x80\xa8" in content or b"\xe2\x80\xa9" in content:
+        content = content.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+    return content
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer с кодированием через dumps()"""
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+def _decimal_converter(field: serializers.DecimalField) -> Callable:
+    quantum = Decimal(1).scaleb(-field.decimal_places)
+
+    def convert(value):
+        return None if value is None else format(value.quantize(quantum), "f")
+
+    return convert
+
+
+def _converter(field) -> Optional[Callable]:
+    """Преобразование значения из БД в значение JSON (None - без преобразования)"""
+    if isinstance(field, PLAIN_FIELD_TYPES):
+        return None
+    if isinstance(field, serializers.DecimalField) and getattr(
+        field, "coerce_to_string", api_settings.COERCE_DECIMAL_TO_STRING
+    ):
+        return _decimal_converter(field)
+
+    def convert(value):
+        return None if value is None else field.to_representation(value)
+
+    return convert
+
+
+class SerializerRows:
+    """Строки ответа через сериализатор (объекты модели с only())"""
+
+    def __init__(self, serializer_class, fields: Optional[List[str]] = None) -> None:
+        self.serializer_class = serializer_class
+        self.fields = fields
+
+    def queryset(self, queryset):
+        return project(queryset, self.serializer_class, self.fields)
+
+    def rows(self, objects) -> List:
+        return self.serializer_class(objects, many=True, fields=self.fields).data
+
+
+class ValuesRows:
+    """Строки ответа из кортежей values_list по полям сериализатора"""
+
+    def __init__(self, serializer_class, fields: Optional[List[str]] = None) -> None:
+        serializer_fields = serializer_class().fields
+        # Порядок полей - как в сериализаторе
+        self.names = [
+            name for name in serializer_fields if fields is None or name in fields
+        ]
+        self.sources = [serializer_fields[name].source for name in self.names]
+        self.converters = [_converter(serializer_fields[name]) for name in self.names]
+
+    def queryset(self, queryset):
+        return queryset.values_list(*self.sources)
+
+    def rows(self, tuples) -> List[dict]:
+        return timed("serialize", self._rows, tuples)
+
+    def _rows(self, tuples) -> List[dict]:
+        names = self.names
+        if not any(self.converters):
+            return [dict(zip(names, row)) for row in tuples]
+        indexed = [
+            (index, convert) for index, convert in enumerate(self.converters) if convert
+        ]
+        result = []
+        for row in tuples:
+            row = list(row)
+            for index, convert in indexed:
+                row[index] = convert(row[index])
+            result.append(dict(zip(names, row)))
+        return result
+
+
+def row_builder(request, serializer_class, fields: Optional[List[str]] = None):
+    """ValuesRows для JSON-ответов (если включен CATALOG_FAST_JSON), иначе SerializerRows"""
+    renderer = getattr(request, "accepted_renderer", None)
+    if settings.CATALOG_FAST_JSON and renderer is not None and renderer.format == "json":
+        return ValuesRows(serializer_class, fields)
+    return SerializerRows(serializer_class, fields)
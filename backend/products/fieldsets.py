@@ -0,0 +1,58 @@
+"""
+Выборочные поля ответа котлов (?fields=id,name,price)
+
+Параметр ограничивает и поля JSON (сериализатор), и столбцы SELECT
+(QuerySet.only()), поэтому большие текстовые поля (описание, исходные
+характеристики) не читаются из БД, если клиент их не запросил. Без
+параметра из БД читаются только поля, которые выводит сериализатор.
+"""
+
+from typing import Iterable, List, Optional
+
+from rest_framework.exceptions import ValidationError
+
+from .filters import _list_param
+
+FIELDS_PARAM = "fields"
+
+
+def requested_fields(params, serializer_class) -> Optional[List[str]]:
+    """
+    Поля из ?fields= (id добавляется всегда)
+
+    Returns:
+        Список полей сериализатора или None, если параметр не задан
+
+    Raises:
+        ValidationError: Если запрошено поле, которого нет в сериализаторе
+    """
+    names = _list_param(params, FIELDS_PARAM)
+    if not names:
+        return None
+    available = serializer_class().fields
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValidationError(
+            {FIELDS_PARAM: f"Неизвестные поля: {', '.join(unknown)}"}
+        )
+    fields = ["id"]
+    for name in names:
+        if name not in fields:
+            fields.append(name)
+    return fields
+
+
+def project(queryset, serializer_class, fields: Optional[List[str]], extra: Iterable[str] = ()):
+    """
+    Ограничение столбцов SELECT полями, которые выведет сериализатор
+
+    Args:
+        queryset: Queryset котлов
+        serializer_class: Сериализатор ответа
+        fields: Поля из requested_fields() (None - все поля сериализатора)
+        extra: Дополнительные поля модели (например, ключ курсорной пагинации)
+    """
+    serializer_fields = serializer_class().fields
+    names = fields if fields is not None else list(serializer_fields)
+    columns = [serializer_fields[name].source for name in names]
+    return queryset.only(*columns, *extra)
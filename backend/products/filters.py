@@ -0,0 +1,189 @@
+"""
+Фильтрация и сортировка списка котлов по параметрам запроса
+
+Все условия выполняются в БД (по числовым полям из products.normalizers),
+поэтому клиенту передается только нужная страница каталога.
+"""
+
+from decimal import Decimal, InvalidOperation
+from typing import List, Optional, Tuple
+
+from django.db.models import F, Q
+from rest_framework.exceptions import ValidationError
+
+# Значения характеристик, означающие отсутствие функции
+NEGATIVE_FEATURE_VALUES = ("", "-", "—", "Ø", "no")
+
+# Функции котла, доступные как фильтры true/false и фасеты
+FEATURE_FIELDS = ("wifi", "thermostat", "floor_heating", "water_heating")
+
+# Диапазоны мощности (по максимальной мощности котла), кВт: (ключ, от, до]
+POWER_BANDS: List[Tuple[str, Optional[int], Optional[int]]] = [
+    ("0-6", None, 6),
+    ("6-12", 6, 12),
+    ("12-24", 12, 24),
+    ("24-", 24, None),
+]
+
+# Допустимые значения ?ordering= и соответствующие поля модели
+ORDERING_FIELDS = {
+    "name": "name",
+    "price": "price_byn",
+    "power": "power_max_kw",
+    "heating_area": "heating_area_m2",
+    "created": "created_at",
+    "updated": "updated_at",
+}
+DEFAULT_ORDERING = "name"
+
+TRUE_VALUES = ("1", "true", "yes", "on")
+FALSE_VALUES = ("0", "false", "no", "off")
+
+
+def _decimal_param(params, name):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    try:
+        return Decimal(value.replace(",", "."))
+    except InvalidOperation:
+        raise ValidationError({name: "Ожидается число"})
+
+
+def _bool_param(params, name):
+    value = params.get(name)
+    if value in (None, ""):
+        return None
+    value = value.lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise ValidationError({name: "Ожидается true или false"})
+
+
+def _list_param(params, name):
+    """Значения параметра: ?country=a,b или ?country=a&country=b"""
+    values = []
+    for raw in params.getlist(name):
+        values.extend(v.strip() for v in raw.split(",") if v.strip())
+    return values
+
+
+def feature_flag_q(field):
+    """Условие "функция есть": значение заполнено и не означает отсутствие"""
+    return ~(
+        Q(**{f"{field}__isnull": True})
+        | Q(**{f"{field}__in": NEGATIVE_FEATURE_VALUES})
+        | Q(**{f"{field}__istartswith": "нет"})
+    )
+
+
+def power_band_q(key):
+    """Котлы диапазона мощности POWER_BANDS"""
+    for band_key, lower, upper in POWER_BANDS:
+        if band_key == key:
+            condition = Q(power_max_kw__isnull=False)
+            if lower is not None:
+                condition &= Q(power_max_kw__gt=lower)
+            if upper is not None:
+                condition &= Q(power_max_kw__lte=upper)
+            return condition
+    raise ValidationError(
+        {"power_band": f"Допустимые значения: {', '.join(k for k, _, _ in POWER_BANDS)}"}
+    )
+
+
+def filter_boilers(queryset, params):
+    """
+    Применение фильтров из параметров запроса
+
+    Поддерживаемые параметры:
+    - manufacturer: slug производителя (можно несколько через запятую)
+    - search: подстрока наименования или мощности
+    - power_min, power_max: диапазон мощности, кВт (пересечение диапазонов)
+    - power_band: диапазон мощности из POWER_BANDS (можно несколько через запятую)
+    - price_min, price_max: диапазон цены, BYN
+    - country: страна производства (можно несколько через запятую)
+    - wifi, thermostat, floor_heating, water_heating: true/false - наличие
+      WiFi, комнатного термостата, теплого пола, нагрева воды
+
+    Raises:
+        ValidationError: При некорректных значениях параметров
+    """
+    manufacturers = [slug.lower() for slug in _list_param(params, "manufacturer")]
+    if manufacturers:
+        queryset = queryset.filter(manufacturer__in=manufacturers)
+
+    search = (params.get("search") or "").strip()
+    if search:
+        queryset = queryset.filter(
+            Q(name__icontains=search) | Q(power__icontains=search)
+        )
+
+    power_min = _decimal_param(params, "power_min")
+    if power_min is not None:
+        queryset = queryset.filter(power_max_kw__gte=power_min)
+    power_max = _decimal_param(params, "power_max")
+    if power_max is not None:
+        queryset = queryset.filter(power_min_kw__lte=power_max)
+
+    bands = _list_param(params, "power_band")
+    if bands:
+        condition = Q()
+        for key in bands:
+            condition |= power_band_q(key)
+        queryset = queryset.filter(condition)
+
+    price_min = _decimal_param(params, "price_min")
+    if price_min is not None:
+        queryset = queryset.filter(price_byn__gte=price_min)
+    price_max = _decimal_param(params, "price_max")
+    if price_max is not None:
+        queryset = queryset.filter(price_byn__lte=price_max)
+
+    countries = _list_param(params, "country")
+    if countries:
+        condition = Q()
+        for country in countries:
+            condition |= Q(country__iexact=country)
+        queryset = queryset.filter(condition)
+
+    for field in FEATURE_FIELDS:
+        value = _bool_param(params, field)
+        if value is True:
+            queryset = queryset.filter(feature_flag_q(field))
+        elif value is False:
+            queryset = queryset.exclude(feature_flag_q(field))
+
+    return queryset
+
+
+def get_ordering(params):
+    """
+    Поле сортировки из ?ordering= (name, price, power, heating_area, created,
+    updated; "-" перед названием - по убыванию)
+
+    Returns:
+        Кортеж (имя поля модели, по убыванию)
+    """
+    value = (params.get("ordering") or DEFAULT_ORDERING).strip()
+    descending = value.startswith("-")
+    key = value.lstrip("-")
+    if key not in ORDERING_FIELDS:
+        raise ValidationError(
+            {"ordering": f"Допустимые значения: {', '.join(ORDERING_FIELDS)}"}
+        )
+    return ORDERING_FIELDS[key], descending
+
+
+def order_boilers(queryset, params):
+    """
+    Сортировка по ?ordering=. Котлы без значения (например, без цены) идут
+    в конце, id - дополнительный ключ для стабильного порядка страниц.
+    """
+    field, descending = get_ordering(params)
+    expression = F(field).desc(nulls_last=True) if descending else F(field).asc(
+        nulls_last=True
+    )
+    return queryset.order_by(expression, "-id" if descending else "id")
@@ -0,0 +1,70 @@
+"""
+Сравнение стоимости сериализации списка карточек каталога
+
+Измеряет время построения и кодирования JSON для котлов из БД двумя путями:
+ElectricBoilerSerializer + JSONRenderer DRF и values_list + FastJSONRenderer
+(products.fast_json). Время запроса к БД не учитывается: строки читаются
+заранее.
+
+Запуск: python manage.py benchmark_catalog_json [--repeat N]
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from rest_framework.renderers import JSONRenderer
+
+from products.fast_json import FastJSONRenderer, ValuesRows, orjson
+from products.fieldsets import project
+from products.models import ElectricBoiler
+from products.serializers import ElectricBoilerSerializer
+
+
+class Command(BaseCommand):
+    help = "Сравнивает время сериализации карточек каталога (DRF и быстрый путь)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Количество повторов каждого измерения",
+        )
+
+    def _measure(self, func, repeat: int) -> float:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    def handle(self, *args, **options):
+        repeat = max(1, options["repeat"])
+        queryset = ElectricBoiler.objects.order_by("name", "id")
+        objects = list(project(queryset, ElectricBoilerSerializer, None))
+        rows = ValuesRows(ElectricBoilerSerializer)
+        tuples = list(rows.queryset(queryset))
+        if not objects:
+            self.stdout.write("В БД нет котлов")
+            return
+
+        drf_renderer = JSONRenderer()
+        fast_renderer = FastJSONRenderer()
+        drf = self._measure(
+            lambda: drf_renderer.render(
+                ElectricBoilerSerializer(objects, many=True).data
+            ),
+            repeat,
+        )
+        fast = self._measure(
+            lambda: fast_renderer.render(rows.rows(tuples)), repeat
+        )
+
+        count = len(objects)
+        encoder = "orjson" if orjson is not None else "json"
+        self.stdout.write(
+            f"Котлов: {count}\n"
+            f"Сериализатор + JSONRenderer: {drf * 1e6 / count:.2f} мкс/строка\n"
+            f"values_list + {encoder}: {fast * 1e6 / count:.2f} мкс/строка\n"
+        )
+        self.stdout.write(self.style.SUCCESS(f"Ускорение: {drf / fast:.1f}x"))
@@ -0,0 +1,37 @@
+"""
+Запись статических JSON-снимков каталога (products.snapshots)
+
+Обычно снимки записываются автоматически после запуска парсера и изменений
+в админке; команда нужна после ручных изменений в БД или смены ROOT.
+
+Запуск: python manage.py publish_snapshots [--force]
+"""
+import time
+
+from django.core.management.base import BaseCommand
+
+from products.snapshots import publish_snapshots, snapshots_root
+
+
+class Command(BaseCommand):
+    help = "Записывает JSON-снимки каталога (gzip, brotli) для текущей версии"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Перезаписать снимок, даже если он для текущей версии уже есть",
+        )
+
+    def handle(self, *args, **options):
+        start_time = time.time()
+        current = publish_snapshots(force=options["force"])
+        if current is None:
+            self.stdout.write("Снимок текущей версии каталога уже записан")
+            return
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Снимок {current['version']} записан в {snapshots_root()} "
+                f"({time.time() - start_time:.2f}с)"
+            )
+        )
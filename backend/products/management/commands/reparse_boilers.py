@@ -0,0 +1,220 @@
+"""
+Повторный разбор сохраненных данных котлов
+
+Применяет текущую версию разбора парсера к сохраненным исходным данным без
+повторной загрузки сайта и пересчитывает все производные поля:
+характеристики (raw_specifications и description), цену (HTML карточки
+каталога raw_listing_html), числовые поля и производителя (наименование).
+Разбираются котлы, записанные парсером с исходными данными (заполнено
+raw_specifications или raw_listing_html). Строки обрабатываются пачками
+в нескольких процессах, изменения записываются через bulk_update.
+
+Запуск: python manage.py reparse_boilers [--workers N] [--chunk-size N] [--dry-run]
+"""
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+
+from parsers.listing import normalize_price, price_from_listing_html
+from parsers.spec_parser import SPEC_FIELDS, extract_spec_fields
+from products.catalog_version import bump_catalog_version
+from products.events import publish_catalog_change
+from products.models import ElectricBoiler, Manufacturer
+from products.normalizers import (
+    NUMERIC_FIELDS,
+    manufacturer_from_name,
+    numeric_spec_values,
+    parse_price,
+)
+from products.search import update_search_vectors
+from products.snapshots import publish_snapshots_on_commit
+
+# Исходные данные для разбора
+SOURCE_FIELDS = ("id", "name", "raw_specifications", "description", "raw_listing_html")
+# Поля, которые пересчитываются из исходных данных
+DERIVED_FIELDS = (*SPEC_FIELDS, "price", *NUMERIC_FIELDS, "manufacturer_id")
+# Котлы, записанные парсером вместе с исходными данными
+HAS_SOURCE = (~Q(raw_specifications__isnull=True) & ~Q(raw_specifications="")) | (
+    ~Q(raw_listing_html__isnull=True) & ~Q(raw_listing_html="")
+)
+# Сколько пачек на один воркер читается из БД заранее
+MAX_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def reparse_chunk(rows: List[Dict[str, Any]]) -> List[Tuple[int, Dict[str, Any]]]:
+    """
+    Разбор пачки строк (выполняется в процессе-воркере)
+
+    Args:
+        rows: Словари с полями SOURCE_FIELDS и текущей ценой (price)
+
+    Returns:
+        Список (id, {поле: значение}) с новыми значениями всех DERIVED_FIELDS
+    """
+    result = []
+    for row in rows:
+        specs_dict = extract_spec_fields(
+            row["raw_specifications"], row["description"], row["name"]
+        )
+        values = {field: specs_dict.get(field) for field in SPEC_FIELDS}
+        # Без HTML карточки (котлы, записанные до его сохранения) цена
+        # остается прежней, пересчитывается только price_byn
+        if row["raw_listing_html"]:
+            values["price"] = normalize_price(
+                price_from_listing_html(row["raw_listing_html"])
+            )
+        else:
+            values["price"] = row["price"]
+        values.update(
+            numeric_spec_values(
+                values["power"], values["heating_area"], values["voltage"]
+            )
+        )
+        values["price_byn"] = parse_price(values["price"])
+        manufacturer = manufacturer_from_name(row["name"])
+        values["manufacturer_id"] = manufacturer[0] if manufacturer else None
+        result.append((row["id"], values))
+    return result
+
+
+class Command(BaseCommand):
+    help = (
+        "Повторно извлекает характеристики, цену и производителя котлов "
+        "из сохраненных исходных данных и обновляет изменившиеся записи"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Количество процессов (1 - без пула процессов)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=500,
+            help="Количество строк в одной пачке",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Только подсчитать изменения, не записывая их в БД",
+        )
+
+    def _iter_chunks(self, chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Пачки строк с исходными данными (по возрастанию id)"""
+        queryset = ElectricBoiler.objects.filter(HAS_SOURCE).order_by("id")
+        last_id = 0
+        while True:
+            rows = list(
+                queryset.filter(id__gt=last_id).values(
+                    *SOURCE_FIELDS, *DERIVED_FIELDS
+                )[:chunk_size]
+            )
+            if not rows:
+                return
+            last_id = rows[-1]["id"]
+            yield rows
+
+    def _apply(
+        self,
+        rows: List[Dict[str, Any]],
+        parsed: List[Tuple[int, Dict[str, Any]]],
+        dry_run: bool,
+    ) -> List[int]:
+        """Запись изменившихся строк пачки, возвращает их id"""
+        current = {row["id"]: row for row in rows}
+        now = timezone.now()
+        changed = []
+        # Новые производители котлов, у которых производитель изменился
+        manufacturers = {}
+        # Производители, у которых изменилось количество котлов
+        affected = set()
+        for boiler_id, values in parsed:
+            row = current[boiler_id]
+            if all(row[field] == value for field, value in values.items()):
+                continue
+            boiler = ElectricBoiler(id=boiler_id, updated_at=now, **values)
+            changed.append(boiler)
+            if row["manufacturer_id"] != values["manufacturer_id"]:
+                affected.update((row["manufacturer_id"], values["manufacturer_id"]))
+                manufacturer = manufacturer_from_name(row["name"])
+                if manufacturer:
+                    manufacturers[manufacturer[0]] = manufacturer[1]
+
+        if changed and not dry_run:
+            # Записи производителей должны существовать до записи котлов
+            Manufacturer.objects.ensure(manufacturers)
+            ElectricBoiler.objects.bulk_update(
+                changed,
+                [
+                    *SPEC_FIELDS,
+                    "price",
+                    *NUMERIC_FIELDS,
+                    "manufacturer",
+                    "updated_at",
+                ],
+            )
+            update_search_vectors(
+                ElectricBoiler.objects.filter(id__in=[b.id for b in changed])
+            )
+            if affected:
+                Manufacturer.objects.refresh_counts(affected - {None})
+        return [b.id for b in changed]
+
+    def handle(self, *args, **options):
+        workers = max(1, options["workers"])
+        chunk_size = max(1, options["chunk_size"])
+        dry_run = options["dry_run"]
+        start_time = time.time()
+
+        total = 0
+        updated = []
+        skipped = ElectricBoiler.objects.exclude(HAS_SOURCE).count()
+
+        if workers == 1:
+            for rows in self._iter_chunks(chunk_size):
+                updated += self._apply(rows, reparse_chunk(rows), dry_run)
+                total += len(rows)
+        else:
+            # Пачки читаются и отправляются воркерам по мере обработки:
+            # в работе не больше MAX_CHUNKS_IN_FLIGHT_PER_WORKER пачек на воркер
+            window = workers * MAX_CHUNKS_IN_FLIGHT_PER_WORKER
+            pending = deque()
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for rows in self._iter_chunks(chunk_size):
+                    if not pending:
+                        # При fork процессы создаются при первой отправке задачи:
+                        # соединения с БД не должны наследоваться ими
+                        connections.close_all()
+                    pending.append((rows, executor.submit(reparse_chunk, rows)))
+                    if len(pending) >= window:
+                        done_rows, future = pending.popleft()
+                        updated += self._apply(done_rows, future.result(), dry_run)
+                        total += len(done_rows)
+                while pending:
+                    done_rows, future = pending.popleft()
+                    updated += self._apply(done_rows, future.result(), dry_run)
+                    total += len(done_rows)
+
+        if updated and not dry_run:
+            version = bump_catalog_version()
+            publish_catalog_change(version, changed=updated)
+            publish_snapshots_on_commit()
+
+        action = "будет обновлено" if dry_run else "обновлено"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Разобрано котлов: {total}, {action}: {len(updated)}, "
+                f"без исходных данных: {skipped} "
+                f"({time.time() - start_time:.2f}с, процессов: {workers})"
+            )
+        )
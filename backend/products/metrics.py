@@ -0,0 +1,248 @@
+"""
+Метрики запросов к API: время, запросы к БД, сериализация, размер ответа
+
+RequestMetricsMiddleware для каждого запроса измеряет:
+- total - общее время обработки;
+- db - количество запросов к БД и их суммарное время (через
+  connection.execute_wrapper, работает и без DEBUG);
+- serialize - время сериализаторов DRF с TimedSerializerMixin
+  и построения строк быстрого пути (products.fast_json);
+- render - время рендерера DRF (InstrumentedViewMixin);
+- bytes - размер тела ответа, переданного клиенту: middleware стоит
+  в MIDDLEWARE выше CompressionMiddleware, а ответ проходит middleware снизу
+  вверх, поэтому сюда он попадает уже сжатым.
+
+Значения передаются клиенту заголовком Server-Timing (видны в DevTools
+браузера) и накапливаются по endpoint в гистограммах, которые отдает
+GET /metrics/ (views.request_metrics). Гистограммы хранятся в памяти
+процесса: у каждого процесса сервера свои. Запросы с числом обращений
+к БД больше REQUEST_METRICS["QUERY_WARNING_THRESHOLD"] пишутся в лог.
+
+Для потоковых ответов (выгрузка, события) учитывается только время до
+начала передачи тела.
+"""
+
+import logging
+import threading
+from bisect import bisect_left
+from contextlib import ExitStack
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Границы корзин гистограмм (значение попадает в первую корзину с le >= значения)
+TIME_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+BYTES_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRIC_BUCKETS = {
+    "total_ms": TIME_BUCKETS_MS,
+    "db_ms": TIME_BUCKETS_MS,
+    "db_queries": QUERY_BUCKETS,
+    "serialize_ms": TIME_BUCKETS_MS,
+    "render_ms": TIME_BUCKETS_MS,
+    "bytes": BYTES_BUCKETS,
+}
+
+_current: ContextVar[Optional["RequestMetrics"]] = ContextVar(
+    "request_metrics", default=None
+)
+
+
+class RequestMetrics:
+    """Метрики одного запроса"""
+
+    def __init__(self) -> None:
+        self.start = perf_counter()
+        self.queries = 0
+        self.sql_time = 0.0
+        self.timings: Dict[str, float] = {"serialize": 0.0, "render": 0.0}
+        self._depth = 0
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        """Обертка выполнения SQL (connection.execute_wrapper)"""
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries += 1
+            self.sql_time += perf_counter() - start
+
+    def timed(self, name: str, func, *args, **kwargs):
+        """
+        Вызов func с добавлением времени к timings[name]
+
+        Вложенные вызовы (сериализатор внутри сериализатора) не учитываются
+        повторно: время считает внешний вызов.
+        """
+        if self._depth:
+            return func(*args, **kwargs)
+        self._depth += 1
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._depth -= 1
+            self.timings[name] += perf_counter() - start
+
+
+def timed(name: str, func, *args, **kwargs):
+    """Вызов func с учетом времени в метриках текущего запроса (если они ведутся)"""
+    metrics = _current.get()
+    if metrics is None:
+        return func(*args, **kwargs)
+    return metrics.timed(name, func, *args, **kwargs)
+
+
+class TimedSerializerMixin:
+    """Сериализатор DRF, время которого учитывается в метриках запроса (serialize)"""
+
+    def to_representation(self, instance):
+        return timed("serialize", super().to_representation, instance)
+
+
+class InstrumentedViewMixin:
+    """View DRF, время рендеринга ответа которого учитывается в метриках (render)"""
+
+    def get_renderers(self):
+        renderers = super().get_renderers()
+        for renderer in renderers:
+            renderer.render = _timed_render(renderer.render)
+        return renderers
+
+
+def _timed_render(render):
+    def wrapper(*args, **kwargs):
+        return timed("render", render, *args, **kwargs)
+
+    return wrapper
+
+
+class Histogram:
+    """Гистограмма с фиксированными границами корзин"""
+
+    def __init__(self, buckets: Tuple) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> Dict:
+        cumulative = 0
+        buckets = {}
+        for le, count in zip(self.buckets + ("+Inf",), self.counts):
+            cumulative += count
+            buckets[str(le)] = cumulative
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 3),
+            "avg": round(self.sum / self.count, 3) if self.count else None,
+            "max": round(self.max, 3),
+            "buckets": buckets,
+        }
+
+
+class MetricsRegistry:
+    """Гистограммы метрик по endpoint (в памяти процесса, потокобезопасно)"""
+
+    def __init__(self) -> None:
+        self._endpoints: Dict[str, Dict[str, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, endpoint: str, values: Dict[str, float]) -> None:
+        with self._lock:
+            histograms = self._endpoints.get(endpoint)
+            if histograms is None:
+                histograms = self._endpoints[endpoint] = {
+                    name: Histogram(buckets) for name, buckets in METRIC_BUCKETS.items()
+                }
+            for name, value in values.items():
+                histograms[name].observe(value)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                endpoint: {
+                    name: histogram.as_dict()
+                    for name, histogram in histograms.items()
+                    if histogram.count
+                }
+                for endpoint, histograms in sorted(self._endpoints.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
+
+
+metrics_registry = MetricsRegistry()
+
+
+def endpoint_name(request) -> str:
+    """Endpoint запроса: метод и имя маршрута (без пути, чтобы не плодить ключи)"""
+    match = getattr(request, "resolver_match", None)
+    return f"{request.method} {match.view_name if match else 'unresolved'}"
+
+
+class RequestMetricsMiddleware:
+    """Измерение запросов к API (см. описание модуля)"""
+
+    def __init__(self, get_response):
+        if not settings.REQUEST_METRICS["ENABLED"]:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(metrics.execute_wrapper))
+                response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        total = perf_counter() - metrics.start
+
+        values = {
+            "total_ms": total * 1000,
+            "db_ms": metrics.sql_time * 1000,
+            "db_queries": metrics.queries,
+            "serialize_ms": metrics.timings["serialize"] * 1000,
+            "render_ms": metrics.timings["render"] * 1000,
+        }
+        if not response.streaming:
+            values["bytes"] = len(response.content)
+        endpoint = endpoint_name(request)
+        metrics_registry.observe(endpoint, values)
+
+        threshold = settings.REQUEST_METRICS["QUERY_WARNING_THRESHOLD"]
+        if threshold and metrics.queries > threshold:
+            logger.warning(
+                f"{endpoint}: {metrics.queries} запросов к БД "
+                f"({values['db_ms']:.1f} мс, всего {values['total_ms']:.1f} мс)"
+            )
+
+        if settings.REQUEST_METRICS["SERVER_TIMING"]:
+            response["Server-Timing"] = ", ".join(
+                [
+                    f'db;dur={values["db_ms"]:.1f};desc="{metrics.queries} queries"',
+                    f"serialize;dur={values['serialize_ms']:.1f}",
+                    f"render;dur={values['render_ms']:.1f}",
+                    f"total;dur={values['total_ms']:.1f}",
+                ]
+            )
+        return response
@@ -0,0 +1,18 @@
+# Generated by Django 6.0 on 2026-10-16 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0008_electricboiler_temp_range'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='electricboiler',
+            name='listing_fingerprint',
+            field=models.CharField(blank=True, default='', help_text='Хэш названия, цены и изображения из карточки каталога (страница товара перезагружается только при его изменении)', max_length=64, verbose_name='Отпечаток карточки каталога'),
+        ),
+    ]
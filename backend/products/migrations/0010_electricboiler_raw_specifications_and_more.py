@@ -0,0 +1,23 @@
+# Generated by Django 6.0 on 2026-10-16 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0009_electricboiler_listing_fingerprint'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='electricboiler',
+            name='raw_specifications',
+            field=models.TextField(blank=True, help_text='Текст характеристик со страницы товара (для повторного разбора)', null=True, verbose_name='Исходный текст характеристик'),
+        ),
+        migrations.AddField(
+            model_name='electricboiler',
+            name='raw_listing_html',
+            field=models.TextField(blank=True, help_text='HTML карточки товара со страницы каталога', null=True, verbose_name='HTML карточки каталога'),
+        ),
+    ]
@@ -0,0 +1,134 @@
+# Generated by Django 6.0 on 2026-10-16 11:00
+
+import re
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+# Копия разбора из products.normalizers на момент миграции: миграция не должна
+# зависеть от последующих изменений кода приложения
+NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)?")
+PARENTHESES_RE = re.compile(r"\([^)]*\)")
+AREA_UNIT_RE = re.compile(r"(?:кв\.?\s*м|[мm]\s*[²2])", re.IGNORECASE)
+THOUSANDS_SPACE_RE = re.compile(r"(?<=\d)[\s\u00a0](?=\d{3}(?!\d))")
+PRICE_NUMBER_RE = re.compile(r"\d[\d.,]*")
+MAX_POWER_KW = 1000
+MIN_VOLTAGE_V = 100
+MAX_VOLTAGE_V = 1000
+MAX_PRICE = Decimal("9999999999.99")
+NUMERIC_FIELDS = ("power_min_kw", "power_max_kw", "heating_area_m2", "voltage_v", "price_byn")
+
+
+def _numbers(value):
+    return [Decimal(n.replace(",", ".")) for n in NUMBER_RE.findall(value)]
+
+
+def parse_power_range(value):
+    if not value:
+        return None, None
+    numbers = [
+        n for n in _numbers(PARENTHESES_RE.sub(" ", value)) if 0 < n <= MAX_POWER_KW
+    ]
+    if not numbers:
+        return None, None
+    return min(numbers), max(numbers)
+
+
+def parse_heating_area(value):
+    if not value:
+        return None
+    numbers = _numbers(AREA_UNIT_RE.sub(" ", PARENTHESES_RE.sub(" ", value)))
+    numbers = [n for n in numbers if n > 0]
+    if not numbers:
+        return None
+    return int(max(numbers).to_integral_value())
+
+
+def parse_voltage(value):
+    if not value:
+        return None
+    numbers = [
+        int(n) for n in _numbers(value) if MIN_VOLTAGE_V <= n <= MAX_VOLTAGE_V
+    ]
+    return min(numbers) if numbers else None
+
+
+def parse_price(value):
+    if not value:
+        return None
+    match = PRICE_NUMBER_RE.search(THOUSANDS_SPACE_RE.sub("", value))
+    if not match:
+        return None
+    number = match.group(0).rstrip(".,")
+    if "," in number and "." in number:
+        if number.rfind(",") > number.rfind("."):
+            number = number.replace(".", "").replace(",", ".")
+        else:
+            number = number.replace(",", "")
+    else:
+        number = number.replace(",", ".")
+    if number.count(".") > 1:
+        whole, fraction = number.rsplit(".", 1)
+        number = f"{whole.replace('.', '')}.{fraction}"
+    try:
+        price = Decimal(number).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+    if price > MAX_PRICE:
+        return None
+    return price
+
+
+def fill_numeric_fields(apps, schema_editor):
+    """Заполнение числовых полей существующих котлов из текстовых"""
+    ElectricBoiler = apps.get_model("products", "ElectricBoiler")
+    batch = []
+    for boiler in ElectricBoiler.objects.only(
+        "id", "power", "heating_area", "voltage", "price"
+    ).iterator(chunk_size=500):
+        boiler.power_min_kw, boiler.power_max_kw = parse_power_range(boiler.power)
+        boiler.heating_area_m2 = parse_heating_area(boiler.heating_area)
+        boiler.voltage_v = parse_voltage(boiler.voltage)
+        boiler.price_byn = parse_price(boiler.price)
+        batch.append(boiler)
+        if len(batch) >= 500:
+            ElectricBoiler.objects.bulk_update(batch, NUMERIC_FIELDS)
+            batch = []
+    if batch:
+        ElectricBoiler.objects.bulk_update(batch, NUMERIC_FIELDS)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0010_electricboiler_raw_specifications_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='electricboiler',
+            name='power_min_kw',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, max_digits=6, null=True, verbose_name='Мощность от, кВт'),
+        ),
+        migrations.AddField(
+            model_name='electricboiler',
+            name='power_max_kw',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, max_digits=6, null=True, verbose_name='Мощность до, кВт'),
+        ),
+        migrations.AddField(
+            model_name='electricboiler',
+            name='heating_area_m2',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True, verbose_name='Площадь отопления, м²'),
+        ),
+        migrations.AddField(
+            model_name='electricboiler',
+            name='price_byn',
+            field=models.DecimalField(blank=True, db_index=True, decimal_places=2, max_digits=12, null=True, verbose_name='Цена, BYN'),
+        ),
+        migrations.AddField(
+            model_name='electricboiler',
+            name='voltage_v',
+            field=models.PositiveIntegerField(blank=True, db_index=True, null=True, verbose_name='Минимальное напряжение питания, В'),
+        ),
+        migrations.RunPython(fill_numeric_fields, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,81 @@
+# Generated by Django 6.0 on 2026-10-16 12:00
+
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+
+# Копия products.normalizers.manufacturer_from_name на момент миграции
+MAX_MANUFACTURER_LENGTH = 100
+
+
+def manufacturer_from_name(name):
+    """Производитель котла - третье слово наименования: (slug, название) или None"""
+    if not name:
+        return None
+    words = name.split()
+    if len(words) < 3:
+        return None
+    return words[2].lower()[:MAX_MANUFACTURER_LENGTH], words[2][:MAX_MANUFACTURER_LENGTH]
+
+
+def fill_manufacturers(apps, schema_editor):
+    """Заполнение производителей существующих котлов"""
+    Manufacturer = apps.get_model("products", "Manufacturer")
+    ElectricBoiler = apps.get_model("products", "ElectricBoiler")
+
+    boilers = []
+    manufacturers = {}
+    for boiler in ElectricBoiler.objects.only("id", "name").iterator(chunk_size=500):
+        manufacturer = manufacturer_from_name(boiler.name)
+        if manufacturer is None:
+            continue
+        manufacturers.setdefault(*manufacturer)
+        boiler.manufacturer_id = manufacturer[0]
+        boilers.append(boiler)
+
+    Manufacturer.objects.bulk_create(
+        [Manufacturer(slug=slug, name=name) for slug, name in manufacturers.items()],
+        ignore_conflicts=True,
+    )
+    ElectricBoiler.objects.bulk_update(boilers, ["manufacturer"], batch_size=500)
+
+    counts = (
+        ElectricBoiler.objects.filter(manufacturer__isnull=False)
+        .order_by()
+        .values_list("manufacturer")
+        .annotate(count=Count("id"))
+    )
+    for slug, count in counts:
+        Manufacturer.objects.filter(slug=slug).update(product_count=count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0011_electricboiler_numeric_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Manufacturer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.CharField(help_text='Название производителя в нижнем регистре (используется в URL)', max_length=100, unique=True, verbose_name='Идентификатор')),
+                ('name', models.CharField(max_length=100, verbose_name='Название')),
+                ('product_count', models.PositiveIntegerField(default=0, verbose_name='Количество котлов')),
+            ],
+            options={
+                'verbose_name': 'Производитель',
+                'verbose_name_plural': 'Производители',
+                'ordering': [django.db.models.functions.text.Lower('name')],
+                'indexes': [models.Index(django.db.models.functions.text.Lower('name'), name='products_manufacturer_name_idx')],
+            },
+        ),
+        migrations.AddField(
+            model_name='electricboiler',
+            name='manufacturer',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='boilers', to='products.manufacturer', to_field='slug', verbose_name='Производитель'),
+        ),
+        migrations.RunPython(fill_manufacturers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,91 @@
+# Generated by Django 6.0 on 2026-10-16 13:00
+
+import logging
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.search import SearchVector
+from django.db import DatabaseError, migrations, transaction
+
+logger = logging.getLogger(__name__)
+
+TRIGRAM_INDEX = django.contrib.postgres.indexes.GinIndex(
+    fields=['name'], name='products_boiler_name_trgm_idx', opclasses=['gin_trgm_ops']
+)
+
+
+def create_trigram_index(apps, schema_editor):
+    """
+    Расширение pg_trgm и индекс нечеткого поиска по наименованию
+
+    CREATE EXTENSION требует прав владельца БД (или суперпользователя):
+    без них, как и без пакета pg_trgm на сервере, индекс не создается,
+    а поиск работает без нечеткого совпадения (products.search). После
+    установки расширения администратором (CREATE EXTENSION pg_trgm) индекс
+    создается вручную:
+    CREATE INDEX products_boiler_name_trgm_idx
+        ON products_electricboiler USING gin (name gin_trgm_ops);
+    """
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    try:
+        with transaction.atomic(using=connection.alias):
+            with connection.cursor() as cursor:
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as e:
+        logger.warning(
+            f"Расширение pg_trgm не установлено ({e}), индекс "
+            f"{TRIGRAM_INDEX.name} не создан: поиск без нечеткого совпадения"
+        )
+        return
+    ElectricBoiler = apps.get_model("products", "ElectricBoiler")
+    schema_editor.add_index(ElectricBoiler, TRIGRAM_INDEX)
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX IF EXISTS {TRIGRAM_INDEX.name}")
+
+
+def fill_search_vectors(apps, schema_editor):
+    """Заполнение поисковых векторов существующих котлов"""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    ElectricBoiler = apps.get_model("products", "ElectricBoiler")
+    # Копия products.search.search_vector_expression на момент миграции
+    ElectricBoiler.objects.update(
+        search_vector=SearchVector("name", weight="A", config="russian")
+        + SearchVector("power", "raw_specifications", weight="B", config="russian")
+        + SearchVector("description", weight="C", config="russian")
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0012_manufacturer'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='electricboiler',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True, verbose_name='Поисковый вектор'),
+        ),
+        migrations.AddIndex(
+            model_name='electricboiler',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='products_boiler_search_idx'),
+        ),
+        # Индекс создается, только если pg_trgm доступно (create_trigram_index)
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='electricboiler', index=TRIGRAM_INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_trigram_index, drop_trigram_index),
+            ],
+        ),
+        migrations.RunPython(fill_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 6.0 on 2026-10-16 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0013_electricboiler_search_vector'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='electricboiler',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, verbose_name='Дата обновления'),
+        ),
+        migrations.CreateModel(
+            name='DeletedBoiler',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('boiler_id', models.BigIntegerField(verbose_name='ID котла')),
+                ('deleted_at', models.DateTimeField(auto_now_add=True, db_index=True, verbose_name='Дата удаления')),
+            ],
+            options={
+                'verbose_name': 'Удаленный котел',
+                'verbose_name_plural': 'Удаленные котлы',
+            },
+        ),
+    ]
@@ -1,7 +1,19 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Lower
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.base_user import BaseUserManager
 
+from .normalizers import (
+    NUMERIC_FIELDS,
+    manufacturer_from_name,
+    numeric_spec_values,
+    parse_price,
+)
+from .search import SEARCH_VECTOR_FIELDS, update_search_vectors
+
 
 class CustomUserManager(BaseUserManager):
     def create_user(
@@ -66,6 +78,71 @@ class CustomUser(AbstractUser):  # пользовательская модель
     REQUIRED_FIELDS = []
 
 
+class ManufacturerManager(models.Manager):
+    def ensure(self, manufacturers):
+        """
+        Создание отсутствующих производителей
+
+        Args:
+            manufacturers: Словарь {slug: отображаемое название}
+        """
+        if manufacturers:
+            self.bulk_create(
+                [self.model(slug=slug, name=name) for slug, name in manufacturers.items()],
+                ignore_conflicts=True,
+            )
+
+    def refresh_counts(self, slugs=None):
+        """
+        Пересчет количества котлов у производителей (один UPDATE)
+
+        Args:
+            slugs: Производители для пересчета (None - все)
+        """
+        counts = (
+            ElectricBoiler.objects.filter(manufacturer=OuterRef("slug"))
+            .order_by()
+            .values("manufacturer")
+            .annotate(count=Count("id"))
+            .values("count")
+        )
+        queryset = self.all() if slugs is None else self.filter(slug__in=slugs)
+        queryset.update(product_count=Coalesce(Subquery(counts), 0))
+
+
+class Manufacturer(models.Model):
+    """
+    Производитель котлов
+
+    Заполняется при сохранении котлов (третье слово наименования), количество
+    котлов пересчитывается после записи парсером и изменений в админке.
+    """
+
+    slug = models.CharField(
+        max_length=100,
+        unique=True,
+        verbose_name="Идентификатор",
+        help_text="Название производителя в нижнем регистре (используется в URL)",
+    )
+    name = models.CharField(max_length=100, verbose_name="Название")
+    product_count = models.PositiveIntegerField(
+        default=0, verbose_name="Количество котлов"
+    )
+
+    objects = ManufacturerManager()
+
+    class Meta:
+        verbose_name = "Производитель"
+        verbose_name_plural = "Производители"
+        ordering = [Lower("name")]
+        indexes = [
+            models.Index(Lower("name"), name="products_manufacturer_name_idx"),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
 class ElectricBoiler(models.Model):
     """
     Модель для хранения данных об электрических котлах
@@ -286,14 +363,138 @@ class ElectricBoiler(models.Model):
         help_text="URL пятого изображения",
     )
 
+    # Производитель (третье слово наименования), заполняется в update_manufacturer()
+    manufacturer = models.ForeignKey(
+        Manufacturer,
+        to_field="slug",
+        on_delete=models.SET_NULL,
+        related_name="boilers",
+        verbose_name="Производитель",
+        blank=True,
+        null=True,
+    )
+
+    # Числовые значения характеристик (для фильтрации и сортировки в БД).
+    # Вычисляются из текстовых полей в update_numeric_fields()
+    power_min_kw = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        verbose_name="Мощность от, кВт",
+        blank=True,
+        null=True,
+        db_index=True,
+    )
+    power_max_kw = models.DecimalField(
+        max_digits=6,
+        decimal_places=2,
+        verbose_name="Мощность до, кВт",
+        blank=True,
+        null=True,
+        db_index=True,
+    )
+    heating_area_m2 = models.PositiveIntegerField(
+        verbose_name="Площадь отопления, м²",
+        blank=True,
+        null=True,
+        db_index=True,
+    )
+    price_byn = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        verbose_name="Цена, BYN",
+        blank=True,
+        null=True,
+        db_index=True,
+    )
+    voltage_v = models.PositiveIntegerField(
+        verbose_name="Минимальное напряжение питания, В",
+        blank=True,
+        null=True,
+        db_index=True,
+    )
+
+    # Служебные поля парсера
+    raw_specifications = models.TextField(
+        verbose_name="Исходный текст характеристик",
+        blank=True,
+        null=True,
+        help_text="Текст характеристик со страницы товара (для повторного разбора)",
+    )
+    raw_listing_html = models.TextField(
+        verbose_name="HTML карточки каталога",
+        blank=True,
+        null=True,
+        help_text="HTML карточки товара со страницы каталога",
+    )
+    listing_fingerprint = models.CharField(
+        max_length=64,
+        verbose_name="Отпечаток карточки каталога",
+        blank=True,
+        default="",
+        help_text="Хэш названия, цены и изображения из карточки каталога "
+        "(страница товара перезагружается только при его изменении)",
+    )
+
+    # Поисковый вектор (products.search), обновляется после записи котла
+    search_vector = SearchVectorField(
+        verbose_name="Поисковый вектор",
+        null=True,
+        editable=False,
+    )
+
     # Метаданные
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Дата создания")
-    updated_at = models.DateTimeField(auto_now=True, verbose_name="Дата обновления")
+    updated_at = models.DateTimeField(
+        auto_now=True, db_index=True, verbose_name="Дата обновления"
+    )
 
     class Meta:
         verbose_name = "Электрический котел"
         verbose_name_plural = "Электрические котлы"
         ordering = ["name"]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="products_boiler_search_idx"),
+            GinIndex(
+                fields=["name"],
+                name="products_boiler_name_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+
+    def update_numeric_fields(self):
+        """Заполнение числовых полей из текстовых (цена, мощность, площадь, напряжение)"""
+        for field, value in numeric_spec_values(
+            self.power, self.heating_area, self.voltage
+        ).items():
+            setattr(self, field, value)
+        self.price_byn = parse_price(self.price)
+
+    def update_manufacturer(self):
+        """
+        Заполнение производителя по наименованию
+
+        Returns:
+            Кортеж (slug, отображаемое название) или None. Запись производителя
+            создается в save() или, при пакетной записи, Manufacturer.objects.ensure()
+        """
+        manufacturer = manufacturer_from_name(self.name)
+        self.manufacturer_id = manufacturer[0] if manufacturer else None
+        return manufacturer
+
+    def save(self, *args, **kwargs):
+        self.update_numeric_fields()
+        manufacturer = self.update_manufacturer()
+        if manufacturer:
+            Manufacturer.objects.ensure(dict([manufacturer]))
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = set(update_fields) | set(NUMERIC_FIELDS) | {
+                "manufacturer"
+            }
+        super().save(*args, **kwargs)
+        # Вектор поиска пересчитывается, только если могли измениться его поля
+        if update_fields is None or not set(update_fields).isdisjoint(SEARCH_VECTOR_FIELDS):
+            update_search_vectors(ElectricBoiler.objects.filter(pk=self.pk))
 
     def __str__(self):
         return self.name
@@ -382,3 +583,24 @@ class ElectricBoiler(models.Model):
 
         self.save()
         return self
+
+
+class DeletedBoiler(models.Model):
+    """
+    Отметка об удалении котла (для /boilers/changes/)
+
+    Создается сигналом post_delete; записи старше
+    settings.CHANGES_TOMBSTONE_RETENTION_DAYS удаляются.
+    """
+
+    boiler_id = models.BigIntegerField(verbose_name="ID котла")
+    deleted_at = models.DateTimeField(
+        auto_now_add=True, db_index=True, verbose_name="Дата удаления"
+    )
+
+    class Meta:
+        verbose_name = "Удаленный котел"
+        verbose_name_plural = "Удаленные котлы"
+
+    def __str__(self):
+        return f"{self.boiler_id} ({self.deleted_at})"
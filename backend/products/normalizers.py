@@ -0,0 +1,156 @@
+"""
+Преобразование текстовых характеристик котлов в числа
+
+Парсер сохраняет характеристики строками как на сайте ("6-12",
+"от 3 до 18,1 (6 ступеней)", "12 500,00", "220 В и 380 В"). Функции модуля
+извлекают из них числовые значения для фильтрации и сортировки в БД.
+Модуль не зависит от моделей. Миграции заполнения данных содержат
+собственные копии функций и не меняются вместе с ним.
+"""
+import re
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List, Optional, Tuple
+
+# Число с десятичной точкой или запятой
+NUMBER_RE = re.compile(r"\d+(?:[.,]\d+)?")
+# Пояснения в скобках ("(6 ступеней)") не содержат значений характеристики
+PARENTHESES_RE = re.compile(r"\([^)]*\)")
+# Единицы площади, содержащие цифру (м2, м²)
+AREA_UNIT_RE = re.compile(r"(?:кв\.?\s*м|[мm]\s*[²2])", re.IGNORECASE)
+# Пробел-разделитель разрядов ("12 500,00")
+THOUSANDS_SPACE_RE = re.compile(r"(?<=\d)[\s ](?=\d{3}(?!\d))")
+PRICE_NUMBER_RE = re.compile(r"\d[\d.,]*")
+
+# Допустимые диапазоны значений (отсекают номера моделей, фазы, частоту)
+MAX_POWER_KW = 1000
+MIN_VOLTAGE_V = 100
+MAX_VOLTAGE_V = 1000
+MAX_PRICE = Decimal("9999999999.99")
+MAX_MANUFACTURER_LENGTH = 100
+
+
+def _numbers(value: str) -> List[Decimal]:
+    return [Decimal(n.replace(",", ".")) for n in NUMBER_RE.findall(value)]
+
+
+def parse_power_range(value: Optional[str]) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+    """
+    Диапазон мощности (кВт) из строки мощности
+
+    Examples:
+        "6" -> (6, 6); "6-12" -> (6, 12); "2-4-6" -> (2, 6);
+        "от 3 до 18,1 (6 ступеней)" -> (3, 18.1)
+    """
+    if not value:
+        return None, None
+    numbers = [
+        n for n in _numbers(PARENTHESES_RE.sub(" ", value)) if 0 < n <= MAX_POWER_KW
+    ]
+    if not numbers:
+        return None, None
+    return min(numbers), max(numbers)
+
+
+def parse_heating_area(value: Optional[str]) -> Optional[int]:
+    """
+    Площадь отопления (м²) из строки площади
+
+    Для диапазона ("60-90", "до 120") берется верхняя граница.
+    """
+    if not value:
+        return None
+    numbers = _numbers(AREA_UNIT_RE.sub(" ", PARENTHESES_RE.sub(" ", value)))
+    numbers = [n for n in numbers if n > 0]
+    if not numbers:
+        return None
+    return int(max(numbers).to_integral_value())
+
+
+def parse_voltage(value: Optional[str]) -> Optional[int]:
+    """
+    Минимальное напряжение питания (В) из строки напряжения
+
+    Examples:
+        "220 В" -> 220; "220 В и 380 В" -> 220; "~380 В" -> 380
+    """
+    if not value:
+        return None
+    numbers = [
+        int(n) for n in _numbers(value) if MIN_VOLTAGE_V <= n <= MAX_VOLTAGE_V
+    ]
+    return min(numbers) if numbers else None
+
+
+def parse_price(value: Optional[str]) -> Optional[Decimal]:
+    """
+    Цена (BYN) из строки цены
+
+    Examples:
+        "12 500,00" -> Decimal("12500.00");
+        "Цену и наличие товара уточняйте у продавца" -> None
+    """
+    if not value:
+        return None
+    match = PRICE_NUMBER_RE.search(THOUSANDS_SPACE_RE.sub("", value))
+    if not match:
+        return None
+    number = match.group(0).rstrip(".,")
+    if "," in number and "." in number:
+        # Десятичный разделитель - последний из встретившихся
+        if number.rfind(",") > number.rfind("."):
+            number = number.replace(".", "").replace(",", ".")
+        else:
+            number = number.replace(",", "")
+    else:
+        number = number.replace(",", ".")
+    if number.count(".") > 1:
+        whole, fraction = number.rsplit(".", 1)
+        number = f"{whole.replace('.', '')}.{fraction}"
+    try:
+        price = Decimal(number).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        return None
+    if price > MAX_PRICE:
+        return None
+    return price
+
+
+def manufacturer_from_name(name: Optional[str]) -> Optional[Tuple[str, str]]:
+    """
+    Производитель котла - третье слово наименования
+
+    Returns:
+        Кортеж (slug, отображаемое название) или None
+
+    Examples:
+        "Котел электрический Warmos RX 6" -> ("warmos", "Warmos")
+    """
+    if not name:
+        return None
+    words = name.split()
+    if len(words) < 3:
+        return None
+    return words[2].lower()[:MAX_MANUFACTURER_LENGTH], words[2][:MAX_MANUFACTURER_LENGTH]
+
+
+def numeric_spec_values(
+    power: Optional[str], heating_area: Optional[str], voltage: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Числовые поля характеристик котла
+
+    Returns:
+        Словарь {power_min_kw, power_max_kw, heating_area_m2, voltage_v}
+    """
+    power_min_kw, power_max_kw = parse_power_range(power)
+    return {
+        "power_min_kw": power_min_kw,
+        "power_max_kw": power_max_kw,
+        "heating_area_m2": parse_heating_area(heating_area),
+        "voltage_v": parse_voltage(voltage),
+    }
+
+
+# Числовые поля, вычисляемые из текстовых характеристик
+NUMERIC_SPEC_FIELDS = ("power_min_kw", "power_max_kw", "heating_area_m2", "voltage_v")
+NUMERIC_FIELDS = NUMERIC_SPEC_FIELDS + ("price_byn",)
@@ -0,0 +1,43 @@
+"""
+Постраничная выдача списка котлов
+
+- BoilerPageNumberPagination: ?page=N&page_size=M, ответ {count, next, previous, results}
+- BoilerCursorPagination: ?cursor=... (для первой страницы - пустой),
+  ответ {next, previous, results} без подсчета общего количества
+"""
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from .filters import get_ordering
+
+# Поля без NULL-значений, по которым возможна курсорная пагинация
+CURSOR_ORDERING_FIELDS = ("name", "created_at", "updated_at")
+
+
+class BoilerPageNumberPagination(PageNumberPagination):
+    """Номер страницы; размер страницы задается клиентом в пределах max_page_size"""
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class BoilerCursorPagination(CursorPagination):
+    """
+    Курсорная пагинация по ?ordering= (name, created, updated)
+
+    Страница выбирается условием по ключу сортировки, а не OFFSET, поэтому
+    стоимость запроса не растет с номером страницы.
+    """
+
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+    def get_ordering(self, request, queryset, view):
+        field, descending = get_ordering(request.query_params)
+        if field not in CURSOR_ORDERING_FIELDS:
+            raise ValidationError(
+                {"ordering": "Курсорная пагинация поддерживает сортировку по name, created, updated"}
+            )
+        prefix = "-" if descending else ""
+        return (f"{prefix}{field}", f"{prefix}id")
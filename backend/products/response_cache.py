@@ -0,0 +1,152 @@
+"""
+Кэш готовых JSON-ответов API каталога
+
+Хранит байты отрендеренных ответов (страницы /boilers/, карточки товаров,
+список производителей) с ключом, включающим версию каталога
+(products.catalog_version). Два уровня:
+- локальный LRU в памяти процесса;
+- общий для процессов кэш Django (settings.RESPONSE_CACHE["SHARED_ALIAS"],
+  файловый кэш или Redis), может быть отключен.
+
+После изменения каталога меняется его версия, и старые записи перестают
+использоваться: локальный уровень очищается bump_catalog_version(), записи
+общего уровня истекают по TIMEOUT.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.utils.http import urlencode
+from rest_framework.permissions import SAFE_METHODS
+
+from .catalog_version import request_catalog_version
+
+
+class LocalLRUCache:
+    """Потокобезопасный LRU-кэш в памяти процесса"""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class ResponseCache:
+    """Двухуровневый кэш JSON-ответов с ключом по версии каталога"""
+
+    KEY_PREFIX = "products:response"
+
+    def __init__(
+        self, max_entries: int, shared_alias: Optional[str], timeout: Optional[int]
+    ) -> None:
+        """
+        Args:
+            max_entries: Размер локального LRU (0 - не использовать)
+            shared_alias: Алиас кэша Django для общего уровня (None - без него)
+            timeout: Время жизни записей общего уровня (секунды)
+        """
+        self.local = LocalLRUCache(max_entries)
+        self.shared_alias = shared_alias
+        self.timeout = timeout
+
+    @property
+    def shared(self):
+        return caches[self.shared_alias] if self.shared_alias else None
+
+    def make_key(self, version: str, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return f"{self.KEY_PREFIX}:{version}:{digest}"
+
+    def get(self, version: str, key: str) -> Optional[bytes]:
+        full_key = self.make_key(version, key)
+        value = self.local.get(full_key)
+        if value is None and self.shared is not None:
+            value = self.shared.get(full_key)
+            if value is not None:
+                self.local.set(full_key, value)
+        return value
+
+    def set(self, version: str, key: str, value: bytes) -> None:
+        full_key = self.make_key(version, key)
+        self.local.set(full_key, value)
+        if self.shared is not None:
+            self.shared.set(full_key, value, self.timeout)
+
+    def clear_local(self) -> None:
+        self.local.clear()
+
+
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE["LOCAL_MAX_ENTRIES"],
+    shared_alias=settings.RESPONSE_CACHE["SHARED_ALIAS"],
+    timeout=settings.RESPONSE_CACHE["TIMEOUT"],
+)
+
+
+def request_cache_key(request, view_name: str) -> str:
+    """Ключ ответа: view, хост (абсолютные ссылки пагинации), путь и параметры"""
+    query = urlencode(sorted(request.query_params.lists()), doseq=True)
+    return f"{view_name}:{request.get_host()}:{request.path}?{query}"
+
+
+def cached_json_response(view_method):
+    """
+    Декоратор метода ViewSet: ответ 200 кэшируется в виде готовых JSON-байт
+
+    Применяется только к GET/HEAD-запросам с JSON-рендерером (браузерный API
+    DRF обрабатывается как обычно). При попадании в кэш метод не вызывается
+    и запросов к БД нет. Ключ записи передается в ответе для
+    products.compression, которое хранит сжатые копии в этом же кэше.
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        if (
+            request.method not in SAFE_METHODS
+            or getattr(request, "accepted_renderer", None) is None
+            or request.accepted_renderer.format != "json"
+        ):
+            return view_method(self, request, *args, **kwargs)
+
+        version = request_catalog_version(request).tag
+        key = request_cache_key(request, f"{type(self).__name__}.{view_method.__name__}")
+        content = response_cache.get(version, key)
+        if content is None:
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code != 200:
+                return response
+            content = request.accepted_renderer.render(response.data)
+            response_cache.set(version, key, content)
+        response = HttpResponse(content, content_type="application/json")
+        response.compression_cache_key = (version, key)
+        return response
+
+    return wrapper
@@ -0,0 +1,101 @@
+"""
+Полнотекстовый и нечеткий поиск котлов (PostgreSQL)
+
+- search_vector: tsvector (конфигурация russian) из наименования (вес A),
+  мощности и текста характеристик (B) и описания (C), GIN-индекс;
+- нечеткое совпадение наименования через pg_trgm (оператор <%, GIN-индекс
+  gin_trgm_ops), находит запросы с опечатками и частями модели ("ekco", "rx6").
+
+Вектор обновляется одним UPDATE после записи котлов (save(), парсер,
+reparse_boilers). На других СУБД (SQLite при разработке) поиск сводится
+к icontains.
+
+Расширение pg_trgm создает миграция 0013, если у пользователя БД есть права
+на CREATE EXTENSION; иначе его устанавливает администратор БД. Без pg_trgm
+поиск выполняется только полнотекстово.
+"""
+
+from functools import lru_cache
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connection
+from django.db.models import F, FloatField, Q, Value
+
+SEARCH_CONFIG = "russian"
+# Поля котла, из которых строится search_vector
+SEARCH_VECTOR_FIELDS = ("name", "power", "raw_specifications", "description")
+
+
+def is_search_supported() -> bool:
+    return connection.vendor == "postgresql"
+
+
+@lru_cache(maxsize=None)
+def is_trigram_supported() -> bool:
+    """Расширение pg_trgm установлено (проверяется один раз за процесс)"""
+    if not is_search_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def search_vector_expression():
+    """Выражение tsvector котла для UPDATE"""
+    return (
+        SearchVector("name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("power", "raw_specifications", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vectors(queryset) -> int:
+    """
+    Пересчет search_vector для котлов queryset (один UPDATE)
+
+    Returns:
+        Количество обновленных записей (0, если СУБД не PostgreSQL)
+    """
+    if not is_search_supported():
+        return 0
+    return queryset.update(search_vector=search_vector_expression())
+
+
+def search_boilers(queryset, query: str):
+    """
+    Поиск котлов с ранжированием
+
+    Находит котлы, совпадающие с запросом полнотекстово или нечетко
+    по наименованию. Порядок: ранг полнотекстового совпадения, затем
+    сходство наименования.
+
+    Args:
+        queryset: Исходный queryset котлов (например, с фильтрами)
+        query: Строка поиска (синтаксис websearch: "слова", -исключение, or)
+    """
+    if not is_search_supported():
+        return queryset.filter(
+            Q(name__icontains=query)
+            | Q(power__icontains=query)
+            | Q(description__icontains=query)
+        ).annotate(
+            rank=Value(0.0, output_field=FloatField()),
+            similarity=Value(0.0, output_field=FloatField()),
+        ).order_by("name", "id")
+
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    condition = Q(search_vector=search_query)
+    similarity = Value(0.0, output_field=FloatField())
+    if is_trigram_supported():
+        condition |= Q(name__trigram_word_similar=query)
+        similarity = TrigramWordSimilarity(query, "name")
+    return (
+        queryset.filter(condition)
+        .annotate(rank=SearchRank(F("search_vector"), search_query), similarity=similarity)
+        .order_by("-rank", "-similarity", "id")
+    )
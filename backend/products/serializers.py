@@ -6,6 +6,7 @@
 import re
 from rest_framework import serializers
 from .models import *
+from .metrics import TimedSerializerMixin
 from django.contrib.auth import get_user_model
 
 # Получаем модель пользователя из настроек Django
@@ -29,16 +30,39 @@ class LoginSerializer(serializers.Serializer):
         return value.strip()
 
 
-class ElectricBoilerSerializer(serializers.ModelSerializer):
+class SparseFieldsMixin:
+    """
+    Вывод только перечисленных полей: Serializer(obj, fields=["id", "name"])
+
+    Используется с products.fieldsets (параметр запроса ?fields=).
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ElectricBoilerSerializer(
+    SparseFieldsMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
     """Сериализатор для карточки товара (котла) в каталоге."""
 
+    # slug производителя без запроса к таблице производителей
+    manufacturer = serializers.CharField(source="manufacturer_id", read_only=True)
+
     class Meta:
         model = ElectricBoiler
         fields = (
             "id",
             "name",
+            "manufacturer",
             "price",
             "power",
+            "price_byn",
+            "power_min_kw",
+            "power_max_kw",
             "product_url",
             "image_1",
             "image_2",
@@ -46,15 +70,24 @@ class ElectricBoilerSerializer(serializers.ModelSerializer):
         )
 
 
-class ElectricBoilerDetailSerializer(serializers.ModelSerializer):
-    """Сериализатор для страницы описания товара (все поля модели)."""
+class ElectricBoilerDetailSerializer(
+    SparseFieldsMixin, TimedSerializerMixin, serializers.ModelSerializer
+):
+    """Сериализатор для страницы описания товара (все поля модели, кроме служебных)."""
+
+    manufacturer = serializers.CharField(source="manufacturer_id", read_only=True)
 
     class Meta:
         model = ElectricBoiler
-        fields = "__all__"
+        exclude = (
+            "raw_specifications",
+            "raw_listing_html",
+            "listing_fingerprint",
+            "search_vector",
+        )
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Сериализатор для отображения данных пользователя
 
@@ -144,7 +177,7 @@ class PasswordChangeSerializer(serializers.Serializer):
         return attrs
 
 
-class RegisterSerializer(serializers.ModelSerializer):
+class RegisterSerializer(TimedSerializerMixin, serializers.ModelSerializer):
     """
     Сериализатор для регистрации нового пользователя
 
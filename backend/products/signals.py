@@ -0,0 +1,117 @@
+"""
+Обработчики сигналов моделей приложения products
+
+Изменения котлов внутри одной транзакции (например, удаление нескольких
+котлов в админке) собираются вместе и обрабатываются один раз после ее
+фиксации: пересчет количества котлов затронутых производителей, новая
+версия каталога и одно событие для /boilers/events/.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .catalog_version import bump_catalog_version
+from .changes import prune_tombstones
+from .events import publish_catalog_change
+from .models import DeletedBoiler, ElectricBoiler, Manufacturer
+
+
+class CatalogChanges:
+    """
+    Изменения котлов, ожидающие обработки (одни на соединение с БД)
+
+    На каждое изменение в транзакции регистрируется on_commit(flush): первый
+    вызов после фиксации обрабатывает все накопленное, остальные ничего
+    не делают. После отката транзакции накопленное остается и обрабатывается
+    со следующей фиксацией, поэтому в событие попадают только существующие
+    (changed) и действительно удаленные (deleted) котлы.
+    """
+
+    def __init__(self) -> None:
+        self.changed = set()
+        self.deleted = set()
+        self.manufacturers = set()
+
+    def add(self, changed=(), deleted=(), manufacturers=()) -> None:
+        self.changed.update(changed)
+        self.deleted.update(deleted)
+        self.manufacturers.update(filter(None, manufacturers))
+
+    def flush(self) -> None:
+        if not (self.changed or self.deleted):
+            return
+        changed, deleted, manufacturers = self.changed, self.deleted, self.manufacturers
+        self.changed, self.deleted, self.manufacturers = set(), set(), set()
+
+        existing = set(
+            ElectricBoiler.objects.filter(pk__in=changed | deleted).values_list(
+                "pk", flat=True
+            )
+        )
+        Manufacturer.objects.refresh_counts(manufacturers)
+        version = bump_catalog_version()
+        publish_catalog_change(
+            version, changed=(changed - deleted) & existing, deleted=deleted - existing
+        )
+        if deleted:
+            prune_tombstones()
+
+
+def _record_change(using, **changes) -> None:
+    """
+    Добавление котлов к изменениям текущей транзакции
+
+    Вне транзакции (autocommit) изменения обрабатываются сразу.
+
+    Args:
+        using: Алиас БД
+        **changes: changed/deleted - id котлов, manufacturers - slug производителей
+    """
+    connection = transaction.get_connection(using)
+    pending = getattr(connection, "catalog_changes", None)
+    if pending is None:
+        pending = connection.catalog_changes = CatalogChanges()
+    pending.add(**changes)
+    if connection.in_atomic_block:
+        transaction.on_commit(pending.flush, using=using)
+    else:
+        pending.flush()
+
+
+@receiver(pre_save, sender=ElectricBoiler)
+def electric_boiler_saving(sender, instance, using, **kwargs):
+    """Запоминание производителя котла до изменения (его количество тоже меняется)"""
+    instance._previous_manufacturer_id = (
+        ElectricBoiler.objects.using(using)
+        .filter(pk=instance.pk)
+        .values_list("manufacturer_id", flat=True)
+        .first()
+        if instance.pk
+        else None
+    )
+
+
+@receiver(post_save, sender=ElectricBoiler)
+def electric_boiler_saved(sender, instance, using, **kwargs):
+    """
+    Обновление количества котлов производителей и версии каталога
+    после изменения котла (админка, save()), событие для /boilers/events/
+    """
+    _record_change(
+        using,
+        changed=[instance.pk],
+        manufacturers=[
+            instance.manufacturer_id,
+            getattr(instance, "_previous_manufacturer_id", None),
+        ],
+    )
+
+
+@receiver(post_delete, sender=ElectricBoiler)
+def electric_boiler_deleted(sender, instance, using, **kwargs):
+    """Отметка об удалении котла для /boilers/changes/ и те же действия, что при сохранении"""
+    DeletedBoiler.objects.using(using).create(boiler_id=instance.pk)
+    _record_change(
+        using, deleted=[instance.pk], manufacturers=[instance.manufacturer_id]
+    )
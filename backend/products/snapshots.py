@@ -0,0 +1,157 @@
+"""
+Статические JSON-снимки каталога со сжатыми копиями (gzip, brotli)
+
+После запуска парсера и изменений в админке каталог записывается в файлы
+каталога версии:
+
+    <ROOT>/<версия>/boilers.json          - список карточек (как GET /boilers/)
+    <ROOT>/<версия>/manufacturers.json    - производители (как GET /manufacturers/)
+    <ROOT>/<версия>/boilers/<id>.json     - котел (как GET /boilers/<id>/)
+    <ROOT>/current.json                   - указатель на текущую версию
+
+Рядом с каждым файлом лежат .gz и .br (если установлен пакет brotli).
+Файлы версии не меняются, поэтому отдаются с Cache-Control: immutable -
+представлением views.catalog_snapshot или напрямую веб-сервером
+(nginx: gzip_static on; brotli_static on;), без Django и запросов к БД.
+"""
+
+import gzip
+import json
+import logging
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from .catalog_version import get_catalog_version
+from .fieldsets import project
+from .models import ElectricBoiler, Manufacturer
+from .serializers import ElectricBoilerDetailSerializer, ElectricBoilerSerializer
+
+try:
+    import brotli
+except ImportError:  # сжатие brotli необязательно
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+CURRENT_FILE = "current.json"
+# Сжатые копии: расширение -> Content-Encoding
+ENCODINGS = {".br": "br", ".gz": "gzip"}
+
+
+def snapshots_root() -> Path:
+    return Path(settings.CATALOG_SNAPSHOTS["ROOT"])
+
+
+def _replace(path: Path, content: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(content)
+    os.replace(tmp, path)
+
+
+def _write(path: Path, content: bytes) -> None:
+    """Файл и его сжатые копии"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _replace(path, content)
+    _replace(
+        path.with_name(path.name + ".gz"),
+        gzip.compress(content, compresslevel=9, mtime=0),
+    )
+    if brotli is not None:
+        _replace(path.with_name(path.name + ".br"), brotli.compress(content))
+
+
+def _prune(root: Path, keep: str) -> None:
+    """Удаление каталогов старых версий (кроме KEEP_VERSIONS последних)"""
+    versions = sorted(
+        (
+            entry
+            for entry in root.iterdir()
+            if entry.is_dir() and entry.name != keep and not entry.name.startswith(".")
+        ),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True,
+    )
+    for entry in versions[max(0, settings.CATALOG_SNAPSHOTS["KEEP_VERSIONS"] - 1):]:
+        shutil.rmtree(entry, ignore_errors=True)
+
+
+def publish_snapshots(force: bool = False) -> Optional[Dict]:
+    """
+    Запись снимков текущей версии каталога
+
+    Файлы пишутся во временный каталог, который затем переименовывается,
+    поэтому читатели не видят частично записанную версию.
+
+    Args:
+        force: Перезаписать снимок, даже если он для этой версии уже есть
+
+    Returns:
+        Содержимое current.json или None, если снимок уже был актуален
+    """
+    root = snapshots_root()
+    version = get_catalog_version()
+    target = root / version.tag
+    if target.is_dir() and not force:
+        return None
+
+    renderer = JSONRenderer()
+    tmp = root / f".{version.tag}.tmp"
+    shutil.rmtree(tmp, ignore_errors=True)
+
+    cards = project(
+        ElectricBoiler.objects.order_by("name", "id"), ElectricBoilerSerializer, None
+    )
+    _write(
+        tmp / "boilers.json",
+        renderer.render(ElectricBoilerSerializer(cards, many=True).data),
+    )
+    manufacturers = Manufacturer.objects.filter(product_count__gt=0).values(
+        "name", "slug", "product_count"
+    )
+    _write(tmp / "manufacturers.json", renderer.render(list(manufacturers)))
+
+    details = project(
+        ElectricBoiler.objects.order_by("id"), ElectricBoilerDetailSerializer, None
+    )
+    count = 0
+    for boiler in details.iterator(chunk_size=500):
+        _write(
+            tmp / "boilers" / f"{boiler.pk}.json",
+            renderer.render(ElectricBoilerDetailSerializer(boiler).data),
+        )
+        count += 1
+
+    shutil.rmtree(target, ignore_errors=True)
+    os.replace(tmp, target)
+
+    current = {
+        "version": version.tag,
+        "last_modified": (
+            version.last_modified.isoformat() if version.last_modified else None
+        ),
+        "boilers": f"{version.tag}/boilers.json",
+        "manufacturers": f"{version.tag}/manufacturers.json",
+        "boiler": f"{version.tag}/boilers/{{id}}.json",
+    }
+    _write(root / CURRENT_FILE, json.dumps(current).encode("utf-8"))
+    _prune(root, keep=version.tag)
+    logger.info(f"Снимки каталога {version.tag} записаны (котлов: {count})")
+    return current
+
+
+def publish_snapshots_on_commit() -> None:
+    """Запись снимков после фиксации текущей транзакции (ошибки логируются)"""
+
+    def publish():
+        try:
+            publish_snapshots()
+        except Exception as e:
+            logger.error(f"Ошибка записи снимков каталога: {e}")
+
+    transaction.on_commit(publish)
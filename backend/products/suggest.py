@@ -0,0 +1,128 @@
+"""
+Подсказки для строки поиска (typeahead)
+
+Индекс хранится в памяти процесса: отсортированный массив ключей, где ключ -
+нормализованное наименование, начиная с каждого слова ("warmos rx 6",
+"rx 6", "6"), а также слитные номера моделей ("rx6"). Поиск по префиксу -
+двоичный поиск по массиву (bisect), без запросов к БД. Индекс строится
+заново, когда меняется версия каталога (products.catalog_version).
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .models import ElectricBoiler
+
+# Разделители слов наименования (кроме букв и цифр)
+WORD_SPLIT_RE = re.compile(r"[^\w]+|_")
+DIGIT_RE = re.compile(r"\d")
+SUGGEST_DEFAULT_LIMIT = 10
+SUGGEST_MAX_LIMIT = 20
+
+
+def normalize(text: str) -> List[str]:
+    """Слова строки в нижнем регистре (ё -> е) без знаков препинания"""
+    return [w for w in WORD_SPLIT_RE.split(text.lower().replace("ё", "е")) if w]
+
+
+def _name_words(words: List[str]) -> List[str]:
+    """Слова наименования и слитные номера моделей ("rx" + "6" -> "rx6")"""
+    merged = [
+        first + second
+        for first, second in zip(words, words[1:])
+        if DIGIT_RE.search(first) or DIGIT_RE.search(second)
+    ]
+    return words + merged
+
+
+class SuggestIndex:
+    """Префиксный индекс наименований котлов"""
+
+    def __init__(self, rows: Sequence[Tuple[int, str, Optional[str]]]) -> None:
+        """
+        Args:
+            rows: Кортежи (id, name, image_1), отсортированные по name
+        """
+        self.items = [
+            {"id": boiler_id, "name": name, "image_1": image}
+            for boiler_id, name, image in rows
+        ]
+        self.words: List[frozenset] = []
+        entries: List[Tuple[str, int]] = []
+        for position, (_, name, _) in enumerate(rows):
+            words = normalize(name or "")
+            all_words = _name_words(words)
+            self.words.append(frozenset(all_words))
+            for i in range(len(words)):
+                entries.append((" ".join(words[i:]), position))
+            for word in all_words[len(words):]:
+                entries.append((word, position))
+        entries.sort()
+        self.keys = [key for key, _ in entries]
+        self.positions = [position for _, position in entries]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def suggest(self, query: str, limit: int = SUGGEST_DEFAULT_LIMIT) -> List[Dict]:
+        """
+        Котлы, наименование которых содержит слово, начинающееся с запроса
+
+        Первое слово запроса ищется по префиксу в индексе, остальные должны
+        быть префиксами каких-либо слов наименования ("warmos 12").
+
+        Returns:
+            До limit словарей {id, name, image_1} в порядке ключей индекса
+        """
+        tokens = normalize(query)
+        if not tokens or limit <= 0:
+            return []
+        prefix = " ".join(tokens)
+        first, rest = tokens[0], tokens[1:]
+
+        result = []
+        seen = set()
+        # Сначала ключи, начинающиеся со всего запроса, затем с первого слова
+        passes = [(prefix, False)]
+        if rest:
+            passes.append((first, True))
+        for key_prefix, check_rest in passes:
+            index = bisect_left(self.keys, key_prefix)
+            while index < len(self.keys) and self.keys[index].startswith(key_prefix):
+                position = self.positions[index]
+                index += 1
+                if position in seen:
+                    continue
+                if check_rest and not all(
+                    any(word.startswith(token) for word in self.words[position])
+                    for token in rest
+                ):
+                    continue
+                seen.add(position)
+                result.append(self.items[position])
+                if len(result) >= limit:
+                    return result
+        return result
+
+
+_index: Optional[SuggestIndex] = None
+_index_version: Optional[str] = None
+_lock = threading.Lock()
+
+
+def get_suggest_index(version: str) -> SuggestIndex:
+    """
+    Индекс для версии каталога (строится при первом обращении и после
+    изменения версии)
+    """
+    global _index, _index_version
+    with _lock:
+        if _index is None or _index_version != version:
+            rows = ElectricBoiler.objects.order_by("name").values_list(
+                "id", "name", "image_1"
+            )
+            _index = SuggestIndex(list(rows))
+            _index_version = version
+        return _index
@@ -1,3 +1,723 @@
-from django.test import TestCase
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from .fast_json import dumps as fast_json_dumps
+from .metrics import metrics_registry
+from .models import DeletedBoiler, ElectricBoiler, Manufacturer
+from .normalizers import (
+    manufacturer_from_name,
+    numeric_spec_values,
+    parse_heating_area,
+    parse_power_range,
+    parse_price,
+    parse_voltage,
+)
+from .response_cache import LocalLRUCache, response_cache
+from .snapshots import publish_snapshots
+
+# Отдельный кэш в памяти: версия каталога и готовые ответы не смешиваются
+# с кэшем запущенного сервера
+TEST_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+BOILERS = [
+    # name, power, price, country, wifi
+    ("Котел электрический Warmos RX 6", "6", "1 200,00", "Россия", "Да"),
+    ("Котел электрический Warmos RX 12", "6-12", "2 500,00", "Россия", "нет"),
+    ("Котел электрический ZOTA Lux 9", "3-9", "900", "Россия", "-"),
+    ("Котел электрический Kospel EKCO 24", "24", "уточняйте", "Польша", "опция"),
+    ("Котел электрический Protherm Скат 18", "18", "5 000", "Словакия", ""),
+]
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CatalogAPITestCase(APITestCase):
+    """Каталог из BOILERS, кэш ответов очищается перед каждым тестом"""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Версия каталога обновляется в on_commit (products.signals)
+        with cls.captureOnCommitCallbacks(execute=True):
+            cls.boilers = {
+                name: ElectricBoiler.objects.create(
+                    name=name,
+                    power=power,
+                    price=price,
+                    country=country,
+                    wifi=wifi,
+                    product_url=f"https://example.com/{i}",
+                )
+                for i, (name, power, price, country, wifi) in enumerate(BOILERS)
+            }
+
+    def setUp(self):
+        response_cache.clear_local()
+
+    def names(self, results):
+        return [row["name"] for row in results]
+
+
+class BoilersListTests(CatalogAPITestCase):
+    """GET /boilers/: фильтры, сортировка, пагинация"""
+
+    def test_without_pagination_returns_all_boilers(self):
+        response = self.client.get("/boilers/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            self.names(response.json()), sorted(name for name, *_ in BOILERS)
+        )
+
+    def test_filters(self):
+        cases = {
+            "manufacturer=warmos": 2,
+            "manufacturer=zota,kospel": 2,
+            "power_min=10": 3,
+            "power_max=8": 3,
+            "price_min=1000": 3,
+            "country=Россия": 3,
+            "wifi=true": 2,
+            "wifi=false": 3,
+        }
+        for query, count in cases.items():
+            with self.subTest(query=query):
+                response = self.client.get(f"/boilers/?{query}")
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.json()), count)
+
+    def test_invalid_filter_value(self):
+        response = self.client.get("/boilers/?power_min=abc")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("power_min", response.json())
+
+    def test_ordering(self):
+        response = self.client.get("/boilers/?ordering=-price&price_min=1")
+        self.assertEqual(
+            self.names(response.json()),
+            [
+                "Котел электрический Protherm Скат 18",
+                "Котел электрический Warmos RX 12",
+                "Котел электрический Warmos RX 6",
+                "Котел электрический ZOTA Lux 9",
+            ],
+        )
+
+    def test_unknown_ordering_rejected(self):
+        response = self.client.get("/boilers/?ordering=foo")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("ordering", response.json())
+
+    def test_page_number_pagination(self):
+        response = self.client.get("/boilers/?page=2&page_size=2")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["count"], len(BOILERS))
+        self.assertEqual(len(data["results"]), 2)
+        self.assertIsNotNone(data["next"])
+        self.assertIsNotNone(data["previous"])
+
+    def test_cursor_pagination(self):
+        response = self.client.get("/boilers/?cursor=&page_size=2")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertNotIn("count", data)
+        names = self.names(data["results"])
+        while data["next"]:
+            data = self.client.get(data["next"]).json()
+            names += self.names(data["results"])
+        self.assertEqual(names, sorted(name for name, *_ in BOILERS))
+
+    def test_cursor_pagination_rejects_nullable_ordering(self):
+        response = self.client.get("/boilers/?cursor=&ordering=price")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ConditionalRequestTests(CatalogAPITestCase):
+    """ETag версии каталога и 304 на совпадающий If-None-Match"""
+
+    def test_not_modified(self):
+        response = self.client.get("/boilers/?page=1")
+        etag = response["ETag"]
+        response = self.client.get("/boilers/?page=1", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b"")
+
+    def test_changed_catalog_returns_new_etag(self):
+        etag = self.client.get("/boilers/").get("ETag")
+        boiler = ElectricBoiler.objects.get(name=BOILERS[0][0])
+        with self.captureOnCommitCallbacks(execute=True):
+            boiler.price = "1 300,00"
+            boiler.save()
+        response = self.client.get("/boilers/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+class FieldsTests(CatalogAPITestCase):
+    """?fields= ограничивает поля ответа"""
+
+    def test_selected_fields(self):
+        response = self.client.get("/boilers/?fields=name,price")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.json()[0]), {"id", "name", "price"})
+
+    def test_unknown_field_rejected(self):
+        for url in ("/boilers/?fields=name,bogus", "/boilers/batch/?ids=1&fields=bogus"):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertIn("bogus", response.json()["fields"])
+
+
+class BatchTests(CatalogAPITestCase):
+    """GET и POST /boilers/batch/"""
+
+    def test_get_keeps_order_and_reports_missing(self):
+        first, second = (self.boilers[name].pk for name, *_ in BOILERS[:2])
+        response = self.client.get(
+            f"/boilers/batch/?ids={second},{first},999999,{second}&fields=name"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual([row["id"] for row in data["results"]], [second, first])
+        self.assertEqual(data["missing"], [999999])
+
+    def test_post(self):
+        boiler = self.boilers[BOILERS[2][0]]
+        response = self.client.post(
+            "/boilers/batch/?fields=price", {"ids": [str(boiler.pk), 424242]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["results"], [{"id": boiler.pk, "price": boiler.price}])
+        self.assertEqual(data["missing"], [424242])
+
+    def test_invalid_ids(self):
+        for query in ("ids=", "ids=a,1"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/boilers/batch/?{query}")
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.post("/boilers/batch/", {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(CHANGES_SAFETY_OVERLAP_SECONDS=0)
+class ChangesTests(CatalogAPITestCase):
+    """GET /boilers/changes/ с отметками об удалении"""
+
+    def test_without_since_returns_full_catalog(self):
+        data = self.client.get("/boilers/changes/?fields=name").json()
+        self.assertTrue(data["reset"])
+        self.assertEqual(len(data["upserted"]), len(BOILERS))
+        self.assertEqual(data["deleted"], [])
+        self.assertIsNotNone(data["since"])
+
+    def test_updates_and_deletes_after_since(self):
+        since = self.client.get("/boilers/changes/").json()["since"]
+        changed = self.boilers[BOILERS[0][0]]
+        deleted = self.boilers[BOILERS[1][0]]
+        deleted_id = deleted.pk
+        with self.captureOnCommitCallbacks(execute=True):
+            changed.price = "999"
+            changed.save()
+            deleted.delete()
+
+        response = self.client.get("/boilers/changes/", {"since": since, "fields": "price"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertFalse(data["reset"])
+        self.assertEqual(data["upserted"], [{"id": changed.pk, "price": "999"}])
+        self.assertEqual(data["deleted"], [deleted_id])
+        self.assertGreater(data["since"], since)
+
+        data = self.client.get("/boilers/changes/", {"since": data["since"]}).json()
+        self.assertEqual((data["upserted"], data["deleted"]), ([], []))
+
+    def test_since_older_than_tombstones_resets(self):
+        DeletedBoiler.objects.create(boiler_id=424242)
+        since = timezone.now() - timedelta(days=365)
+        data = self.client.get("/boilers/changes/", {"since": since.isoformat()}).json()
+        self.assertTrue(data["reset"])
+        self.assertEqual(len(data["upserted"]), len(BOILERS))
+        self.assertEqual(data["deleted"], [])
+
+    def test_invalid_since(self):
+        response = self.client.get("/boilers/changes/?since=garbage")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ExportTests(CatalogAPITestCase):
+    """GET /boilers/export/ в форматах JSON Lines и CSV"""
+
+    def content(self, response):
+        return b"".join(response.streaming_content).decode("utf-8")
+
+    def test_jsonl(self):
+        response = self.client.get("/boilers/export/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("application/x-ndjson"))
+        self.assertIn(".jsonl", response["Content-Disposition"])
+        rows = [json.loads(line) for line in self.content(response).splitlines()]
+        self.assertEqual(self.names(rows), sorted(name for name, *_ in BOILERS))
+        detail = self.client.get(f"/boilers/{rows[0]['id']}/").json()
+        self.assertEqual(rows[0], detail)
+
+    def test_csv_with_filters_and_fields(self):
+        response = self.client.get(
+            "/boilers/export/?output=csv&manufacturer=warmos&fields=name,price&ordering=-price"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/csv"))
+        rows = list(csv.reader(io.StringIO(self.content(response))))
+        self.assertEqual(rows[0], ["id", "name", "price"])
+        self.assertEqual(
+            [row[1] for row in rows[1:]],
+            ["Котел электрический Warmos RX 12", "Котел электрический Warmos RX 6"],
+        )
+
+    def test_unknown_output_rejected(self):
+        response = self.client.get("/boilers/export/?output=xml")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+class NormalizersTests(SimpleTestCase):
+    """Числовые значения из текстовых характеристик"""
+
+    def test_power_range(self):
+        self.assertEqual(parse_power_range("6"), (6, 6))
+        self.assertEqual(parse_power_range("2-4-6"), (2, 6))
+        self.assertEqual(
+            parse_power_range("от 3 до 18,1 (6 ступеней)"), (3, Decimal("18.1"))
+        )
+        self.assertEqual(parse_power_range("нет данных"), (None, None))
+        self.assertEqual(parse_power_range(None), (None, None))
+
+    def test_heating_area(self):
+        self.assertEqual(parse_heating_area("60-90 м²"), 90)
+        self.assertEqual(parse_heating_area("до 120 кв. м"), 120)
+        self.assertIsNone(parse_heating_area("-"))
+
+    def test_voltage(self):
+        self.assertEqual(parse_voltage("220 В и 380 В"), 220)
+        self.assertEqual(parse_voltage("~380 В, 50 Гц, 3 фазы"), 380)
+        self.assertIsNone(parse_voltage("12 В"))
+
+    def test_price(self):
+        self.assertEqual(parse_price("12 500,00"), Decimal("12500.00"))
+        self.assertEqual(parse_price("1.250,50"), Decimal("1250.50"))
+        self.assertEqual(parse_price("1,250.50"), Decimal("1250.50"))
+        self.assertEqual(parse_price("900"), Decimal("900.00"))
+        self.assertIsNone(parse_price("Цену и наличие товара уточняйте у продавца"))
+        self.assertIsNone(parse_price("99999999999"))
+
+    def test_manufacturer_from_name(self):
+        self.assertEqual(
+            manufacturer_from_name("Котел электрический Warmos RX 6"),
+            ("warmos", "Warmos"),
+        )
+        self.assertIsNone(manufacturer_from_name("Котел Warmos"))
+        self.assertIsNone(manufacturer_from_name(""))
+
+    def test_numeric_spec_values(self):
+        self.assertEqual(
+            numeric_spec_values("6-12", "до 120 м2", "380 В"),
+            {
+                "power_min_kw": 6,
+                "power_max_kw": 12,
+                "heating_area_m2": 120,
+                "voltage_v": 380,
+            },
+        )
+
+
+class ResponseCacheTests(CatalogAPITestCase):
+    """Готовые ответы по версии каталога (products.response_cache)"""
+
+    def test_repeated_request_served_without_queries(self):
+        first = self.client.get("/boilers/?page=1")
+        with self.assertNumQueries(0):
+            second = self.client.get("/boilers/?page=1")
+        self.assertEqual(second.content, first.content)
+
+    def test_catalog_change_invalidates_response(self):
+        self.client.get("/boilers/?fields=name,price")
+        boiler = self.boilers[BOILERS[0][0]]
+        with self.captureOnCommitCallbacks(execute=True):
+            boiler.price = "1 300,00"
+            boiler.save()
+        response = self.client.get("/boilers/?fields=name,price")
+        prices = {row["name"]: row["price"] for row in response.json()}
+        self.assertEqual(prices[boiler.name], "1 300,00")
+
+    def test_local_lru_evicts_oldest_entry(self):
+        lru = LocalLRUCache(max_entries=2)
+        lru.set("a", b"1")
+        lru.set("b", b"2")
+        lru.get("a")
+        lru.set("c", b"3")
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(lru.get("a"), b"1")
+        self.assertEqual(len(lru), 2)
+
+
+class SuggestTests(CatalogAPITestCase):
+    """GET /boilers/suggest/: подсказки по префиксам слов наименования"""
+
+    def suggest(self, query, **params):
+        response = self.client.get("/boilers/suggest/", {"q": query, **params})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return self.names(response.json())
+
+    def test_prefix_of_any_word(self):
+        self.assertEqual(
+            self.suggest("warm"),
+            ["Котел электрический Warmos RX 12", "Котел электрический Warmos RX 6"],
+        )
+        self.assertEqual(self.suggest("скат"), ["Котел электрический Protherm Скат 18"])
+
+    def test_merged_model_number_and_extra_words(self):
+        self.assertEqual(self.suggest("rx12"), ["Котел электрический Warmos RX 12"])
+        self.assertEqual(self.suggest("warmos 6"), ["Котел электрический Warmos RX 6"])
+
+    def test_limit_and_empty_query(self):
+        self.assertEqual(len(self.suggest("котел", limit=2)), 2)
+        self.assertEqual(self.suggest(""), [])
+        response = self.client.get("/boilers/suggest/?q=котел&limit=abc")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_index_rebuilt_after_catalog_change(self):
+        self.assertEqual(self.suggest("thermex"), [])
+        with self.captureOnCommitCallbacks(execute=True):
+            ElectricBoiler.objects.create(
+                name="Котел электрический Thermex Grand 9",
+                product_url="https://example.com/thermex",
+            )
+        self.assertEqual(self.suggest("thermex"), ["Котел электрический Thermex Grand 9"])
+
+
+class FacetsTests(CatalogAPITestCase):
+    """GET /boilers/facets/: счетчики фильтров"""
+
+    def test_counts(self):
+        response = self.client.get("/boilers/facets/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertEqual(data["total"], len(BOILERS))
+        self.assertEqual(
+            {item["slug"]: item["count"] for item in data["manufacturers"]},
+            {"kospel": 1, "protherm": 1, "warmos": 2, "zota": 1},
+        )
+        self.assertEqual(data["countries"][0], {"value": "Россия", "count": 3})
+        self.assertEqual(sum(band["count"] for band in data["power"]), len(BOILERS))
+        self.assertEqual(data["features"]["wifi"], 2)
+
+    def test_counts_follow_filters(self):
+        data = self.client.get("/boilers/facets/?country=Россия").json()
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(
+            [item["slug"] for item in data["manufacturers"]], ["warmos", "zota"]
+        )
+        self.assertEqual([item["value"] for item in data["countries"]], ["Россия"])
+
+
+class SnapshotsTests(CatalogAPITestCase):
+    """Статические JSON-снимки каталога (products.snapshots)"""
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.root = directory.name
+        settings_override = override_settings(
+            CATALOG_SNAPSHOTS={"ROOT": self.root, "KEEP_VERSIONS": 1}
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def read(self, *parts):
+        with open(os.path.join(self.root, *parts), encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_snapshot_matches_api(self):
+        current = publish_snapshots()
+        self.assertEqual(self.read("current.json"), current)
+        self.assertEqual(self.read(current["boilers"]), self.client.get("/boilers/").json())
+        boiler = self.boilers[BOILERS[0][0]]
+        self.assertEqual(
+            self.read(current["boiler"].format(id=boiler.pk)),
+            self.client.get(f"/boilers/{boiler.pk}/").json(),
+        )
+        self.assertIsNone(publish_snapshots())
+
+    def test_served_compressed_and_immutable(self):
+        current = publish_snapshots()
+        response = self.client.get(
+            f"/snapshots/{current['boilers']}", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("immutable", response["Cache-Control"])
+        self.assertEqual(
+            json.loads(gzip.decompress(b"".join(response.streaming_content))),
+            self.read(current["boilers"]),
+        )
+        response = self.client.get("/snapshots/../manage.py")
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_new_version_replaces_old(self):
+        old = publish_snapshots()
+        boiler = self.boilers[BOILERS[0][0]]
+        with self.captureOnCommitCallbacks(execute=True):
+            boiler.price = "1 300,00"
+            boiler.save()
+        new = publish_snapshots()
+        self.assertNotEqual(new["version"], old["version"])
+        self.assertFalse(os.path.exists(os.path.join(self.root, old["version"])))
+        self.assertTrue(os.path.exists(os.path.join(self.root, new["boilers"])))
+
+
+class FastJSONTests(CatalogAPITestCase):
+    """Быстрый путь списков (products.fast_json) совпадает с сериализатором"""
+
+    URLS = (
+        "/boilers/",
+        "/boilers/?fields=name,price,power&ordering=-price",
+        "/boilers/?page=1&page_size=2",
+        "/manufacturers/",
+    )
+
+    def get(self, url, fast):
+        response_cache.clear_local()
+        caches["default"].clear()
+        with override_settings(CATALOG_FAST_JSON=fast):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.content
+
+    def test_same_output_as_serializer(self):
+        for url in self.URLS:
+            with self.subTest(url=url):
+                self.assertEqual(self.get(url, fast=True), self.get(url, fast=False))
+
+    def test_dumps_escapes_line_separators(self):
+        data = {"name": "a\u2028b\u2029"}
+        self.assertEqual(fast_json_dumps(data), JSONRenderer().render(data))
+
+
+class CompressionTests(CatalogAPITestCase):
+    """Сжатие ответов по Accept-Encoding (products.compression)"""
+
+    def test_gzip(self):
+        plain = self.client.get("/boilers/")
+        self.assertFalse(plain.has_header("Content-Encoding"))
+        response = self.client.get("/boilers/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(response["ETag"], f"W/{plain['ETag']}")
+        self.assertEqual(gzip.decompress(response.content), plain.content)
+
+    def test_refused_encoding_and_small_responses(self):
+        response = self.client.get("/boilers/", HTTP_ACCEPT_ENCODING="gzip;q=0")
+        self.assertFalse(response.has_header("Content-Encoding"))
+        response = self.client.get("/boilers/suggest/?q=zzz", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response.content, b"[]")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_streaming_export(self):
+        response = self.client.get("/boilers/export/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertFalse(response.has_header("Content-Length"))
+        lines = gzip.decompress(b"".join(response.streaming_content)).splitlines()
+        self.assertEqual(len(lines), len(BOILERS))
+
+
+
+@override_settings(CACHES=TEST_CACHES)
+class ReparseBoilersTests(TestCase):
+    """Команда reparse_boilers пересчитывает поля из сохраненных исходных данных"""
+
+    def test_reparses_price_manufacturer_and_voltage_from_description(self):
+        boiler = ElectricBoiler.objects.create(
+            name="Котел электрический Vaillant eloBLOCK VE 6",
+            price="1 000",
+            product_url="https://example.com/vaillant",
+            description=(
+                "Котлы мощностью 6 кВт и 9 кВт могут работать от сети "
+                "с напряжением ~220В и ~380В"
+            ),
+            raw_listing_html=(
+                '<li class="product-type-simple">'
+                '<h2 class="woocommerce-loop-product__title">Vaillant</h2>'
+                '<span class="woocommerce-Price-amount amount">3 450,00 BYN</span>'
+                "</li>"
+            ),
+        )
+        # Значения, вычисленные старой версией разбора
+        ElectricBoiler.objects.filter(pk=boiler.pk).update(
+            voltage=None, manufacturer=None
+        )
+        legacy = ElectricBoiler.objects.create(
+            name="Котел электрический ZOTA Lux 9",
+            power="9",
+            product_url="https://example.com/zota",
+        )
+
+        out = io.StringIO()
+        call_command("reparse_boilers", workers=1, stdout=out)
+
+        boiler.refresh_from_db()
+        self.assertEqual(boiler.price, "3 450,00")
+        self.assertEqual(boiler.price_byn, Decimal("3450.00"))
+        self.assertEqual(boiler.manufacturer_id, "vaillant")
+        self.assertEqual(boiler.voltage, "220в и 380в")
+        self.assertEqual(Manufacturer.objects.get(slug="vaillant").product_count, 1)
+        # Котлы без исходных данных не изменяются
+        legacy.refresh_from_db()
+        self.assertEqual(legacy.power, "9")
+        self.assertIn("без исходных данных: 1", out.getvalue())
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CatalogSignalsTests(TestCase):
+    """Обработка изменений котлов после фиксации транзакции (products.signals)"""
+
+    def create(self, name):
+        with self.captureOnCommitCallbacks(execute=True):
+            return ElectricBoiler.objects.create(
+                name=name, product_url=f"https://example.com/{name}"
+            )
+
+    def test_recounts_previous_and_new_manufacturer_only(self):
+        boiler = self.create("Котел электрический ZOTA Lux 9")
+        self.create("Котел электрический Warmos RX 6")
+        Manufacturer.objects.filter(slug="warmos").update(product_count=42)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            boiler.name = "Котел электрический Kospel EKCO 24"
+            boiler.save()
+
+        counts = dict(Manufacturer.objects.values_list("slug", "product_count"))
+        self.assertEqual(counts, {"zota": 0, "kospel": 1, "warmos": 42})
+
+    @mock.patch("products.signals.publish_catalog_change")
+    def test_rolled_back_delete_is_not_published(self, publish):
+        boiler = self.create("Котел электрический ZOTA Lux 9")
+        boiler_id = boiler.pk
+        other = self.create("Котел электрический Warmos RX 6")
+
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            boiler.delete()
+            raise RuntimeError
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            other.save()
+            other.save()
+
+        self.assertEqual(len(callbacks), 2)
+        _, kwargs = publish.call_args
+        self.assertEqual(kwargs["changed"], {other.pk})
+        self.assertEqual(kwargs["deleted"], set())
+        self.assertTrue(ElectricBoiler.objects.filter(pk=boiler_id).exists())
+
+
+class SearchTests(CatalogAPITestCase):
+    """GET /boilers/search/ (PostgreSQL - полнотекстовый, иначе icontains)"""
+
+    def search(self, query):
+        response = self.client.get("/boilers/search/", {"q": query})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return self.names(response.json()["results"])
+
+    def test_finds_by_name(self):
+        self.assertEqual(self.search("Kospel"), ["Котел электрический Kospel EKCO 24"])
+
+    @skipUnless(connection.vendor == "postgresql", "поиск по search_vector - PostgreSQL")
+    def test_without_trigram_extension(self):
+        with mock.patch("products.search.is_trigram_supported", return_value=False):
+            self.assertEqual(self.search("Kospel"), ["Котел электрический Kospel EKCO 24"])
+
+    def test_query_required(self):
+        response = self.client.get("/boilers/search/?q=")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(CACHES=TEST_CACHES)
+class CatalogEventsTests(TestCase):
+    """Доступность потока событий /boilers/events/ (SSE)"""
+
+    STATUS_URL = "/boilers/events/status/"
+
+    def test_unavailable_under_wsgi(self):
+        data = self.client.get(self.STATUS_URL).json()
+        self.assertFalse(data["available"])
+        response = self.client.get("/boilers/events/")
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    async def test_available_under_asgi(self):
+        response = await self.async_client.get(self.STATUS_URL)
+        self.assertEqual(response.json(), {"available": True})
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                "LOCATION": os.path.join(tempfile.gettempdir(), "products-tests-events"),
+            }
+        }
+    )
+    async def test_unavailable_without_atomic_incr(self):
+        response = await self.async_client.get(self.STATUS_URL)
+        self.assertFalse(response.json()["available"])
+
+
+class RequestMetricsTests(CatalogAPITestCase):
+    """Метрики запросов (products.metrics)"""
+
+    def setUp(self):
+        super().setUp()
+        metrics_registry.reset()
+
+    def test_bytes_are_measured_after_compression(self):
+        response = self.client.get("/boilers/", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        histogram = metrics_registry.snapshot()["GET boilers-list"]["bytes"]
+        self.assertEqual(histogram["sum"], len(response.content))
+
+    def test_access_requires_staff_or_token(self):
+        self.assertEqual(self.client.get("/metrics/").status_code, status.HTTP_404_NOT_FOUND)
+        metrics_settings = {**settings.REQUEST_METRICS, "TOKEN": "secret"}
+        with override_settings(REQUEST_METRICS=metrics_settings):
+            response = self.client.get("/metrics/", HTTP_X_METRICS_TOKEN="wrong")
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+            response = self.client.get("/metrics/", HTTP_X_METRICS_TOKEN="secret")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            # Сброс по токену недоступен
+            response = self.client.post("/metrics/", HTTP_X_METRICS_TOKEN="secret")
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_staff_can_read_and_reset(self):
+        user = get_user_model().objects.create_user("user@example.com", "password")
+        self.client.force_login(user)
+        self.assertEqual(self.client.get("/metrics/").status_code, status.HTTP_404_NOT_FOUND)
+
+        user.is_staff = True
+        user.save()
+        self.client.get("/boilers/")
+        response = self.client.post("/metrics/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("GET boilers-list", response.json())
+        self.assertNotIn("GET boilers-list", self.client.get("/metrics/").json())
@@ -28,8 +28,20 @@ router.register("me", CurrentUserView, basename="current-user")
 # GET /manufacturers/ - список производителей котлов из БД
 router.register("manufacturers", ManufacturersView, basename="manufacturers")
 
-# GET /boilers/ - все товары (котлы) для страницы Каталог
+# GET /boilers/ - товары (котлы) для страницы Каталог: фильтры, сортировка, пагинация
 router.register("boilers", BoilersView, basename="boilers")
 
 # URL patterns, сгенерированные роутером
-urlpatterns = router.urls
+# GET /boilers/events/ - поток событий изменения каталога (SSE, только ASGI),
+# GET /boilers/events/status/ - доступен ли поток;
+# объявлены раньше маршрутов роутера, иначе совпадут с /boilers/{id}/
+# GET /snapshots/<путь> - статические JSON-снимки каталога (products.snapshots)
+# GET /metrics/ - метрики запросов к API (products.metrics, сотрудникам и по токену)
+urlpatterns = [
+    path("boilers/events/", catalog_events, name="boilers-events"),
+    path(
+        "boilers/events/status/", catalog_events_status, name="boilers-events-status"
+    ),
+    path("snapshots/<path:path>", catalog_snapshot, name="catalog-snapshot"),
+    path("metrics/", request_metrics, name="request-metrics"),
+] + router.urls
@@ -3,7 +3,21 @@ API Views для аутентификации и управления польз
 Использует Django REST Framework ViewSets и JWT токены для аутентификации
 """
 
+import asyncio
+import hmac
+import json
+from pathlib import Path
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.views.decorators.http import require_http_methods
 from rest_framework import viewsets, permissions, status
+from rest_framework.exceptions import ValidationError
 from .serializers import (
     LoginSerializer,
     RegisterSerializer,
@@ -13,7 +27,26 @@ from .serializers import (
     ElectricBoilerSerializer,
     ElectricBoilerDetailSerializer,
 )
-from .models import ElectricBoiler
+from .models import ElectricBoiler, Manufacturer
+from .catalog_version import conditional_on_catalog_version, request_catalog_version
+from .response_cache import cached_json_response
+from .batch import get_boilers_batch, parse_ids
+from .changes import get_changes, parse_since
+from .compression import accepted_encodings
+from .events import event_broker
+from .export import EXPORT_FORMATS, aiter_sync, export_rows, parse_output
+from .facets import compute_facets
+from .fast_json import FastJSONRenderer, row_builder
+from .fieldsets import project, requested_fields
+from .metrics import InstrumentedViewMixin, metrics_registry
+from .filters import filter_boilers, get_ordering, order_boilers
+from .pagination import BoilerCursorPagination, BoilerPageNumberPagination
+from .search import search_boilers
+from .snapshots import CURRENT_FILE as SNAPSHOT_CURRENT_FILE
+from .snapshots import ENCODINGS as SNAPSHOT_ENCODINGS
+from .snapshots import snapshots_root
+from .suggest import SUGGEST_DEFAULT_LIMIT, SUGGEST_MAX_LIMIT, get_suggest_index
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model, authenticate
 from rest_framework_simplejwt.tokens import RefreshToken
@@ -23,71 +56,380 @@ from rest_framework.decorators import action
 # Получаем модель пользователя из настроек Django
 User = get_user_model()
 
+# Пауза перед переподключением EventSource после обрыва потока событий (мс)
+CATALOG_EVENTS_RETRY_MS = 3000
 
-class ManufacturersView(viewsets.ViewSet):
+
+class ManufacturersView(InstrumentedViewMixin, viewsets.ViewSet):
     """
     Список производителей котлов по данным из БД.
 
     Endpoint: GET /manufacturers/
-    Возвращает уникальные производители (третье слово из наименования котла),
-    отсортированные по имени. Формат: [{"name": "...", "slug": "..."}, ...].
+    Возвращает производителей, у которых есть котлы, отсортированных по имени.
+    Формат: [{"name": "...", "slug": "...", "product_count": N}, ...].
+    Производители и количество котлов заполняются при сохранении котлов
+    (модель Manufacturer), поэтому список выбирается одним запросом.
     """
 
     permission_classes = [permissions.AllowAny]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
 
+    @conditional_on_catalog_version
+    @cached_json_response
     def list(self, request):
-        names = ElectricBoiler.objects.values_list("name", flat=True).distinct()
-        seen = set()
-        result = []
-        for raw_name in names:
-            if not raw_name or not raw_name.strip():
-                continue
-            words = raw_name.strip().split()
-            # Производитель = третье слово наименования (индекс 2)
-            if len(words) < 3:
-                continue
-            third_word = words[2]
-            if not third_word:
-                continue
-            slug = third_word.lower()
-            if slug in seen:
-                continue
-            seen.add(slug)
-            result.append({"name": third_word, "slug": slug})
-        result.sort(key=lambda x: x["name"].lower())
-        return Response(result)
-
-
-class BoilersView(viewsets.ViewSet):
+        manufacturers = Manufacturer.objects.filter(product_count__gt=0).values(
+            "name", "slug", "product_count"
+        )
+        return Response(list(manufacturers))
+
+
+class BoilersView(InstrumentedViewMixin, viewsets.ViewSet):
     """
     Список и детали котлов (товаров) из БД.
 
     Endpoints:
-    - GET /boilers/ — все записи для страницы Каталог
+    - GET /boilers/ — список для страницы Каталог
     - GET /boilers/{id}/ — одна запись для страницы описания товара
+    - GET /boilers/search/?q= — поиск с ранжированием (постранично)
+    - GET /boilers/suggest/?q= — подсказки для строки поиска
+    - GET /boilers/facets/ — счетчики фильтров для текущего набора фильтров
+    - GET|POST /boilers/batch/ — несколько котлов по списку id
+    - GET /boilers/changes/?since= — изменения каталога после метки since
+    - GET /boilers/export/?output=jsonl|csv — выгрузка каталога потоком
+    - GET /boilers/events/ — поток событий изменения каталога (catalog_events)
+
+    Фильтры и сортировка списка (см. products.filters) выполняются в БД:
+    manufacturer, search, power_min, power_max, power_band, price_min, price_max,
+    country, wifi, thermostat, floor_heating, water_heating, ordering.
+    Пагинация включается параметрами запроса:
+    - ?page=N[&page_size=M] — {count, next, previous, results}
+    - ?cursor=[...] — {next, previous, results} (курсор из next/previous)
+    Без них возвращается весь отфильтрованный список (массив).
+    ?fields=id,name,price ограничивает поля ответа и столбцы запроса к БД
+    (products.fieldsets) для списка, поиска, batch, changes и одной записи.
+
+    Ответы содержат ETag / Last-Modified версии каталога; повторный запрос
+    с If-None-Match получает 304 без обращения к БД. Готовые JSON-ответы
+    кэшируются по версии каталога (products.response_cache). Карточки списка
+    и поиска строятся из values_list без сериализатора (products.fast_json).
     """
 
     permission_classes = [permissions.AllowAny]
+    renderer_classes = [FastJSONRenderer, BrowsableAPIRenderer]
     serializer_class = ElectricBoilerSerializer
 
+    @conditional_on_catalog_version
+    @cached_json_response
     def list(self, request):
-        qs = ElectricBoiler.objects.all().order_by("name")
-        serializer = self.serializer_class(qs, many=True)
-        return Response(serializer.data)
+        params = request.query_params
+        fields = requested_fields(params, self.serializer_class)
+        qs = filter_boilers(ElectricBoiler.objects.all(), params)
+
+        if "cursor" in params:
+            # Ключ курсора читается из последней записи страницы (объекта модели)
+            paginator = BoilerCursorPagination()
+            qs = project(qs, self.serializer_class, fields, extra=[get_ordering(params)[0]])
+            page = paginator.paginate_queryset(qs, request, view=self)
+            serializer = self.serializer_class(page, many=True, fields=fields)
+            return paginator.get_paginated_response(serializer.data)
+
+        rows = row_builder(request, self.serializer_class, fields)
+        qs = rows.queryset(order_boilers(qs, params))
+        if "page" not in params and "page_size" not in params:
+            return Response(rows.rows(qs))
+
+        paginator = BoilerPageNumberPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        return paginator.get_paginated_response(rows.rows(page))
+
+    @action(detail=False, methods=["get"])
+    @conditional_on_catalog_version
+    @cached_json_response
+    def search(self, request):
+        """
+        Поиск котлов: GET /boilers/search/?q=...[&page=N&page_size=M]
+
+        Полнотекстовый поиск по наименованию, характеристикам и описанию
+        с нечетким совпадением наименования (products.search). Результаты
+        отсортированы по релевантности; фильтры /boilers/ также применяются.
+        """
+        query = (request.query_params.get("q") or "").strip()
+        if not query:
+            raise ValidationError({"q": "Укажите строку поиска"})
+        fields = requested_fields(request.query_params, self.serializer_class)
+        rows = row_builder(request, self.serializer_class, fields)
+        qs = filter_boilers(ElectricBoiler.objects.all(), request.query_params)
+        qs = rows.queryset(search_boilers(qs, query))
+
+        paginator = BoilerPageNumberPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        return paginator.get_paginated_response(rows.rows(page))
+
+    @action(detail=False, methods=["get"])
+    @conditional_on_catalog_version
+    def suggest(self, request):
+        """
+        Подсказки для строки поиска: GET /boilers/suggest/?q=...[&limit=N]
+
+        Возвращает до limit (по умолчанию 10, не более 20) котлов, в
+        наименовании которых есть слово, начинающееся с запроса:
+        [{"id": ..., "name": "...", "image_1": "..."}, ...].
+        Поиск выполняется по индексу в памяти (products.suggest).
+        """
+        query = (request.query_params.get("q") or "").strip()
+        try:
+            limit = int(request.query_params.get("limit", SUGGEST_DEFAULT_LIMIT))
+        except ValueError:
+            raise ValidationError({"limit": "Ожидается целое число"})
+        limit = max(1, min(limit, SUGGEST_MAX_LIMIT))
+        if not query:
+            return Response([])
+        index = get_suggest_index(request_catalog_version(request).tag)
+        return Response(index.suggest(query, limit))
+
+    @action(detail=False, methods=["get"])
+    @conditional_on_catalog_version
+    @cached_json_response
+    def facets(self, request):
+        """
+        Счетчики фасетов: GET /boilers/facets/[?фильтры /boilers/]
+
+        Количество котлов по производителям, странам, диапазонам мощности
+        и функциям для котлов, отобранных фильтрами (products.facets).
+        """
+        qs = filter_boilers(ElectricBoiler.objects.all(), request.query_params)
+        return Response(compute_facets(qs))
+
+    @action(detail=False, methods=["get", "post"])
+    @conditional_on_catalog_version
+    @cached_json_response
+    def batch(self, request):
+        """
+        Несколько котлов одним запросом:
+        GET /boilers/batch/?ids=1,2,3[&fields=...] или POST {"ids": [1, 2, 3]}
+
+        Ответ {"results": [...], "missing": [...]}: записи (поля карточки
+        каталога) в порядке ids и id, которых нет в каталоге (products.batch).
+        """
+        if request.method == "POST":
+            ids = request.data.get("ids") if hasattr(request.data, "get") else None
+            if isinstance(ids, (str, int)):
+                ids = [ids]
+            ids = parse_ids(ids or [])
+        else:
+            ids = parse_ids(request.query_params.getlist("ids"))
+        fields = requested_fields(request.query_params, self.serializer_class)
+        return Response(get_boilers_batch(ids, self.serializer_class, fields))
+
+    @action(detail=False, methods=["get"])
+    @conditional_on_catalog_version
+    @cached_json_response
+    def changes(self, request):
+        """
+        Изменения каталога: GET /boilers/changes/?since=<метка>[&fields=...]
+
+        Ответ {"since", "reset", "upserted", "deleted"}: котлы (поля карточки
+        каталога), измененные после since, и id удаленных котлов. Метку since
+        из ответа клиент передает в следующем запросе; без since (или при
+        устаревшей метке) возвращается весь каталог с reset=true (products.changes).
+        Изменения последних CHANGES_SAFETY_OVERLAP_SECONDS могут возвращаться
+        повторно: клиент применяет их по id.
+        """
+        since = parse_since(request.query_params.get("since"))
+        fields = requested_fields(request.query_params, self.serializer_class)
+        return Response(get_changes(since, self.serializer_class, fields))
+
+    @action(detail=False, methods=["get"])
+    @conditional_on_catalog_version
+    def export(self, request):
+        """
+        Выгрузка каталога: GET /boilers/export/?output=jsonl|csv[&фильтры /boilers/]
 
+        Все поля карточки товара (или ?fields=) для котлов, отобранных фильтрами
+        и отсортированных как в списке. Ответ передается потоком по мере чтения
+        из БД (products.export). Параметр ?format= зарезервирован DRF, поэтому
+        формат выгрузки задается параметром output (по умолчанию jsonl).
+        """
+        params = request.query_params
+        output = parse_output(params)
+        fields = requested_fields(params, ElectricBoilerDetailSerializer)
+        qs = order_boilers(filter_boilers(ElectricBoiler.objects.all(), params), params)
+        parts = export_rows(qs, ElectricBoilerDetailSerializer, output, fields)
+        if isinstance(request._request, ASGIRequest):
+            parts = aiter_sync(parts)
+
+        content_type, extension = EXPORT_FORMATS[output]
+        response = StreamingHttpResponse(
+            parts, content_type=f"{content_type}; charset=utf-8"
+        )
+        version = request_catalog_version(request).tag
+        response["Content-Disposition"] = (
+            f'attachment; filename="boilers-{version}.{extension}"'
+        )
+        return response
+
+    @conditional_on_catalog_version
+    @cached_json_response
     def retrieve(self, request, pk=None):
+        fields = requested_fields(request.query_params, ElectricBoilerDetailSerializer)
+        qs = project(ElectricBoiler.objects.all(), ElectricBoilerDetailSerializer, fields)
         try:
-            boiler = ElectricBoiler.objects.get(pk=pk)
+            boiler = qs.get(pk=pk)
         except ElectricBoiler.DoesNotExist:
             return Response(
                 {"detail": "Товар не найден"},
                 status=status.HTTP_404_NOT_FOUND,
             )
-        serializer = ElectricBoilerDetailSerializer(boiler)
+        serializer = ElectricBoilerDetailSerializer(boiler, fields=fields)
         return Response(serializer.data)
 
 
-class LoginView(viewsets.ViewSet):
+def catalog_events_unavailable(request):
+    """Причина, по которой поток событий недоступен (None - доступен)"""
+    if not isinstance(request, ASGIRequest):
+        return "События доступны только при запуске через ASGI"
+    if not event_broker.available:
+        return "События отключены: кэш событий не поддерживает атомарный incr"
+    return None
+
+
+def catalog_events_status(request):
+    """
+    Доступность потока событий: GET /boilers/events/status/
+
+    Клиент открывает EventSource на /boilers/events/, только если
+    {"available": true}, иначе опрашивает API по таймеру.
+    """
+    detail = catalog_events_unavailable(request)
+    data = {"available": detail is None}
+    if detail:
+        data["detail"] = detail
+    return JsonResponse(data)
+
+
+async def catalog_events(request):
+    """
+    Поток событий изменения каталога: GET /boilers/events/ (server-sent events)
+
+    После записи котлов парсером, reparse_boilers или в админке клиент
+    получает событие
+        id: N
+        event: catalog
+        data: {"version": "...", "changed": [id, ...], "deleted": [id, ...]}
+    и запрашивает изменившиеся данные (например, /boilers/changes/).
+    При переподключении EventSource присылает Last-Event-ID и получает
+    пропущенные события (products.events).
+
+    Поток держит соединение открытым, поэтому доступен только при запуске
+    через ASGI (uvicorn / daphne electric_boiler.asgi:application); под WSGI
+    возвращается 503. Так же (503) поток отключен, если кэш событий
+    не поддерживает атомарный incr (FileBasedCache, DatabaseCache).
+    Клиент проверяет доступность заранее (/boilers/events/status/).
+    """
+    detail = catalog_events_unavailable(request)
+    if detail:
+        return JsonResponse({"detail": detail}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+    poll_interval = settings.CATALOG_EVENTS["POLL_INTERVAL"]
+    keepalive = settings.CATALOG_EVENTS["KEEPALIVE"]
+    try:
+        last_id = int(request.headers.get("Last-Event-ID", ""))
+    except ValueError:
+        last_id = await sync_to_async(event_broker.last_id, thread_sensitive=False)()
+
+    async def stream():
+        nonlocal last_id
+        yield f"retry: {CATALOG_EVENTS_RETRY_MS}\n\n"
+        idle = 0.0
+        while True:
+            events = await sync_to_async(event_broker.read, thread_sensitive=False)(
+                last_id
+            )
+            for event_id, data in events:
+                last_id = event_id
+                yield f"id: {event_id}\nevent: catalog\ndata: {json.dumps(data)}\n\n"
+            if events:
+                idle = 0.0
+            elif idle >= keepalive:
+                idle = 0.0
+                yield ": keepalive\n\n"
+            await asyncio.sleep(poll_interval)
+            idle += poll_interval
+
+    response = StreamingHttpResponse(stream(), content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    # Отключение буферизации ответа в nginx
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def catalog_snapshot(request, path):
+    """
+    Файл снимка каталога: GET /snapshots/<путь> (products.snapshots)
+
+    Отдает готовую сжатую копию (.br или .gz) по Accept-Encoding. Файлы
+    версий неизменяемы и кэшируются браузером и CDN на год; current.json
+    (указатель на текущую версию) перепроверяется при каждом запросе.
+    В production эти файлы лучше отдавать веб-сервером напрямую.
+    """
+    try:
+        file_path = Path(safe_join(snapshots_root(), path))
+    except SuspiciousFileOperation:
+        raise Http404
+    if file_path.suffix != ".json" or not file_path.is_file():
+        raise Http404
+
+    accepted = accepted_encodings(request)
+    encoding = None
+    for suffix, name in SNAPSHOT_ENCODINGS.items():
+        compressed = file_path.with_name(file_path.name + suffix)
+        if name in accepted and compressed.is_file():
+            file_path, encoding = compressed, name
+            break
+
+    response = FileResponse(file_path.open("rb"), content_type="application/json")
+    if encoding:
+        response["Content-Encoding"] = encoding
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if path == SNAPSHOT_CURRENT_FILE:
+        patch_cache_control(response, no_cache=True)
+    else:
+        patch_cache_control(response, public=True, max_age=31536000, immutable=True)
+    return response
+
+
+def _metrics_token_valid(request) -> bool:
+    """Заголовок X-Metrics-Token совпадает с REQUEST_METRICS["TOKEN"]"""
+    token = settings.REQUEST_METRICS["TOKEN"]
+    sent = request.headers.get("X-Metrics-Token", "")
+    return bool(token) and hmac.compare_digest(sent.encode(), token.encode())
+
+
+@require_http_methods(["GET", "POST"])
+def request_metrics(request):
+    """
+    Метрики запросов к API: GET /metrics/ (products.metrics)
+
+    Гистограммы времени обработки, запросов к БД, сериализации и размера
+    ответа по endpoint для текущего процесса сервера. Доступно сотрудникам
+    (is_staff, сессия админки) и по заголовку X-Metrics-Token со значением
+    REQUEST_METRICS["TOKEN"] (для сборщика метрик). POST /metrics/ - только
+    для сотрудников - отдает накопленные значения и очищает их.
+    """
+    is_staff = request.user.is_authenticated and request.user.is_staff
+    if request.method == "POST":
+        if not is_staff:
+            raise Http404
+    elif not (is_staff or _metrics_token_valid(request)):
+        raise Http404
+    response = JsonResponse(metrics_registry.snapshot(), json_dumps_params={"indent": 2})
+    if request.method == "POST":
+        metrics_registry.reset()
+    patch_cache_control(response, no_store=True)
+    return response
+
+
+class LoginView(InstrumentedViewMixin, viewsets.ViewSet):
     """
     ViewSet для аутентификации пользователей (логин)
 
@@ -144,7 +486,7 @@ class LoginView(viewsets.ViewSet):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class RegisterView(viewsets.ViewSet):
+class RegisterView(InstrumentedViewMixin, viewsets.ViewSet):
     """
     ViewSet для регистрации новых пользователей
 
@@ -188,7 +530,7 @@ class RegisterView(viewsets.ViewSet):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
-class UserView(viewsets.ViewSet):
+class UserView(InstrumentedViewMixin, viewsets.ViewSet):
     """
     ViewSet для получения списка пользователей
 
@@ -217,7 +559,7 @@ class UserView(viewsets.ViewSet):
         return Response(serializer.data)
 
 
-class CurrentUserView(viewsets.ViewSet):
+class CurrentUserView(InstrumentedViewMixin, viewsets.ViewSet):
     """
     ViewSet для работы с текущим авторизованным пользователем
 
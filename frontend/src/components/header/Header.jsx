@@ -34,6 +34,9 @@ import { getCartCount } from '../../utils/cart';
 import { getFavoritesCount } from '../../utils/favorites';
 import { getAvatarUrl } from '../../utils/avatar';
 
+/** Задержка запроса подсказок после ввода в строку поиска (мс) */
+const SEARCH_SUGGEST_DELAY_MS = 150;
+
 export default function Header(props) {
     const { children } = props;
     const navigate = useNavigate();
@@ -208,37 +211,34 @@ export default function Header(props) {
 
     const scrollToTop = () => window.scrollTo(0, 0);
 
-    // Загрузка товаров для поиска при первом вводе
-    const [allProducts, setAllProducts] = useState([]);
-    const [productsFetched, setProductsFetched] = useState(false);
-
-    const fetchProductsForSearch = () => {
-        if (productsFetched) return;
-        setSearchLoading(true);
-        api.get('boilers/')
-            .then((res) => {
-                setAllProducts(Array.isArray(res.data) ? res.data : []);
-                setProductsFetched(true);
-            })
-            .catch(() => setAllProducts([]))
-            .finally(() => setSearchLoading(false));
-    };
-
-    // Фильтрация товаров по названию при вводе, показ модального окна
+    // Подсказки поиска с сервера (GET boilers/suggest/?q=) с задержкой после ввода
     useEffect(() => {
-        const query = (searchQuery || '').trim().toLowerCase();
+        const query = (searchQuery || '').trim();
         if (!query) {
             setSearchProducts([]);
             setSearchModalOpen(false);
-            return;
+            return undefined;
         }
-        fetchProductsForSearch();
-        const matches = allProducts.filter((p) =>
-            (p.name || '').toLowerCase().includes(query),
-        );
-        setSearchProducts(matches);
         setSearchModalOpen(true);
-    }, [searchQuery, allProducts]);
+        setSearchLoading(true);
+        let cancelled = false;
+        const timeoutId = setTimeout(() => {
+            api.get('boilers/suggest/', { params: { q: query } })
+                .then((res) => {
+                    if (!cancelled) setSearchProducts(Array.isArray(res.data) ? res.data : []);
+                })
+                .catch(() => {
+                    if (!cancelled) setSearchProducts([]);
+                })
+                .finally(() => {
+                    if (!cancelled) setSearchLoading(false);
+                });
+        }, SEARCH_SUGGEST_DELAY_MS);
+        return () => {
+            cancelled = true;
+            clearTimeout(timeoutId);
+        };
+    }, [searchQuery]);
 
     const handleSearchProductClick = (product) => {
         navigate(ROUTES.productById(product.id));
@@ -314,7 +314,6 @@ export default function Header(props) {
                                 className="search-input"
                                 value={searchQuery}
                                 onChange={(e) => setSearchQuery(e.target.value)}
-                                onFocus={fetchProductsForSearch}
                                 aria-label="Поиск товаров"
                             />
                             <button
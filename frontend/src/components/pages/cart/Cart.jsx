@@ -6,7 +6,7 @@ import { Link } from "react-router-dom";
 import IconButton from "@mui/material/IconButton";
 import DeleteIcon from "@mui/icons-material/Delete";
 import FavoriteBorderIcon from "@mui/icons-material/FavoriteBorder";
-import { getCart, removeFromCart, updateQuantity } from "../../../utils/cart";
+import { getCart, refreshCart, removeFromCart, updateQuantity } from "../../../utils/cart";
 import { addToFavoritesIfAuth } from "../../../utils/favorites";
 import { API_BASE_URL } from "../../../config/api";
 import { ROUTES, AUTH_REQUIRED_FAVORITES } from "../../../config/constants";
@@ -32,6 +32,7 @@ const Cart = () => {
 
   useEffect(() => {
     refresh();
+    refreshCart();
     const handler = () => refresh();
     window.addEventListener("cart-updated", handler);
     return () => window.removeEventListener("cart-updated", handler);
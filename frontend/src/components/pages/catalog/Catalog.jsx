@@ -1,10 +1,18 @@
-import { useEffect, useState, useCallback, useMemo } from "react";
+import { useEffect, useState, useCallback, useRef } from "react";
 import { useSearchParams } from "react-router-dom";
 import Card from "../../card/Card";
 import api from "../../../services/api";
+import { API_BASE_URL } from "../../../config/api";
 import "./Catalog.css";
 
-/** Интервал опроса API для обновления списка при изменении данных в БД (мс) */
+/**
+ * Поток событий изменения каталога (SSE): открывается, только если сервер
+ * сообщает о его доступности (запуск через ASGI и кэш событий с атомарным incr)
+ */
+const CATALOG_EVENTS_STATUS_PATH = "boilers/events/status/";
+const CATALOG_EVENTS_URL = `${API_BASE_URL.replace(/\/$/, "")}/boilers/events/`;
+
+/** Интервал опроса API, если поток событий недоступен (мс) */
 const REFRESH_INTERVAL_MS = 45000;
 
 /** 5 рядов × 4 карточки в ряд = 20 карточек на странице */
@@ -12,12 +20,6 @@ const ROWS_PER_PAGE = 5;
 const COLS_PER_ROW = 4;
 const CARDS_PER_PAGE = ROWS_PER_PAGE * COLS_PER_ROW;
 
-/** Производитель в БД — третье слово в названии (как в API /manufacturers/) */
-function getManufacturerSlug(name) {
-  const words = (name || "").trim().split(/\s+/);
-  return words.length >= 3 ? words[2].toLowerCase() : "";
-}
-
 const Catalog = () => {
   const [searchParams] = useSearchParams();
   const manufacturerSlug = (searchParams.get("manufacturer") || "")
@@ -26,38 +28,34 @@ const Catalog = () => {
   const searchQuery = (searchParams.get("search") || "").trim().toLowerCase();
 
   const [products, setProducts] = useState([]);
+  const [totalCount, setTotalCount] = useState(0);
   const [loading, setLoading] = useState(true);
   const [currentPage, setCurrentPage] = useState(1);
 
-  const filteredProducts = useMemo(() => {
-    let result = products;
-    if (manufacturerSlug) {
-      result = result.filter(
-        (p) => getManufacturerSlug(p.name) === manufacturerSlug,
-      );
-    }
-    if (searchQuery) {
-      result = result.filter((p) => {
-        const name = (p.name || "").toLowerCase();
-        const power = (p.power || "").toLowerCase();
-        return (
-          name.includes(searchQuery) ||
-          power.includes(searchQuery)
-        );
-      });
-    }
-    return result;
-  }, [products, manufacturerSlug, searchQuery]);
-
+  /** Фильтрация и разбиение на страницы выполняются на сервере */
   const fetchProducts = useCallback(() => {
+    const params = { page: currentPage, page_size: CARDS_PER_PAGE };
+    if (manufacturerSlug) params.manufacturer = manufacturerSlug;
+    // При поиске - ранжированные результаты полнотекстового поиска
+    if (searchQuery) params.q = searchQuery;
     api
-      .get("boilers/")
+      .get(searchQuery ? "boilers/search/" : "boilers/", { params })
       .then((res) => {
-        setProducts(Array.isArray(res.data) ? res.data : []);
+        const results = res.data?.results;
+        setProducts(Array.isArray(results) ? results : []);
+        setTotalCount(res.data?.count || 0);
+      })
+      .catch((err) => {
+        // Страница вышла за пределы списка (например, после обновления БД)
+        if (err.response?.status === 404 && currentPage > 1) {
+          setCurrentPage(1);
+          return;
+        }
+        setProducts([]);
+        setTotalCount(0);
       })
-      .catch(() => setProducts([]))
       .finally(() => setLoading(false));
-  }, []);
+  }, [currentPage, manufacturerSlug, searchQuery]);
 
   useEffect(() => {
     fetchProducts();
@@ -67,36 +65,53 @@ const Catalog = () => {
     setCurrentPage(1);
   }, [manufacturerSlug, searchQuery]);
 
+  const totalPages = Math.max(1, Math.ceil(totalCount / CARDS_PER_PAGE));
+
+  const fetchProductsRef = useRef(fetchProducts);
   useEffect(() => {
-    setCurrentPage((p) => {
-      const totalPages = Math.max(
-        1,
-        Math.ceil(filteredProducts.length / CARDS_PER_PAGE),
-      );
-      return p > totalPages ? totalPages : p;
-    });
-  }, [filteredProducts.length]);
-
-  const totalPages = Math.max(
-    1,
-    Math.ceil(filteredProducts.length / CARDS_PER_PAGE),
-  );
-  const startIndex = (currentPage - 1) * CARDS_PER_PAGE;
-  const paginatedProducts = filteredProducts.slice(
-    startIndex,
-    startIndex + CARDS_PER_PAGE,
-  );
+    fetchProductsRef.current = fetchProducts;
+  }, [fetchProducts]);
 
+  /** Обновление списка по событиям сервера, без них - опрос по таймеру */
   useEffect(() => {
-    const intervalId = setInterval(() => {
+    const refresh = () => fetchProductsRef.current();
+    let intervalId = null;
+    const startPolling = () => {
+      if (intervalId === null) {
+        intervalId = setInterval(refresh, REFRESH_INTERVAL_MS);
+      }
+    };
+
+    let source = null;
+    let cancelled = false;
+    const openEvents = () => {
+      source = new EventSource(CATALOG_EVENTS_URL);
+      source.addEventListener("catalog", refresh);
+      source.onerror = () => {
+        // Соединение закрыто окончательно (например, сервер перезапущен через WSGI)
+        if (source.readyState === EventSource.CLOSED) startPolling();
+      };
+    };
+
+    if (typeof EventSource === "undefined") {
+      startPolling();
+    } else {
       api
-        .get("boilers/")
+        .get(CATALOG_EVENTS_STATUS_PATH)
         .then((res) => {
-          setProducts(Array.isArray(res.data) ? res.data : []);
+          if (cancelled) return;
+          if (res.data?.available) openEvents();
+          else startPolling();
         })
-        .catch(() => setProducts([]));
-    }, REFRESH_INTERVAL_MS);
-    return () => clearInterval(intervalId);
+        .catch(() => {
+          if (!cancelled) startPolling();
+        });
+    }
+    return () => {
+      cancelled = true;
+      if (source) source.close();
+      if (intervalId !== null) clearInterval(intervalId);
+    };
   }, []);
 
   useEffect(() => {
@@ -161,7 +176,7 @@ const Catalog = () => {
                   </p>
                 )}
                 <div className="catalog-cards catalog-cards-4">
-                  {paginatedProducts.map((product) => (
+                  {products.map((product) => (
                     <Card key={product.id} product={product} />
                   ))}
                 </div>
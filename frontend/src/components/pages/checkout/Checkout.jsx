@@ -6,7 +6,7 @@ import { useState, useEffect } from "react";
 import { Link } from "react-router-dom";
 import TextField from "@mui/material/TextField";
 import Button from "@mui/material/Button";
-import { getCart } from "../../../utils/cart";
+import { getCart, refreshCart } from "../../../utils/cart";
 import { parsePrice, formatPrice } from "../../../utils/price";
 import { ROUTES, PHONE_REGEX, PHONE_ERROR, STORAGE_KEYS } from "../../../config/constants";
 import api from "../../../services/api";
@@ -24,6 +24,7 @@ const Checkout = () => {
   useEffect(() => {
     const refresh = () => setItems(getCart());
     refresh();
+    refreshCart();
     window.addEventListener("cart-updated", refresh);
     return () => window.removeEventListener("cart-updated", refresh);
   }, []);
@@ -7,6 +7,7 @@ import IconButton from "@mui/material/IconButton";
 import DeleteIcon from "@mui/icons-material/Delete";
 import {
   getFavorites,
+  refreshFavorites,
   removeFromFavorites,
 } from "../../../utils/favorites";
 import { API_BASE_URL } from "../../../config/api";
@@ -34,6 +35,7 @@ const Favorites = () => {
 
   useEffect(() => {
     refresh();
+    refreshFavorites();
     const handler = () => refresh();
     window.addEventListener("favorites-updated", handler);
     return () => window.removeEventListener("favorites-updated", handler);
@@ -0,0 +1,50 @@
+/**
+ * Запросы данных котлов для корзины и избранного
+ */
+
+import api from "./api";
+
+/** Поля, которые корзина и избранное хранят в localStorage */
+export const STORED_ITEM_FIELDS = ["name", "price", "image_1", "product_url"];
+
+/**
+ * Загружает актуальные данные нескольких котлов одним запросом
+ * @param {number[]} ids
+ * @returns {Promise<{results: object[], missing: number[]}>}
+ */
+export async function fetchBoilersBatch(ids, fields = STORED_ITEM_FIELDS) {
+  const res = await api.get("boilers/batch/", {
+    params: { ids: ids.join(","), fields: fields.join(",") },
+  });
+  return res.data;
+}
+
+/**
+ * Обновляет сохраненные товары данными каталога
+ * Товары, которых больше нет в каталоге, удаляются.
+ * @returns {{items: object[], changed: boolean}}
+ */
+export function applyBoilersBatch(items, { results, missing }) {
+  const fresh = new Map(results.map((p) => [p.id, p]));
+  const removed = new Set(missing);
+  let changed = false;
+  const updated = [];
+  for (const item of items) {
+    if (removed.has(item.id)) {
+      changed = true;
+      continue;
+    }
+    const product = fresh.get(item.id);
+    if (product && STORED_ITEM_FIELDS.some((f) => item[f] !== product[f])) {
+      const next = { ...item };
+      STORED_ITEM_FIELDS.forEach((f) => {
+        next[f] = product[f];
+      });
+      updated.push(next);
+      changed = true;
+    } else {
+      updated.push(item);
+    }
+  }
+  return { items: updated, changed };
+}
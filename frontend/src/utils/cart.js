@@ -2,6 +2,7 @@
  * Утилиты для работы с корзиной (localStorage)
  * Корзина привязана к user_id — у каждого пользователя своя корзина.
  */
+import { applyBoilersBatch, fetchBoilersBatch } from "../services/boilers";
 import { STORAGE_KEYS, AUTH_REQUIRED_PURCHASE } from "../config/constants";
 
 const CART_KEY_PREFIX = "turiki_cart_";
@@ -103,3 +104,20 @@ export function clearCart() {
 export function getCartCount() {
   return getCart().reduce((sum, i) => sum + (i.quantity || 1), 0);
 }
+
+/**
+ * Обновляет название, цену и изображения товаров корзины по каталогу
+ * (один запрос boilers/batch/). Товары, удаленные из каталога, убираются.
+ */
+export async function refreshCart() {
+  const ids = getCart().map((i) => i.id);
+  if (ids.length === 0) return;
+  try {
+    const data = await fetchBoilersBatch(ids);
+    // Список мог измениться, пока выполнялся запрос
+    const { items, changed } = applyBoilersBatch(getCart(), data);
+    if (changed) setCart(items);
+  } catch (e) {
+    console.warn("refreshCart error:", e);
+  }
+}
@@ -2,6 +2,7 @@
  * Утилиты для работы с избранным (localStorage)
  * Избранное привязано к user_id — у каждого пользователя свой список.
  */
+import { applyBoilersBatch, fetchBoilersBatch } from "../services/boilers";
 import { STORAGE_KEYS } from "../config/constants";
 
 const FAVORITES_KEY_PREFIX = "turiki_favorites_";
@@ -92,3 +93,20 @@ export function removeFromFavorites(productId) {
 export function getFavoritesCount() {
   return getFavorites().length;
 }
+
+/**
+ * Обновляет название, цену и изображения товаров избранного по каталогу
+ * (один запрос boilers/batch/). Товары, удаленные из каталога, убираются.
+ */
+export async function refreshFavorites() {
+  const ids = getFavorites().map((i) => i.id);
+  if (ids.length === 0) return;
+  try {
+    const data = await fetchBoilersBatch(ids);
+    // Список мог измениться, пока выполнялся запрос
+    const { items, changed } = applyBoilersBatch(getFavorites(), data);
+    if (changed) setFavorites(items);
+  } catch (e) {
+    console.warn("refreshFavorites error:", e);
+  }
+}